@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.api_v1.endpoints import auth, users, teams, events, submissions, evaluations
+from app.api.api_v1.endpoints import auth, users, teams, events, submissions, evaluations, stream, metrics, search, batch
 
 api_router = APIRouter()
 
@@ -8,4 +8,8 @@ api_router.include_router(users.router, prefix="/users", tags=["Users"])
 api_router.include_router(teams.router, prefix="/teams", tags=["Teams"])
 api_router.include_router(events.router, prefix="/events", tags=["Events"])
 api_router.include_router(submissions.router, prefix="/submissions", tags=["Submissions"])
-api_router.include_router(evaluations.router, prefix="/evaluations", tags=["Evaluations"])
\ No newline at end of file
+api_router.include_router(evaluations.router, prefix="/evaluations", tags=["Evaluations"])
+api_router.include_router(search.router, prefix="/search", tags=["Search"])
+api_router.include_router(batch.router, prefix="/batch", tags=["Batch"])
+api_router.include_router(stream.router, prefix="/stream", tags=["Live Updates"])
+api_router.include_router(metrics.router, prefix="/metrics", tags=["Metrics"])
\ No newline at end of file
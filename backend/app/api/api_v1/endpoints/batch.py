@@ -0,0 +1,155 @@
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.encoders import jsonable_encoder
+from starlette.types import Message
+import asyncio
+import json
+
+from app.core.config import settings
+from app.core.deps import BATCH_PRINCIPAL, get_batch_user
+from app.models.user import AppUser
+from app.schemas.batch import BatchRequest, BatchResponse, BatchSubRequest, BatchSubResponse
+
+router = APIRouter()
+
+# Routes a sub-request may not target: nested batches, and streams that never end
+EXCLUDED_PREFIXES = ("/batch", "/stream")
+
+# Sub-request headers the batch controls itself; sub-responses are always
+# uncompressed JSON, and the batch response as a whole is negotiated instead
+RESERVED_HEADERS = {"accept", "accept-encoding", "authorization", "content-length", "host"}
+
+
+def error_response(sub: BatchSubRequest, status_code: int, detail: str) -> BatchSubResponse:
+    return BatchSubResponse(id=sub.id, status=status_code, body={"detail": detail})
+
+
+async def dispatch(request: Request, sub: BatchSubRequest, state: dict) -> BatchSubResponse:
+    """Run one sub-request through the application and capture its response.
+
+    The sub-request goes through the whole ASGI stack (middleware, routing,
+    dependencies, exception handlers), exactly as if it had been sent on its
+    own with the batch's credentials.
+    """
+    path, _, query = sub.path.partition("?")
+    if path.startswith(settings.API_V1_STR):
+        path = path[len(settings.API_V1_STR):]
+    if not path.startswith("/") or path.startswith(EXCLUDED_PREFIXES):
+        return error_response(sub, status.HTTP_400_BAD_REQUEST, f"Path not allowed in a batch: {sub.path}")
+
+    body = b"" if sub.body is None else json.dumps(jsonable_encoder(sub.body)).encode()
+    headers = [
+        (name.lower().encode("latin-1"), value.encode("latin-1"))
+        for name, value in sub.headers.items()
+        if name.lower() not in RESERVED_HEADERS
+    ]
+    headers.append((b"authorization", request.headers["authorization"].encode("latin-1")))
+    if body:
+        headers.append((b"content-length", str(len(body)).encode()))
+        if "content-type" not in (name.lower() for name in sub.headers):
+            headers.append((b"content-type", b"application/json"))
+
+    full_path = settings.API_V1_STR + path
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": sub.method,
+        "scheme": request.url.scheme,
+        "path": full_path,
+        "raw_path": full_path.encode(),
+        "root_path": "",
+        "query_string": query.encode(),
+        "headers": headers,
+        "client": request.scope.get("client"),
+        "server": request.scope.get("server"),
+        "state": dict(state),
+    }
+
+    received = False
+
+    async def receive() -> Message:
+        nonlocal received
+        if not received:
+            received = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        # Nothing more to read; park like a client that stays connected
+        # until the sub-request finishes and this task is cancelled
+        await asyncio.Event().wait()
+        return {"type": "http.disconnect"}
+
+    started: Dict[str, Any] = {}
+    chunks: List[bytes] = []
+
+    async def send(message: dict):
+        if message["type"] == "http.response.start":
+            started["status"] = message["status"]
+            started["headers"] = message.get("headers", [])
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        await request.app(scope, receive, send)
+    except Exception:
+        # Already answered by the app's exception handlers when a response started
+        if "status" not in started:
+            return error_response(sub, status.HTTP_500_INTERNAL_SERVER_ERROR, "Internal server error")
+
+    response_headers = {
+        name.decode("latin-1"): value.decode("latin-1")
+        for name, value in started["headers"]
+        if name.lower() != b"content-length"
+    }
+    content = b"".join(chunks)
+    payload: Optional[Any] = None
+    if content:
+        if response_headers.get("content-type", "").startswith("application/json"):
+            payload = json.loads(content)
+        else:
+            payload = content.decode("utf-8", errors="replace")
+
+    return BatchSubResponse(id=sub.id, status=started["status"], headers=response_headers, body=payload)
+
+
+@router.post("/", response_model=BatchResponse)
+async def run_batch(
+    batch: BatchRequest,
+    request: Request,
+    current_user: AppUser = Depends(get_batch_user)
+):
+    """Run several API calls in one round trip.
+
+    Sub-requests run concurrently (at most BATCH_MAX_CONCURRENCY at a time)
+    and responses come back in request order. The caller is authenticated
+    once; read-only sub-requests reuse that principal instead of looking the
+    user up again, while writes authenticate on their own so they never share
+    ORM state with other sub-requests. Every sub-request has its own DB
+    session: a session cannot run statements concurrently. Sub-requests
+    still running after BATCH_TIMEOUT_SECONDS are cancelled and reported
+    as 504.
+    """
+    token = request.headers["authorization"].partition(" ")[2]
+    shared_state = {BATCH_PRINCIPAL: (token, current_user)}
+    semaphore = asyncio.Semaphore(settings.BATCH_MAX_CONCURRENCY)
+
+    async def run(sub: BatchSubRequest) -> BatchSubResponse:
+        async with semaphore:
+            return await dispatch(request, sub, shared_state if sub.method == "GET" else {})
+
+    tasks = [asyncio.create_task(run(sub)) for sub in batch.requests]
+    _, pending = await asyncio.wait(tasks, timeout=settings.BATCH_TIMEOUT_SECONDS)
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    responses = []
+    for sub, task in zip(batch.requests, tasks):
+        if task in pending:
+            responses.append(error_response(
+                sub, status.HTTP_504_GATEWAY_TIMEOUT, "Batch deadline exceeded"
+            ))
+        else:
+            responses.append(task.result())
+
+    return BatchResponse(responses=responses)
@@ -1,14 +1,24 @@
 from typing import List
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, select
 from uuid import UUID
 
+from app.core.conditional import conditional_response
 from app.core.database import get_db
+from app.core.loader import Loaders, get_loaders
+from app.core.fields import FieldSelection, sparse_fields, project, fetch_fields
 from app.core.deps import get_current_active_user, require_judge
-from app.schemas.evaluation import Evaluation, EvaluationCreate
+from app.schemas.evaluation import (
+    Evaluation, EvaluationCreate, EvaluationBatchCreate, EvaluationBatchResult,
+    EvaluationNextRequest, EvaluationTask, EvaluationWithDetails
+)
 from app.models.evaluation import Evaluation as EvaluationModel
+from app.models.event import CompetitiveEvent
+from app.models.submission import Submission as SubmissionModel
+from app.models.team import Team
 from app.models.user import AppUser
+from app.services.evaluation_service import EvaluationService
 
 router = APIRouter()
 
@@ -19,39 +29,173 @@ async def create_evaluation(
     db: AsyncSession = Depends(get_db),
     current_user: AppUser = Depends(require_judge)
 ):
-    """Create a new evaluation (judge only)."""
-    evaluation = EvaluationModel(
-        submission_id=evaluation_data.submission_id,
-        judge_id=current_user.user_id,
-        score=evaluation_data.score,
-        comments=evaluation_data.comments
+    """Create a new evaluation (judge only, 409 if already scored)."""
+    evaluation, _ = await EvaluationService.upsert_evaluation(
+        db, current_user, evaluation_data, overwrite=False
     )
     
-    db.add(evaluation)
-    await db.commit()
-    await db.refresh(evaluation)
+    return Evaluation.model_validate(evaluation)
+
+
+@router.put("/", response_model=Evaluation)
+async def upsert_evaluation(
+    evaluation_data: EvaluationCreate,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    current_user: AppUser = Depends(require_judge)
+):
+    """Score or re-score a submission (judge only, 201 if newly created)."""
+    evaluation, created = await EvaluationService.upsert_evaluation(
+        db, current_user, evaluation_data
+    )
+    if created:
+        response.status_code = status.HTTP_201_CREATED
     
     return Evaluation.model_validate(evaluation)
 
 
+@router.post("/batch", response_model=EvaluationBatchResult)
+async def batch_upsert_evaluations(
+    batch_data: EvaluationBatchCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: AppUser = Depends(require_judge)
+):
+    """Score or re-score many submissions at once (judge only)."""
+    return await EvaluationService.batch_upsert(db, current_user, batch_data.items)
+
+
+@router.post(
+    "/next",
+    response_model=EvaluationTask,
+    responses={204: {"description": "Nothing left for this judge to review"}}
+)
+async def next_evaluation(
+    next_data: EvaluationNextRequest = EvaluationNextRequest(),
+    db: AsyncSession = Depends(get_db),
+    current_user: AppUser = Depends(require_judge)
+):
+    """Lease the next submission to review from the work queue (judge only)."""
+    task = await EvaluationService.next_submission(db, current_user, next_data.event_id)
+    if task is None:
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+    
+    return task
+
+
 @router.get("/", response_model=List[Evaluation])
 async def get_evaluations(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     submission_id: UUID = Query(None),
+    fields: FieldSelection = Depends(sparse_fields(Evaluation)),
     db: AsyncSession = Depends(get_db),
     current_user: AppUser = Depends(get_current_active_user)
 ):
-    """Get list of evaluations."""
-    stmt = select(EvaluationModel).where(
-        EvaluationModel.deleted_at.is_(None)
+    """Get list of evaluations, optionally only the given ``fields``."""
+    criteria: List[ColumnElement[bool]] = [EvaluationModel.deleted_at.is_(None)]
+    
+    if submission_id:
+        criteria.append(EvaluationModel.submission_id == submission_id)
+    
+    async def respond():
+        if fields is not None:
+            stmt = project(EvaluationModel, fields).where(*criteria).order_by(
+                EvaluationModel.evaluation_id
+            ).offset(skip).limit(limit)
+            return await fetch_fields(db, stmt)
+        
+        stmt = select(EvaluationModel).where(*criteria).order_by(
+            EvaluationModel.evaluation_id
+        ).offset(skip).limit(limit)
+        result = await db.execute(stmt)
+        evaluations = result.scalars().all()
+        
+        return [Evaluation.model_validate(evaluation) for evaluation in evaluations]
+    
+    return await conditional_response(
+        request, db,
+        sources=[(EvaluationModel, criteria)],
+        key_parts=("evaluations", skip, limit, fields),
+        respond=respond,
+        entities=("evaluation",)
     )
+
+
+def detail_sources(criteria: list) -> list:
+    """Validator sources for evaluations plus the judges, submissions, teams and events they name."""
+    matching = select(EvaluationModel).where(*criteria).subquery()
+    submissions = select(SubmissionModel).where(
+        SubmissionModel.submission_id.in_(select(matching.c.submission_id))
+    ).subquery()
+    return [
+        (EvaluationModel, criteria),
+        (AppUser, [AppUser.user_id.in_(select(matching.c.judge_id))]),
+        (SubmissionModel, [SubmissionModel.submission_id.in_(select(matching.c.submission_id))]),
+        (Team, [Team.team_id.in_(select(submissions.c.team_id))]),
+        (CompetitiveEvent, [CompetitiveEvent.event_id.in_(select(submissions.c.event_id))]),
+    ]
+
+
+@router.get("/details", response_model=List[EvaluationWithDetails])
+async def get_evaluations_with_details(
+    request: Request,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=100),
+    submission_id: UUID = Query(None),
+    db: AsyncSession = Depends(get_db),
+    loaders: Loaders = Depends(get_loaders),
+    current_user: AppUser = Depends(get_current_active_user)
+):
+    """Get list of evaluations with judge names and submission team and event.
+    
+    Related rows are batched across the page: one lookup per entity type,
+    not one per evaluation.
+    """
+    criteria: List[ColumnElement[bool]] = [EvaluationModel.deleted_at.is_(None)]
     
     if submission_id:
-        stmt = stmt.where(EvaluationModel.submission_id == submission_id)
+        criteria.append(EvaluationModel.submission_id == submission_id)
+    
+    async def respond():
+        stmt = select(EvaluationModel).where(*criteria).order_by(
+            EvaluationModel.evaluation_id
+        ).offset(skip).limit(limit)
+        evaluations = (await db.execute(stmt)).scalars().all()
+        return await EvaluationService.list_with_details(loaders, evaluations)
+    
+    return await conditional_response(
+        request, db,
+        sources=detail_sources(criteria),
+        key_parts=("evaluations", "details", skip, limit),
+        respond=respond,
+        entities=("evaluation", "user", "submission", "team", "event")
+    )
+
+
+@router.get("/{evaluation_id}", response_model=EvaluationWithDetails)
+async def get_evaluation(
+    evaluation_id: UUID,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    loaders: Loaders = Depends(get_loaders),
+    current_user: AppUser = Depends(get_current_active_user)
+):
+    """Get evaluation by ID, with its judge's name and submission team and event."""
+    evaluation = await loaders.get(EvaluationModel).load(evaluation_id)
+    if evaluation is None or evaluation.deleted_at is not None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Evaluation not found"
+        )
     
-    stmt = stmt.offset(skip).limit(limit)
-    result = await db.execute(stmt)
-    evaluations = result.scalars().all()
+    async def respond():
+        return await EvaluationService.with_details(loaders, evaluation)
     
-    return [Evaluation.model_validate(evaluation) for evaluation in evaluations]
\ No newline at end of file
+    return await conditional_response(
+        request, db,
+        sources=detail_sources([EvaluationModel.evaluation_id == evaluation_id]),
+        key_parts=("evaluation", evaluation_id),
+        respond=respond,
+        entities=("evaluation", "user", "submission", "team", "event")
+    )
\ No newline at end of file
@@ -1,14 +1,29 @@
-from typing import List
-from fastapi import APIRouter, Depends, Query
+from typing import Any, List, Optional, Tuple, Union
+from datetime import datetime
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from uuid import UUID
 
+from app.core.cache import response_cache, ResponseCache
+from app.core.conditional import conditional_response
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.fields import FieldSelection, sparse_fields, project, fetch_fields, pick
+from app.core.lookup import requested_ids, any_id, lookup_result
+from app.core.query_cache import cached
+from app.core.singleflight import coalesce
 from app.core.deps import get_current_active_user, require_organizer
-from app.schemas.event import Event, EventCreate, EventUpdate
+from app.schemas.event import Event, EventCreate, EventUpdate, EventResults, DeclareWinnerRequest, EventStatus
+from app.schemas.evaluation import EvaluationRanking
+from app.schemas.lookup import LookupResult
+from app.schemas.assignment import JudgeAssignmentRequest, JudgeAssignmentResult
 from app.models.event import CompetitiveEvent
 from app.models.user import AppUser
+from app.services.event_lifecycle_service import EventLifecycleService
+from app.services.event_service import EventService
+from app.services.event_window_cache import EventWindowCache
+from app.services.assignment_service import AssignmentService
 
 router = APIRouter()
 
@@ -29,35 +44,155 @@ async def create_event(
     db.add(event)
     await db.commit()
     await db.refresh(event)
+    await response_cache.invalidate("event")
     
     return Event.model_validate(event)
 
 
-@router.get("/", response_model=List[Event])
+@router.get("/", response_model=Union[List[Event], LookupResult[Event]])
+@coalesce("events.list")
 async def get_events(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    event_status: Optional[EventStatus] = Query(None, alias="status"),
+    date_from: Optional[datetime] = Query(None, alias="from", description="Events ending at or after"),
+    date_to: Optional[datetime] = Query(None, alias="to", description="Events starting at or before"),
+    ids: Optional[List[UUID]] = Depends(requested_ids),
+    fields: FieldSelection = Depends(sparse_fields(Event)),
     db: AsyncSession = Depends(get_db),
     current_user: AppUser = Depends(get_current_active_user)
 ):
-    """Get list of events."""
-    stmt = select(CompetitiveEvent).where(
-        CompetitiveEvent.deleted_at.is_(None)
-    ).offset(skip).limit(limit)
+    """Get list of events ordered by start date, optionally filtered by status or date window.
     
-    result = await db.execute(stmt)
-    events = result.scalars().all()
+    ``fields`` limits each event to the given fields. With ``ids`` the listed
+    events are looked up in one query instead, and IDs without an active
+    event are reported as missing.
+    """
+    if ids is not None:
+        lookup_criteria = [any_id(CompetitiveEvent.event_id, ids), CompetitiveEvent.deleted_at.is_(None)]
+        
+        async def lookup():
+            stmt = select(CompetitiveEvent).where(*lookup_criteria)
+            events = (await db.execute(stmt)).scalars().all()
+            return lookup_result(
+                Event, ids, events,
+                key=lambda event: event.event_id,
+                build=Event.model_validate,
+                fields=fields
+            )
+        
+        return await conditional_response(
+            request, db,
+            sources=[(CompetitiveEvent, lookup_criteria)],
+            key_parts=("events", "ids", tuple(ids), fields),
+            respond=lookup,
+            entities=("event",)
+        )
+    
+    # One instant, one cache entry, however the client wrote it
+    date_from, date_to = EventService.as_utc(date_from), EventService.as_utc(date_to)
+    if date_from is not None and date_to is not None and date_to < date_from:
+        from fastapi import HTTPException, status
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="'to' must not be before 'from'"
+        )
+    
+    now = EventService.calendar_now() if event_status is not None else None
+    criteria = EventService.calendar_criteria(event_status, date_from, date_to, now)
+    scope = ResponseCache.scope(current_user)
+    # Unfiltered pages keep their plain key, which cache warm-up fills
+    filters: Tuple[Any, ...] = ()
+    if event_status is not None or date_from is not None or date_to is not None:
+        filters = (event_status, date_from, date_to, now)
+    if fields is not None:
+        filters += (fields,)
     
-    return [Event.model_validate(event) for event in events]
+    async def build():
+        if fields is not None:
+            stmt = project(CompetitiveEvent, fields).where(*criteria).order_by(
+                CompetitiveEvent.start_date, CompetitiveEvent.event_id
+            ).offset(skip).limit(limit)
+            return await fetch_fields(db, stmt)
+        
+        stmt = select(CompetitiveEvent).where(*criteria).order_by(
+            CompetitiveEvent.start_date, CompetitiveEvent.event_id
+        ).offset(skip).limit(limit)
+        
+        result = await db.execute(stmt)
+        events = result.scalars().all()
+        
+        return [Event.model_validate(event) for event in events]
+    
+    async def respond():
+        key = await response_cache.list_key("event", scope, skip, limit, *filters)
+        return await response_cache.cached_response(key, settings.CACHE_TTL_EVENT_LIST_SECONDS, build)
+    
+    return await conditional_response(
+        request, db,
+        sources=[(CompetitiveEvent, criteria)],
+        key_parts=("events", scope, skip, limit, *filters),
+        respond=respond,
+        entities=("event",)
+    )
 
 
 @router.get("/{event_id}", response_model=Event)
+@coalesce("events.detail")
 async def get_event(
     event_id: UUID,
+    request: Request,
+    fields: FieldSelection = Depends(sparse_fields(Event)),
     db: AsyncSession = Depends(get_db),
     current_user: AppUser = Depends(get_current_active_user)
 ):
-    """Get event by ID."""
+    """Get event by ID, optionally only the given ``fields``."""
+    criteria = [
+        CompetitiveEvent.event_id == event_id,
+        CompetitiveEvent.deleted_at.is_(None)
+    ]
+    scope = ResponseCache.scope(current_user)
+    
+    async def build():
+        stmt = select(CompetitiveEvent).where(*criteria)
+        result = await db.execute(cached(stmt))
+        event = result.scalar_one_or_none()
+        
+        if not event:
+            from fastapi import HTTPException, status
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Event not found"
+            )
+        
+        return Event.model_validate(event)
+    
+    async def respond():
+        # Only full bodies are cached; trimmed ones are cut from a fresh build
+        if fields is not None:
+            return pick(await build(), fields)
+        return await response_cache.cached_response(key, settings.CACHE_TTL_EVENT_DETAIL_SECONDS, build)
+    
+    key = ResponseCache.detail_key("event", event_id, scope)
+    return await conditional_response(
+        request, db,
+        sources=[(CompetitiveEvent, criteria)],
+        key_parts=("event", scope, fields),
+        respond=respond,
+        entities=("event",)
+    )
+
+
+@router.put("/{event_id}", response_model=Event)
+async def update_event(
+    event_id: UUID,
+    event_data: EventUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: AppUser = Depends(require_organizer)
+):
+    """Update event title or dates (organizer only)."""
+    from fastapi import HTTPException, status
     stmt = select(CompetitiveEvent).where(
         CompetitiveEvent.event_id == event_id,
         CompetitiveEvent.deleted_at.is_(None)
@@ -66,10 +201,134 @@ async def get_event(
     event = result.scalar_one_or_none()
     
     if not event:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Event not found"
+        )
+    
+    # Winners are set through the declaration flow, not a plain update
+    changes = event_data.model_dump(include={"title", "start_date", "end_date"}, exclude_none=True)
+    for field, value in changes.items():
+        setattr(event, field, value)
+    
+    if event.end_date <= event.start_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end_date must be after start_date"
+        )
+    
+    await db.commit()
+    await db.refresh(event)
+    await response_cache.invalidate("event", [event_id])
+    
+    return Event.model_validate(event)
+
+
+@router.delete("/{event_id}")
+async def delete_event(
+    event_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: AppUser = Depends(require_organizer)
+):
+    """Delete event (organizer only)."""
+    stmt = select(CompetitiveEvent).where(
+        CompetitiveEvent.event_id == event_id,
+        CompetitiveEvent.deleted_at.is_(None)
+    )
+    result = await db.execute(stmt)
+    event = result.scalar_one_or_none()
+    
+    if not event:
+        from fastapi import HTTPException, status
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Event not found"
+        )
+    
+    event.soft_delete()
+    await db.commit()
+    await response_cache.invalidate("event", [event_id])
+    
+    return {"message": "Event deleted successfully"}
+
+
+@router.get("/{event_id}/results", response_model=EventResults)
+@coalesce("events.results")
+async def get_event_results(
+    event_id: UUID,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: AppUser = Depends(get_current_active_user)
+):
+    """Get the frozen results of a finished event."""
+    results = await EventLifecycleService.get_results(db, event_id)
+    if not results:
+        from fastapi import HTTPException, status
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Results not available yet"
+        )
+    
+    return results
+
+
+
+@router.post("/{event_id}/winner", response_model=EventResults)
+async def declare_winner(
+    event_id: UUID,
+    winner_data: DeclareWinnerRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: AppUser = Depends(require_organizer)
+):
+    """Declare the winner of a finished event (organizer only).
+
+    Without ``winner_team_id`` the winner is taken from the final rankings.
+    """
+    return await EventLifecycleService.declare_winner(
+        db, event_id, winner_data.winner_team_id
+    )
+
+
+@router.get("/{event_id}/leaderboard", response_model=List[EvaluationRanking])
+@coalesce("events.leaderboard")
+async def get_event_leaderboard(
+    event_id: UUID,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: AppUser = Depends(get_current_active_user)
+):
+    """Get the ranking of an event's submissions (live, or frozen once the event closes)."""
+    # Checked before the cache so unknown IDs never get a cached empty ranking
+    window = await EventWindowCache.get(db, event_id)
+    if window is None or window.deleted:
         from fastapi import HTTPException, status
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Event not found"
         )
     
-    return Event.model_validate(event)
\ No newline at end of file
+    async def build():
+        results = await EventLifecycleService.get_results(db, event_id)
+        if results is not None:
+            return results.rankings
+        return await EventLifecycleService.compute_rankings(db, event_id)
+    
+    key = ResponseCache.detail_key("leaderboard", event_id, ResponseCache.scope(current_user))
+    return await response_cache.cached_response(key, settings.CACHE_TTL_LEADERBOARD_SECONDS, build)
+
+
+@router.post("/{event_id}/assignments", response_model=JudgeAssignmentResult)
+async def assign_judges(
+    event_id: UUID,
+    assignment_data: JudgeAssignmentRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: AppUser = Depends(require_organizer)
+):
+    """Pre-assign every submission of the event to k judges (organizer only)."""
+    return await AssignmentService.assign_event(
+        db,
+        event_id,
+        assignment_data.judges_per_submission,
+        judge_ids=assignment_data.judge_ids,
+        dry_run=assignment_data.dry_run
+    )
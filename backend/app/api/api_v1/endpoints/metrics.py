@@ -0,0 +1,33 @@
+from fastapi import APIRouter, Depends
+
+from app.core.cache import response_cache
+from app.core.deps import require_organizer
+from app.core.query_cache import query_cache
+from app.core.singleflight import single_flight
+from app.models.user import AppUser
+
+router = APIRouter()
+
+
+@router.get("/cache", response_model=dict)
+async def get_cache_metrics(
+    current_user: AppUser = Depends(require_organizer)
+):
+    """Get per-tier cache hit rates for this worker (organizer only)."""
+    return response_cache.metrics()
+
+
+@router.get("/coalescing", response_model=dict)
+async def get_coalescing_metrics(
+    current_user: AppUser = Depends(require_organizer)
+):
+    """Get per-route request coalescing ratios for this worker (organizer only)."""
+    return single_flight.stats.snapshot()
+
+
+@router.get("/query-cache", response_model=dict)
+async def get_query_cache_metrics(
+    current_user: AppUser = Depends(require_organizer)
+):
+    """Get ORM query-result cache hit rates for this worker (organizer only)."""
+    return query_cache.metrics()
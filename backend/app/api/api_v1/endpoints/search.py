@@ -0,0 +1,35 @@
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.core.deps import get_current_active_user
+from app.schemas.search import SearchResults, SearchType
+from app.schemas.team import TeamSummary
+from app.models.user import AppUser
+from app.services.search_service import SearchService
+
+router = APIRouter()
+
+
+@router.get("/", response_model=SearchResults)
+async def search(
+    q: str = Query(..., min_length=2, max_length=100),
+    types: Optional[List[SearchType]] = Query(None, description="Restrict to these entity types"),
+    limit: int = Query(10, ge=1, le=50),
+    db: AsyncSession = Depends(get_db),
+    current_user: AppUser = Depends(get_current_active_user)
+):
+    """Search teams, events and (organizers only) users by name, email or title."""
+    return await SearchService.search(db, current_user, q, types=types, limit=limit)
+
+
+@router.get("/teams/autocomplete", response_model=List[TeamSummary])
+async def autocomplete_teams(
+    q: str = Query(..., min_length=2, max_length=100),
+    limit: int = Query(8, ge=1, le=20),
+    db: AsyncSession = Depends(get_db),
+    current_user: AppUser = Depends(get_current_active_user)
+):
+    """Suggest teams by name prefix while a participant picks a team to join."""
+    return await SearchService.autocomplete_teams(db, q, limit=limit)
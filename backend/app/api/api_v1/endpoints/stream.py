@@ -0,0 +1,83 @@
+from typing import AsyncIterator
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from uuid import UUID
+import asyncio
+
+from app.core.broadcast import broadcaster, event_channel, team_channel, Subscription
+from app.core.config import settings
+from app.core.deps import get_stream_user
+from app.models.user import AppUser, UserRole
+
+router = APIRouter()
+
+# Event types participants may see on event-wide channels
+PUBLIC_EVENT_TYPES = ("leaderboard", "event.finished", "event.winner")
+
+
+async def _event_stream(request: Request, subscription: Subscription) -> AsyncIterator[bytes]:
+    """Yield SSE frames for a subscription until the client goes away or falls behind."""
+    try:
+        yield b"retry: 3000\n\n"
+        while True:
+            try:
+                message = await asyncio.wait_for(
+                    subscription.get(), timeout=settings.SSE_HEARTBEAT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    break
+                yield b": keepalive\n\n"
+                continue
+
+            if message is None:
+                # Client could not keep up; ask it to refetch and reconnect
+                yield b"event: overflow\ndata: {}\n\n"
+                break
+
+            yield message.frame
+    finally:
+        broadcaster.unsubscribe(subscription)
+
+
+def _sse_response(request: Request, subscription: Subscription) -> StreamingResponse:
+    return StreamingResponse(
+        _event_stream(request, subscription),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        }
+    )
+
+
+@router.get("/events/{event_id}")
+async def stream_event(
+    event_id: UUID,
+    request: Request,
+    current_user: AppUser = Depends(get_stream_user)
+):
+    """Stream live leaderboard (and, for staff, submission) updates for an event."""
+    event_types = None
+    if current_user.role == UserRole.PARTICIPANT:
+        event_types = PUBLIC_EVENT_TYPES
+
+    subscription = broadcaster.subscribe(event_channel(event_id), event_types)
+    return _sse_response(request, subscription)
+
+
+@router.get("/teams/{team_id}")
+async def stream_team(
+    team_id: UUID,
+    request: Request,
+    current_user: AppUser = Depends(get_stream_user)
+):
+    """Stream live submission updates for a team (members and staff only)."""
+    if current_user.role == UserRole.PARTICIPANT and current_user.team_id != team_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You can only subscribe to your own team"
+        )
+
+    subscription = broadcaster.subscribe(team_channel(team_id))
+    return _sse_response(request, subscription)
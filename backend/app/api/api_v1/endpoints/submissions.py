@@ -1,14 +1,29 @@
-from typing import List
-from fastapi import APIRouter, Depends, Query, UploadFile, File, Form, HTTPException, status
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, Query, Request, UploadFile, File, Form, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, select
+from sqlalchemy.exc import IntegrityError
 from uuid import UUID
 
+from app.core.cache import response_cache
+from app.core.conditional import conditional_response
 from app.core.database import get_db
-from app.core.deps import get_current_active_user, require_participant
-from app.schemas.submission import Submission, SubmissionCreate
+from app.core.fields import FieldSelection, sparse_fields, project, fetch_fields
+from app.core.loader import Loaders, get_loaders
+from app.core.lookup import requested_ids, any_id, lookup_result
+from app.core.deps import get_current_active_user, require_participant, require_organizer
+from app.schemas.submission import (
+    Submission, SubmissionCreate, SubmissionBulkStatusUpdate, SubmissionBulkStatusResult,
+    SubmissionWithDetails
+)
+from app.schemas.lookup import LookupResult
+from app.models.event import CompetitiveEvent
 from app.models.submission import Submission as SubmissionModel
+from app.models.team import Team
 from app.models.user import AppUser, UserRole
+from app.services.live_update_service import LiveUpdateService
+from app.services.event_window_cache import EventWindowCache
+from app.services.submission_service import SubmissionService
 
 router = APIRouter()
 
@@ -36,6 +51,9 @@ async def create_submission(
             detail="You can only submit for your own team"
         )
     
+    # Validate event exists and is open (served from cache on the hot path)
+    await EventWindowCache.require_open(db, event_id)
+    
     # For MVP, we'll simulate file upload
     file_url = f"submissions/{event_id}/{team_id}/{file.filename}"
     
@@ -46,8 +64,20 @@ async def create_submission(
     )
     
     db.add(submission)
-    await db.commit()
+    try:
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        if "uq_submissions_team_event_active" in str(e.orig):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Team already has an active submission for this event"
+            )
+        raise
     await db.refresh(submission)
+    await response_cache.invalidate("submission", [submission.submission_id])
+    
+    await LiveUpdateService.submission_created(submission)
     
     return {
         "message": "Submission created successfully",
@@ -56,34 +86,185 @@ async def create_submission(
     }
 
 
-@router.get("/", response_model=List[Submission])
+@router.post("/status", response_model=SubmissionBulkStatusResult)
+async def bulk_update_submission_status(
+    update_data: SubmissionBulkStatusUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: AppUser = Depends(require_organizer)
+):
+    """Approve or reject pending submissions by ID or by filter (organizer only)."""
+    return await SubmissionService.bulk_transition(db, update_data, current_user)
+
+
+@router.get("/", response_model=Union[List[Submission], LookupResult[Submission]])
 async def get_submissions(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     event_id: UUID = Query(None),
     team_id: UUID = Query(None),
+    ids: Optional[List[UUID]] = Depends(requested_ids),
+    fields: FieldSelection = Depends(sparse_fields(Submission)),
     db: AsyncSession = Depends(get_db),
     current_user: AppUser = Depends(get_current_active_user)
 ):
-    """Get list of submissions."""
-    stmt = select(SubmissionModel).where(
-        SubmissionModel.deleted_at.is_(None)
-    )
+    """Get list of submissions, optionally only the given ``fields``.
+    
+    With ``ids`` the listed submissions are looked up in one query instead.
+    Participants may only see their own team's submissions; other IDs are
+    reported as forbidden, whether or not they exist.
+    """
+    if ids is not None:
+        lookup_criteria = [any_id(SubmissionModel.submission_id, ids), SubmissionModel.deleted_at.is_(None)]
+        restricted = current_user.role == UserRole.PARTICIPANT
+        if restricted:
+            # Other teams' submissions are never queried, so neither the
+            # response nor its validators depend on them
+            lookup_criteria.append(SubmissionModel.team_id == current_user.team_id)
+        
+        async def lookup():
+            submissions = []
+            if not restricted or current_user.team_id is not None:
+                stmt = select(SubmissionModel).where(*lookup_criteria)
+                submissions = (await db.execute(stmt)).scalars().all()
+            return lookup_result(
+                Submission, ids, submissions,
+                key=lambda submission: submission.submission_id,
+                build=Submission.model_validate,
+                fields=fields,
+                restricted=restricted
+            )
+        
+        return await conditional_response(
+            request, db,
+            sources=[(SubmissionModel, lookup_criteria)],
+            key_parts=("submissions", current_user.role.value, current_user.team_id, "ids", tuple(ids), fields),
+            respond=lookup,
+            entities=("submission",)
+        )
+    
+    criteria: List[ColumnElement[bool]] = [SubmissionModel.deleted_at.is_(None)]
     
     # Filter by event if provided
     if event_id:
-        stmt = stmt.where(SubmissionModel.event_id == event_id)
+        criteria.append(SubmissionModel.event_id == event_id)
     
     # Filter by team if provided
     if team_id:
-        stmt = stmt.where(SubmissionModel.team_id == team_id)
+        criteria.append(SubmissionModel.team_id == team_id)
     
     # Participants can only see their own team's submissions
     if current_user.role == UserRole.PARTICIPANT and current_user.team_id:
-        stmt = stmt.where(SubmissionModel.team_id == current_user.team_id)
+        criteria.append(SubmissionModel.team_id == current_user.team_id)
+    
+    async def respond():
+        if fields is not None:
+            stmt = project(SubmissionModel, fields).where(*criteria).order_by(
+                SubmissionModel.submission_id
+            ).offset(skip).limit(limit)
+            return await fetch_fields(db, stmt)
+        
+        stmt = select(SubmissionModel).where(*criteria).order_by(
+            SubmissionModel.submission_id
+        ).offset(skip).limit(limit)
+        result = await db.execute(stmt)
+        submissions = result.scalars().all()
+        
+        return [Submission.model_validate(submission) for submission in submissions]
+    
+    return await conditional_response(
+        request, db,
+        sources=[(SubmissionModel, criteria)],
+        key_parts=("submissions", current_user.role.value, current_user.team_id, skip, limit, fields),
+        respond=respond,
+        entities=("submission",)
+    )
+
+
+def detail_sources(criteria: list) -> list:
+    """Validator sources for submissions plus the teams and events named in them."""
+    matching = select(SubmissionModel).where(*criteria).subquery()
+    return [
+        (SubmissionModel, criteria),
+        (Team, [Team.team_id.in_(select(matching.c.team_id))]),
+        (CompetitiveEvent, [CompetitiveEvent.event_id.in_(select(matching.c.event_id))]),
+    ]
+
+
+@router.get("/details", response_model=List[SubmissionWithDetails])
+async def get_submissions_with_details(
+    request: Request,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=100),
+    event_id: UUID = Query(None),
+    team_id: UUID = Query(None),
+    db: AsyncSession = Depends(get_db),
+    loaders: Loaders = Depends(get_loaders),
+    current_user: AppUser = Depends(get_current_active_user)
+):
+    """Get list of submissions with team names, event titles and scores.
+    
+    Team and event rows are batched across the page: two lookups in total,
+    not two per submission.
+    """
+    criteria: List[ColumnElement[bool]] = [SubmissionModel.deleted_at.is_(None)]
+    
+    if event_id:
+        criteria.append(SubmissionModel.event_id == event_id)
+    
+    if team_id:
+        criteria.append(SubmissionModel.team_id == team_id)
+    
+    # Participants can only see their own team's submissions
+    if current_user.role == UserRole.PARTICIPANT and current_user.team_id:
+        criteria.append(SubmissionModel.team_id == current_user.team_id)
+    
+    async def respond():
+        stmt = select(SubmissionModel).where(*criteria).order_by(
+            SubmissionModel.submission_id
+        ).offset(skip).limit(limit)
+        submissions = (await db.execute(stmt)).scalars().all()
+        return await SubmissionService.list_with_details(loaders, submissions)
+    
+    return await conditional_response(
+        request, db,
+        sources=detail_sources(criteria),
+        key_parts=("submissions", "details", current_user.role.value, current_user.team_id, skip, limit),
+        respond=respond,
+        entities=("submission", "team", "event")
+    )
+
+
+@router.get("/{submission_id}", response_model=SubmissionWithDetails)
+async def get_submission(
+    submission_id: UUID,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    loaders: Loaders = Depends(get_loaders),
+    current_user: AppUser = Depends(get_current_active_user)
+):
+    """Get submission by ID, with its team name, event title and scores."""
+    submission = await loaders.get(SubmissionModel).load(submission_id)
+    if submission is None or submission.deleted_at is not None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Submission not found"
+        )
+    
+    # Participants can only see their own team's submissions
+    if current_user.role == UserRole.PARTICIPANT and submission.team_id != current_user.team_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions"
+        )
     
-    stmt = stmt.offset(skip).limit(limit)
-    result = await db.execute(stmt)
-    submissions = result.scalars().all()
+    async def respond():
+        return await SubmissionService.with_details(loaders, submission)
     
-    return [Submission.model_validate(submission) for submission in submissions]
\ No newline at end of file
+    return await conditional_response(
+        request, db,
+        sources=detail_sources([SubmissionModel.submission_id == submission_id]),
+        key_parts=("submission", submission_id),
+        respond=respond,
+        entities=("submission", "team", "event")
+    )
\ No newline at end of file
@@ -1,15 +1,23 @@
-from typing import List
-from fastapi import APIRouter, Depends, Query
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
+from app.core.cache import response_cache, ResponseCache
+from app.core.conditional import conditional_response
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.fields import FieldSelection, sparse_fields, pick
+from app.core.lookup import requested_ids, any_id, lookup_result
+from app.core.singleflight import coalesce
 from app.core.deps import get_current_active_user, require_participant, require_organizer
 from app.schemas.team import (
-    Team, TeamCreate, TeamUpdate, TeamWithMembers, TeamSummary,
+    TeamCreate, TeamUpdate, TeamWithMembers, TeamSummary,
     JoinTeamRequest, LeaveTeamRequest
 )
+from app.schemas.lookup import LookupResult
 from app.services.team_service import TeamService
+from app.models.team import Team as TeamModel
 from app.models.user import AppUser
 
 router = APIRouter()
@@ -24,74 +32,107 @@ async def create_team(
     """Create a new team (participant only)."""
     team = await TeamService.create_team(db, team_data, current_user)
     
-    # Create response with member details
-    team_dict = Team.model_validate(team).model_dump()
-    team_dict["captain_name"] = team.captain.name
-    team_dict["members"] = [
-        {
-            "user_id": member.user_id,
-            "name": member.name,
-            "email": member.email,
-            "role": member.role.value
-        }
-        for member in team.members
-    ]
-    team_dict["member_count"] = len(team.members)
-    
-    return TeamWithMembers(**team_dict)
+    return TeamService.to_team_with_members(team)
 
 
-@router.get("/", response_model=List[TeamSummary])
+@router.get("/", response_model=Union[List[TeamSummary], LookupResult[TeamSummary]])
+@coalesce("teams.list")
 async def get_teams(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    ids: Optional[List[UUID]] = Depends(requested_ids),
+    fields: FieldSelection = Depends(sparse_fields(TeamSummary)),
     db: AsyncSession = Depends(get_db),
     current_user: AppUser = Depends(get_current_active_user)
 ):
-    """Get list of teams."""
-    teams = await TeamService.get_teams(db, skip=skip, limit=limit)
+    """Get list of teams, optionally only the given ``fields``.
     
-    return [
-        TeamSummary(
-            team_id=team.team_id,
-            name=team.name,
-            captain_name=team.captain.name,
-            member_count=len(team.members)
+    With ``ids`` the listed teams are looked up in one query instead, and
+    IDs without an active team are reported as missing.
+    """
+    if ids is not None:
+        async def lookup():
+            teams = await TeamService.get_teams_by_ids(db, ids)
+            return lookup_result(
+                TeamSummary, ids, teams,
+                key=lambda team: team.team_id,
+                build=TeamService.to_team_summary,
+                fields=fields
+            )
+        
+        return await conditional_response(
+            request, db,
+            sources=[
+                (TeamModel, [any_id(TeamModel.team_id, ids), TeamModel.deleted_at.is_(None)]),
+                (AppUser, [any_id(AppUser.team_id, ids)]),
+            ],
+            key_parts=("teams", ResponseCache.scope(current_user), "ids", tuple(ids), fields),
+            respond=lookup,
+            entities=("team", "user")
         )
-        for team in teams
-    ]
+    
+    async def respond():
+        if fields is not None:
+            return await TeamService.get_team_summary_fields(db, fields, skip=skip, limit=limit)
+        
+        teams = await TeamService.get_teams(db, skip=skip, limit=limit)
+        
+        return [TeamService.to_team_summary(team) for team in teams]
+    
+    # Summaries embed captain names and member counts, so members count too
+    return await conditional_response(
+        request, db,
+        sources=[
+            (TeamModel, [TeamModel.deleted_at.is_(None)]),
+            (AppUser, [AppUser.team_id.is_not(None)]),
+        ],
+        key_parts=("teams", ResponseCache.scope(current_user), skip, limit, fields),
+        respond=respond,
+        entities=("team", "user")
+    )
 
 
 @router.get("/{team_id}", response_model=TeamWithMembers)
+@coalesce("teams.detail")
 async def get_team(
     team_id: UUID,
+    request: Request,
+    fields: FieldSelection = Depends(sparse_fields(TeamWithMembers)),
     db: AsyncSession = Depends(get_db),
     current_user: AppUser = Depends(get_current_active_user)
 ):
-    """Get team by ID."""
-    team = await TeamService.get_team_by_id(db, team_id)
-    if not team:
-        from fastapi import HTTPException, status
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Team not found"
-        )
+    """Get team by ID, optionally only the given ``fields``."""
+    scope = ResponseCache.scope(current_user)
+    
+    async def build():
+        team = await TeamService.get_team_by_id(db, team_id)
+        if not team:
+            from fastapi import HTTPException, status
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Team not found"
+            )
+        
+        return TeamService.to_team_with_members(team)
     
-    # Create response with member details
-    team_dict = Team.model_validate(team).model_dump()
-    team_dict["captain_name"] = team.captain.name
-    team_dict["members"] = [
-        {
-            "user_id": member.user_id,
-            "name": member.name,
-            "email": member.email,
-            "role": member.role.value
-        }
-        for member in team.members
-    ]
-    team_dict["member_count"] = len(team.members)
+    async def respond():
+        # Only full bodies are cached; trimmed ones are cut from a fresh build
+        if fields is not None:
+            return pick(await build(), fields)
+        return await response_cache.cached_response(key, settings.CACHE_TTL_TEAM_DETAIL_SECONDS, build)
     
-    return TeamWithMembers(**team_dict)
+    key = ResponseCache.detail_key("team", team_id, scope)
+    return await conditional_response(
+        request, db,
+        sources=[
+            (TeamModel, [TeamModel.team_id == team_id, TeamModel.deleted_at.is_(None)]),
+            (AppUser, [AppUser.team_id == team_id]),
+        ],
+        key_parts=("team", scope, fields),
+        respond=respond,
+        entities=("team", "user")
+    )
 
 
 @router.put("/{team_id}", response_model=TeamWithMembers)
@@ -104,21 +145,7 @@ async def update_team(
     """Update team (captain or organizer only)."""
     team = await TeamService.update_team(db, team_id, team_data, current_user)
     
-    # Create response with member details
-    team_dict = Team.model_validate(team).model_dump()
-    team_dict["captain_name"] = team.captain.name
-    team_dict["members"] = [
-        {
-            "user_id": member.user_id,
-            "name": member.name,
-            "email": member.email,
-            "role": member.role.value
-        }
-        for member in team.members
-    ]
-    team_dict["member_count"] = len(team.members)
-    
-    return TeamWithMembers(**team_dict)
+    return TeamService.to_team_with_members(team)
 
 
 @router.post("/join", response_model=dict)
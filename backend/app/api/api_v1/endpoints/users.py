@@ -1,37 +1,106 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends, Query
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import ColumnElement, select
 from uuid import UUID
 
+from app.core.conditional import conditional_response
 from app.core.database import get_db
+from app.core.fields import FieldSelection, sparse_fields, project, fetch_fields, pick
+from app.core.lookup import requested_ids, any_id, lookup_result
 from app.core.deps import get_current_active_user, require_organizer
 from app.schemas.user import User, UserUpdate, UserWithTeam
+from app.schemas.lookup import LookupResult
 from app.services.user_service import UserService
 from app.models.user import AppUser, UserRole
+from app.models.team import Team
 
 router = APIRouter()
 
 
-@router.get("/", response_model=List[User])
+@router.get("/", response_model=Union[List[User], LookupResult[User]])
 async def get_users(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     role: Optional[UserRole] = None,
+    ids: Optional[List[UUID]] = Depends(requested_ids),
+    fields: FieldSelection = Depends(sparse_fields(User)),
     db: AsyncSession = Depends(get_db),
-    current_user: AppUser = Depends(require_organizer)
+    current_user: AppUser = Depends(get_current_active_user)
 ):
-    """Get list of users (organizer only)."""
-    users = await UserService.get_users(db, skip=skip, limit=limit, role=role)
-    return [User.model_validate(user) for user in users]
+    """Get list of users (organizer only), optionally only the given ``fields``.
+    
+    With ``ids`` the listed users are looked up in one query instead. As with
+    ``GET /users/{user_id}``, anyone may look themselves up and organizers
+    anyone; other IDs are reported as forbidden, whether or not they exist.
+    """
+    is_organizer = current_user.role == UserRole.ORGANIZER
+    if ids is not None:
+        lookup_criteria = [any_id(AppUser.user_id, ids), AppUser.deleted_at.is_(None)]
+        if not is_organizer:
+            # Other users are never queried, so neither the response nor its
+            # validators depend on rows the caller cannot see
+            lookup_criteria.append(AppUser.user_id == current_user.user_id)
+        
+        async def lookup():
+            if is_organizer:
+                users = (await db.execute(select(AppUser).where(*lookup_criteria))).scalars().all()
+            else:
+                users = [current_user] if current_user.user_id in ids else []
+            return lookup_result(
+                User, ids, users,
+                key=lambda user: user.user_id,
+                build=User.model_validate,
+                fields=fields,
+                restricted=not is_organizer
+            )
+        
+        return await conditional_response(
+            request, db,
+            sources=[(AppUser, lookup_criteria)],
+            key_parts=("users", "ids", "*" if is_organizer else current_user.user_id, tuple(ids), fields),
+            respond=lookup,
+            entities=("user",)
+        )
+    
+    if not is_organizer:
+        from fastapi import HTTPException, status
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Operation not permitted for your role"
+        )
+    
+    criteria: List[ColumnElement[bool]] = [AppUser.deleted_at.is_(None)]
+    if role:
+        criteria.append(AppUser.role == role)
+    
+    async def respond():
+        if fields is not None:
+            stmt = project(AppUser, fields).where(*criteria).offset(skip).limit(limit)
+            return await fetch_fields(db, stmt)
+        
+        users = await UserService.get_users(db, skip=skip, limit=limit, role=role)
+        return [User.model_validate(user) for user in users]
+    
+    return await conditional_response(
+        request, db,
+        sources=[(AppUser, criteria)],
+        key_parts=("users", skip, limit, role, fields),
+        respond=respond,
+        entities=("user",)
+    )
 
 
 @router.get("/{user_id}", response_model=UserWithTeam)
 async def get_user(
     user_id: UUID,
+    request: Request,
+    fields: FieldSelection = Depends(sparse_fields(UserWithTeam)),
     db: AsyncSession = Depends(get_db),
     current_user: AppUser = Depends(get_current_active_user)
 ):
-    """Get user by ID."""
+    """Get user by ID, optionally only the given ``fields``."""
     # Users can view their own profile, organizers can view any profile
     if current_user.user_id != user_id and current_user.role != UserRole.ORGANIZER:
         from fastapi import HTTPException, status
@@ -40,19 +109,33 @@ async def get_user(
             detail="Not enough permissions"
         )
     
-    user = await UserService.get_user_by_id(db, user_id)
-    if not user:
-        from fastapi import HTTPException, status
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
-    
-    # Create response with team information
-    user_data = User.model_validate(user).model_dump()
-    user_data["team_name"] = user.team.name if user.team else None
+    async def respond():
+        user = await UserService.get_user_by_id(db, user_id)
+        if not user:
+            from fastapi import HTTPException, status
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found"
+            )
+        
+        # Create response with team information
+        user_data = User.model_validate(user).model_dump()
+        user_data["team_name"] = user.team.name if user.team else None
+        
+        return pick(UserWithTeam(**user_data), fields)
     
-    return UserWithTeam(**user_data)
+    # The embedded team name changes with the team row
+    user_team = select(AppUser.team_id).where(AppUser.user_id == user_id).scalar_subquery()
+    return await conditional_response(
+        request, db,
+        sources=[
+            (AppUser, [AppUser.user_id == user_id, AppUser.deleted_at.is_(None)]),
+            (Team, [Team.team_id == user_team]),
+        ],
+        key_parts=("user", fields),
+        respond=respond,
+        entities=("user", "team")
+    )
 
 
 @router.put("/{user_id}", response_model=User)
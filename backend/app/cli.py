@@ -0,0 +1,60 @@
+"""Operational commands.
+
+Usage (from backend/):
+    python -m app.cli assign-judges EVENT_ID --judges-per-submission 3 [--dry-run]
+"""
+import argparse
+import asyncio
+import json
+import sys
+from fastapi import HTTPException
+from pydantic import ValidationError
+from uuid import UUID
+
+from app.core.database import AsyncSessionLocal, close_db
+from app.schemas.assignment import JudgeAssignmentRequest
+from app.services.assignment_service import AssignmentService
+
+
+def judges_per_submission(value: str) -> int:
+    """Parse -k with the same bounds as the HTTP endpoint."""
+    try:
+        return JudgeAssignmentRequest.model_validate({"judges_per_submission": value}).judges_per_submission
+    except ValidationError as e:
+        raise argparse.ArgumentTypeError(e.errors()[0]["msg"])
+
+
+async def assign_judges(args: argparse.Namespace):
+    try:
+        async with AsyncSessionLocal() as db:
+            result = await AssignmentService.assign_event(
+                db,
+                args.event_id,
+                args.judges_per_submission,
+                judge_ids=args.judge_ids,
+                dry_run=args.dry_run
+            )
+        print(json.dumps(result.model_dump(mode="json"), indent=2))
+    except HTTPException as e:
+        sys.exit(f"error: {e.detail}")
+    finally:
+        await close_db()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KazRockets operational commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    assign = commands.add_parser("assign-judges", help="pre-assign an event's submissions to judges")
+    assign.add_argument("event_id", type=UUID)
+    assign.add_argument("--judges-per-submission", "-k", type=judges_per_submission, default=3)
+    assign.add_argument("--judge-ids", type=UUID, nargs="+", default=None)
+    assign.add_argument("--dry-run", action="store_true")
+    assign.set_defaults(handler=assign_judges)
+
+    args = parser.parse_args()
+    asyncio.run(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+from typing import Dict, FrozenSet, Iterable, NamedTuple, Optional, Set
+from collections import defaultdict
+from uuid import UUID
+import asyncio
+import json
+import logging
+
+from fastapi.encoders import jsonable_encoder
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def event_channel(event_id: UUID) -> str:
+    """Channel name for event-wide updates (leaderboard, submissions)."""
+    return f"event:{event_id}"
+
+
+def team_channel(team_id: UUID) -> str:
+    """Channel name for team-scoped updates."""
+    return f"team:{team_id}"
+
+
+class Message(NamedTuple):
+    """A broadcast message with its pre-rendered SSE frame."""
+    channel: str
+    type: str
+    frame: bytes
+
+
+class Subscription:
+    """A single subscriber's bounded message queue."""
+
+    def __init__(
+        self,
+        channel: str,
+        event_types: Optional[Iterable[str]] = None,
+        maxsize: int = settings.BROADCAST_QUEUE_SIZE
+    ):
+        self.channel = channel
+        self.event_types: Optional[FrozenSet[str]] = (
+            frozenset(event_types) if event_types is not None else None
+        )
+        self.overflowed = False
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+
+    def offer(self, message: Message) -> bool:
+        """Queue a message without blocking; return False if the subscriber fell behind."""
+        if self.event_types is not None and message.type not in self.event_types:
+            return True
+
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Slow client: drop its backlog and signal it to resync
+            self.overflowed = True
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(None)
+            return False
+        return True
+
+    async def get(self) -> Optional[Message]:
+        """Wait for the next message (None once the subscription overflowed)."""
+        return await self._queue.get()
+
+
+class Broadcaster:
+    """In-process fan-out of live updates, fed by Redis pub/sub across workers."""
+
+    def __init__(self, redis_channel: str = settings.BROADCAST_CHANNEL):
+        self.redis_channel = redis_channel
+        self._subscribers: Dict[str, Set[Subscription]] = defaultdict(set)
+        self._redis: Optional[aioredis.Redis] = None
+        self._listener: Optional[asyncio.Task] = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(subs) for subs in self._subscribers.values())
+
+    async def start(self, redis: Optional[aioredis.Redis] = None):
+        """Start relaying messages from Redis; without Redis, fan out locally only."""
+        self._redis = redis
+        if redis is not None and self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self):
+        """Stop the Redis listener."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        self._redis = None
+
+    def subscribe(
+        self,
+        channel: str,
+        event_types: Optional[Iterable[str]] = None
+    ) -> Subscription:
+        """Register a subscriber on a channel."""
+        subscription = Subscription(channel, event_types)
+        self._subscribers[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        """Remove a subscriber."""
+        subscribers = self._subscribers.get(subscription.channel)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscribers[subscription.channel]
+
+    async def publish(self, channel: str, event_type: str, data: dict):
+        """Publish a message to every worker's subscribers on a channel."""
+        payload = json.dumps({
+            "channel": channel,
+            "type": event_type,
+            "data": jsonable_encoder(data),
+        })
+
+        if self._redis is not None:
+            try:
+                await self._redis.publish(self.redis_channel, payload)
+                return
+            except (RedisError, OSError) as e:
+                logger.warning(f"Broadcast publish failed, delivering locally: {e}")
+
+        self._dispatch_payload(payload)
+
+    def _dispatch_payload(self, payload: str):
+        message = json.loads(payload)
+        frame = f"event: {message['type']}\ndata: {json.dumps(message['data'])}\n\n".encode()
+        self.dispatch(Message(message["channel"], message["type"], frame))
+
+    def dispatch(self, message: Message):
+        """Deliver a message to local subscribers, dropping those that fell behind."""
+        subscribers = self._subscribers.get(message.channel)
+        if not subscribers:
+            return
+
+        dropped = [sub for sub in subscribers if not sub.offer(message)]
+        for subscription in dropped:
+            self.unsubscribe(subscription)
+
+    async def _listen(self):
+        """Relay Redis pub/sub messages to local subscribers, reconnecting on failure."""
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(self.redis_channel)
+                async for item in pubsub.listen():
+                    if item["type"] != "message":
+                        continue
+                    data = item["data"]
+                    self._dispatch_payload(data.decode() if isinstance(data, bytes) else data)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Broadcast listener error, reconnecting: {e}")
+                await asyncio.sleep(1)
+            finally:
+                try:
+                    await pubsub.close()
+                except Exception:
+                    pass
+
+
+broadcaster = Broadcaster()
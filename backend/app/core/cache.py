@@ -0,0 +1,546 @@
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from collections import OrderedDict
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+import asyncio
+import json
+import logging
+import os
+import time
+
+from app.core.compression import ENCODINGS, compress, CACHED_LEVELS, precompressed_encoding
+from app.core.config import settings
+from app.core.msgpack_codec import MEDIA_TYPE as MSGPACK_MEDIA_TYPE, packb, prefers_msgpack
+from app.models.user import AppUser, UserRole
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "kazrockets"
+
+# Random token naming the backend's current dataset; generation counters
+# restart from zero after a flush, the epoch keeps them from repeating
+EPOCH_KEY = f"{KEY_PREFIX}:gen:epoch"
+
+# How long the time of an entity's last change is remembered
+CHANGED_AT_TTL_SECONDS = 7 * 24 * 3600
+
+
+class CacheBackend:
+    """Minimal key-value interface used by the response cache."""
+
+    async def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: bytes, ttl: int):
+        raise NotImplementedError
+
+    async def delete(self, *keys: str):
+        raise NotImplementedError
+
+    async def incr(self, key: str) -> int:
+        raise NotImplementedError
+
+    async def get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        raise NotImplementedError
+
+    async def add(self, key: str, value: bytes) -> bool:
+        """Store ``value`` without expiry unless ``key`` exists; True if stored."""
+        raise NotImplementedError
+
+
+class RedisCacheBackend(CacheBackend):
+    """Cache backend storing entries in Redis."""
+
+    def __init__(self, redis: aioredis.Redis):
+        self.redis = redis
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.redis.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: int):
+        await self.redis.set(key, value, ex=ttl)
+
+    async def delete(self, *keys: str):
+        if keys:
+            await self.redis.delete(*keys)
+
+    async def incr(self, key: str) -> int:
+        return await self.redis.incr(key)
+
+    async def get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        return await self.redis.mget(keys)
+
+    async def add(self, key: str, value: bytes) -> bool:
+        return bool(await self.redis.set(key, value, nx=True))
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Process-local cache backend for tests and single-process development."""
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[bytes, Optional[float]]] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: int):
+        self._data[key] = (value, time.monotonic() + ttl)
+
+    async def delete(self, *keys: str):
+        for key in keys:
+            self._data.pop(key, None)
+
+    async def incr(self, key: str) -> int:
+        current = await self.get(key)
+        value = int(current or 0) + 1
+        self._data[key] = (str(value).encode(), None)
+        return value
+
+    async def get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        return [await self.get(key) for key in keys]
+
+    async def add(self, key: str, value: bytes) -> bool:
+        if await self.get(key) is not None:
+            return False
+        self._data[key] = (value, None)
+        return True
+
+
+class LocalLRUCache:
+    """Bounded process-local LRU with per-entry expiry."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float):
+        self._data[key] = (value, time.monotonic() + ttl)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def delete(self, *keys: str):
+        for key in keys:
+            self._data.pop(key, None)
+
+    def delete_prefix(self, prefix: str):
+        for key in [key for key in self._data if key.startswith(prefix)]:
+            del self._data[key]
+
+    def clear(self):
+        self._data.clear()
+
+
+class CacheStats:
+    """Hit/miss counters per cache tier."""
+
+    def __init__(self):
+        self.l1_hits = 0
+        self.l1_misses = 0
+        self.l2_hits = 0
+        self.l2_misses = 0
+        self.invalidations_received = 0
+
+    @staticmethod
+    def _rate(hits: int, misses: int) -> Optional[float]:
+        total = hits + misses
+        return hits / total if total else None
+
+    def snapshot(self) -> dict:
+        return {
+            "l1": {
+                "hits": self.l1_hits,
+                "misses": self.l1_misses,
+                "hit_rate": self._rate(self.l1_hits, self.l1_misses),
+            },
+            "l2": {
+                "hits": self.l2_hits,
+                "misses": self.l2_misses,
+                "hit_rate": self._rate(self.l2_hits, self.l2_misses),
+            },
+            "invalidations_received": self.invalidations_received,
+        }
+
+
+class ResponseCache:
+    """Two-tier read-through cache for serialized API responses.
+
+    L1 is a per-worker LRU, L2 the shared backend (Redis). Detail entries are
+    keyed as ``kazrockets:{entity}:{id}:{scope}``; list entries embed a
+    per-entity generation counter, so one bump invalidates every page at once.
+    Writes broadcast an invalidation message over Redis pub/sub so every worker
+    drops its stale L1 entries and learns the new generation. Any backend
+    failure is logged and treated as a cache miss.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None):
+        self.backend = backend
+        self.l1 = LocalLRUCache(settings.CACHE_L1_MAX_ENTRIES)
+        self.stats = CacheStats()
+        self.worker_id = f"{os.getpid()}-{id(self)}"
+        self._generations: Dict[str, int] = {}
+        self._listeners: List[Callable[[str, List[str]], None]] = []
+        self._redis: Optional[aioredis.Redis] = None
+        self._subscriber: Optional[asyncio.Task] = None
+
+    async def configure(
+        self,
+        backend: Optional[CacheBackend],
+        redis: Optional[aioredis.Redis] = None
+    ):
+        """Set the L2 backend and start listening for cross-worker invalidations."""
+        await self.stop()
+        self.backend = backend
+        self.l1.clear()
+        self._generations.clear()
+        self._redis = redis
+        if redis is not None:
+            self._subscriber = asyncio.create_task(self._listen())
+
+    async def stop(self):
+        if self._subscriber is not None:
+            self._subscriber.cancel()
+            try:
+                await self._subscriber
+            except asyncio.CancelledError:
+                pass
+            self._subscriber = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    @property
+    def broadcasts(self) -> bool:
+        """Whether invalidations reach the other workers (pub/sub configured)."""
+        return self._redis is not None
+
+    def add_listener(self, callback: Callable[[str, List[str]], None]):
+        """Call ``callback(entity, ids)`` whenever any worker invalidates an entity.
+
+        ``entity`` is ``"*"`` after a listener reconnect, when anything may be stale.
+        """
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[str, List[str]], None]):
+        """Stop calling a callback registered with ``add_listener``."""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    @staticmethod
+    def scope(user: AppUser) -> str:
+        """Visibility scope a cached response was rendered for."""
+        return user.role.value
+
+    @staticmethod
+    def detail_key(entity: str, entity_id: Any, scope: str) -> str:
+        return f"{KEY_PREFIX}:{entity}:{entity_id}:{scope}"
+
+    @staticmethod
+    def variant_key(key: str, encoding: str) -> str:
+        """Key of a cached body's precompressed variant."""
+        return f"{key}:{encoding}"
+
+    def _detail_keys(self, entity: str, entity_ids: List[str]) -> List[str]:
+        """Detail keys of the ids in every scope, with their MessagePack and compressed variants."""
+        keys = []
+        for entity_id in entity_ids:
+            for role in UserRole:
+                key = self.detail_key(entity, entity_id, role.value)
+                for body_key in (key, self.variant_key(key, "msgpack")):
+                    keys.append(body_key)
+                    keys.extend(self.variant_key(body_key, encoding) for encoding in ENCODINGS)
+        return keys
+
+    @staticmethod
+    def _list_prefix(entity: str) -> str:
+        return f"{KEY_PREFIX}:{entity}:list:"
+
+    @staticmethod
+    def _generation_key(entity: str) -> str:
+        return f"{KEY_PREFIX}:gen:{entity}"
+
+    @staticmethod
+    def _changed_at_key(entity: str) -> str:
+        return f"{KEY_PREFIX}:gen-at:{entity}"
+
+    async def generations(self, entities: Iterable[str]) -> Optional[Tuple[tuple, Optional[float]]]:
+        """Shared generation counters of ``entities`` and when the latest of them changed.
+
+        The counters are read from the backend in one round trip, prefixed
+        with the epoch. The change time (epoch seconds) is None unless it is
+        known for every entity. Returns None without a usable backend.
+        """
+        if self.backend is None:
+            return None
+
+        entities = list(entities)
+        keys = [EPOCH_KEY]
+        keys += [self._generation_key(entity) for entity in entities]
+        keys += [self._changed_at_key(entity) for entity in entities]
+        try:
+            values = await self.backend.get_many(keys)
+            epoch = values[0]
+            if epoch is None:
+                await self.backend.add(EPOCH_KEY, os.urandom(8).hex().encode())
+                epoch = await self.backend.get(EPOCH_KEY)
+        except (RedisError, OSError) as e:
+            logger.warning(f"Cache unavailable: {e}")
+            return None
+
+        counters = values[1:len(entities) + 1]
+        stamps = values[len(entities) + 1:]
+        # Unknown unless every entity has a change time
+        times = [float(stamp) for stamp in stamps if stamp is not None]
+        changed_at = max(times) if times and len(times) == len(stamps) else None
+        return (epoch, *(int(counter or 0) for counter in counters)), changed_at
+
+    async def list_key(self, entity: str, scope: str, *parts: Any) -> Optional[str]:
+        """Build a list key bound to the entity's current generation."""
+        if self.backend is None:
+            return None
+
+        generation = self._generations.get(entity)
+        if generation is None:
+            try:
+                stored = await self.backend.get(self._generation_key(entity))
+            except (RedisError, OSError) as e:
+                logger.warning(f"Cache unavailable: {e}")
+                return None
+            generation = max(int(stored or 0), self._generations.get(entity, 0))
+            self._generations[entity] = generation
+
+        suffix = ":".join(str(part) for part in parts)
+        return f"{self._list_prefix(entity)}{generation}:{scope}:{suffix}"
+
+    async def get(self, key: Optional[str]) -> Optional[bytes]:
+        if self.backend is None or key is None:
+            return None
+
+        value = self.l1.get(key)
+        if value is not None:
+            self.stats.l1_hits += 1
+            return value
+        self.stats.l1_misses += 1
+
+        try:
+            value = await self.backend.get(key)
+        except (RedisError, OSError) as e:
+            logger.warning(f"Cache read failed: {e}")
+            return None
+
+        if value is None:
+            self.stats.l2_misses += 1
+            return None
+
+        self.stats.l2_hits += 1
+        self.l1.set(key, value, settings.CACHE_L1_TTL_SECONDS)
+        return value
+
+    async def set(self, key: Optional[str], value: bytes, ttl: int):
+        if self.backend is None or key is None:
+            return
+        self.l1.set(key, value, min(ttl, settings.CACHE_L1_TTL_SECONDS))
+        try:
+            await self.backend.set(key, value, ttl)
+        except (RedisError, OSError) as e:
+            logger.warning(f"Cache write failed: {e}")
+
+    def _apply_invalidation(self, entity: str, entity_ids: List[str], generation: Optional[int]):
+        """Drop local entries for an entity; runs on every worker."""
+        self.l1.delete(*self._detail_keys(entity, entity_ids))
+        self.l1.delete_prefix(self._list_prefix(entity))
+        if generation is not None:
+            self._generations[entity] = max(generation, self._generations.get(entity, 0))
+        else:
+            self._generations.pop(entity, None)
+
+        self._notify_listeners(entity, entity_ids)
+
+    def _notify_listeners(self, entity: str, entity_ids: List[str]):
+        for callback in self._listeners:
+            try:
+                callback(entity, entity_ids)
+            except Exception as e:
+                logger.error(f"Cache invalidation listener failed: {e}")
+
+    async def invalidate(self, entity: str, entity_ids: Iterable[Any] = ()):
+        """Drop detail entries for the given ids (all scopes) and every cached list."""
+        ids = [str(entity_id) for entity_id in entity_ids if entity_id is not None]
+        generation = None
+
+        if self.backend is not None:
+            try:
+                await self.backend.delete(*self._detail_keys(entity, ids))
+                generation = await self.backend.incr(self._generation_key(entity))
+                # Written after the bump: a reader seeing the new time sees the new generation
+                await self.backend.set(
+                    self._changed_at_key(entity), repr(time.time()).encode(), CHANGED_AT_TTL_SECONDS
+                )
+            except (RedisError, OSError) as e:
+                logger.warning(f"Cache invalidation failed: {e}")
+
+        # Apply locally right away, then tell the other workers
+        self._apply_invalidation(entity, ids, generation)
+
+        if self._redis is not None:
+            message = json.dumps({
+                "entity": entity,
+                "ids": ids,
+                "generation": generation,
+                "origin": self.worker_id,
+            })
+            try:
+                await self._redis.publish(settings.CACHE_INVALIDATION_CHANNEL, message)
+            except (RedisError, OSError) as e:
+                logger.warning(f"Cache invalidation publish failed: {e}")
+
+    async def notify(self, entity: str, entity_ids: Iterable[Any] = ()):
+        """Tell listeners on the other workers about a change, without touching cached entries."""
+        if self._redis is None:
+            return
+        message = json.dumps({
+            "entity": entity,
+            "ids": [str(entity_id) for entity_id in entity_ids],
+            "notify_only": True,
+            "origin": self.worker_id,
+        })
+        try:
+            await self._redis.publish(settings.CACHE_INVALIDATION_CHANNEL, message)
+        except (RedisError, OSError) as e:
+            logger.warning(f"Cache notification publish failed: {e}")
+
+    async def _listen(self):
+        """Apply invalidations published by other workers."""
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(settings.CACHE_INVALIDATION_CHANNEL)
+                # Messages may have been missed while disconnected
+                self.l1.clear()
+                self._generations.clear()
+                self._notify_listeners("*", [])
+                async for item in pubsub.listen():
+                    if item["type"] != "message":
+                        continue
+                    message = json.loads(item["data"])
+                    if message.get("origin") == self.worker_id:
+                        continue
+                    if message.get("notify_only"):
+                        self._notify_listeners(message["entity"], message["ids"])
+                        continue
+                    self.stats.invalidations_received += 1
+                    self._apply_invalidation(
+                        message["entity"], message["ids"], message.get("generation")
+                    )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener error, reconnecting: {e}")
+                await asyncio.sleep(1)
+            finally:
+                try:
+                    await pubsub.close()
+                except Exception:
+                    pass
+
+    def metrics(self) -> dict:
+        """Per-tier hit rates and L1 occupancy."""
+        snapshot = self.stats.snapshot()
+        snapshot["l1"]["entries"] = len(self.l1)
+        snapshot["l2"]["enabled"] = self.enabled
+        return snapshot
+
+    async def cached_response(
+        self,
+        key: Optional[str],
+        ttl: int,
+        build: Callable[[], Awaitable[Any]]
+    ) -> Response:
+        """Serve a cached body, or build, store and return it.
+
+        Bodies are cached per wire format: JSON, or MessagePack packed from
+        the built values when the client prefers it. When the client accepts
+        compression and the body is large enough, the compressed variant is
+        served instead: built from the plain body and stored beside it on
+        first use, then returned as stored.
+        """
+        media_type = "application/json"
+        if prefers_msgpack():
+            media_type = MSGPACK_MEDIA_TYPE
+            key = None if key is None else self.variant_key(key, "msgpack")
+
+        encoding = precompressed_encoding()
+        if encoding is not None and key is not None:
+            compressed = await self.get(self.variant_key(key, encoding))
+            if compressed is not None:
+                return self._encoded_response(compressed, encoding, media_type)
+
+        body = await self.get(key)
+        if body is None:
+            body = await self.store(key, await build(), ttl, media_type)
+
+        if encoding is None or key is None or len(body) < settings.COMPRESSION_MIN_SIZE:
+            return Response(content=body, media_type=media_type)
+
+        compressed = compress(body, encoding, CACHED_LEVELS[encoding])
+        await self.set(self.variant_key(key, encoding), compressed, ttl)
+        return self._encoded_response(compressed, encoding, media_type)
+
+    @staticmethod
+    def _encoded_response(body: bytes, encoding: str, media_type: str) -> Response:
+        return Response(
+            content=body,
+            media_type=media_type,
+            headers={"Content-Encoding": encoding}
+        )
+
+    async def store(
+        self,
+        key: Optional[str],
+        value: Any,
+        ttl: int,
+        media_type: str = "application/json"
+    ) -> bytes:
+        """Serialize a response payload and cache it; returns the body."""
+        if media_type == MSGPACK_MEDIA_TYPE:
+            body = packb(value)
+        else:
+            body = json.dumps(jsonable_encoder(value)).encode()
+        await self.set(key, body, ttl)
+        return body
+
+
+def build_backend(redis: Optional[aioredis.Redis]) -> Optional[CacheBackend]:
+    """Pick the cache backend for the configured mode."""
+    if settings.CACHE_BACKEND == "memory":
+        return InMemoryCacheBackend()
+    if settings.CACHE_BACKEND == "redis" and redis is not None:
+        return RedisCacheBackend(redis)
+    return None
+
+
+response_cache = ResponseCache()
@@ -0,0 +1,215 @@
+"""Negotiated response compression: gzip, brotli and zstd.
+
+``CompressionMiddleware`` picks an encoding from ``Accept-Encoding`` and
+compresses JSON, MessagePack and text responses of at least
+COMPRESSION_MIN_SIZE bytes. Streamed responses (Server-Sent Events) are
+compressed incrementally, each chunk flushed so events arrive as they are
+sent.
+
+Cached responses avoid per-request compression altogether: the response
+cache stores each compressed variant next to the plain body the first time
+it is asked for, and serves those bytes as they are. The middleware passes
+responses that already carry a Content-Encoding through untouched.
+"""
+from contextvars import ContextVar
+from typing import Dict, Optional
+import gzip
+import zlib
+
+import brotli
+import zstandard
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+# Server preference when the client accepts several equally
+ENCODINGS = ("zstd", "br", "gzip")
+
+COMPRESSIBLE_TYPES = ("application/json", "application/msgpack", "application/x-msgpack", "text/")
+
+# Cached bodies are compressed once and served many times, so they get
+# denser settings than bodies compressed per request; still not the maximum,
+# which costs around a second per 400 KB on the request that fills the cache
+CACHED_LEVELS = {"zstd": 12, "br": 8, "gzip": 9}
+
+# Encoding the current request may be served precompressed from the cache in
+_precompressed_encoding: ContextVar[Optional[str]] = ContextVar("precompressed_encoding", default=None)
+
+
+def _levels() -> Dict[str, int]:
+    return {
+        "zstd": settings.COMPRESSION_ZSTD_LEVEL,
+        "br": settings.COMPRESSION_BROTLI_QUALITY,
+        "gzip": settings.COMPRESSION_GZIP_LEVEL,
+    }
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """Best encoding the client accepts (q > 0), or None for identity."""
+    if not accept_encoding:
+        return None
+    weights: Dict[str, float] = {}
+    for coding in accept_encoding.split(","):
+        name, *params = [part.strip() for part in coding.split(";")]
+        q = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[name.lower()] = q
+
+    wildcard = weights.get("*", 0.0)
+    candidates = [(weights.get(encoding, wildcard), encoding) for encoding in ENCODINGS]
+    candidates = [(q, encoding) for q, encoding in candidates if q > 0]
+    if not candidates:
+        return None
+    # Highest q wins; ties go to the earlier (preferred) encoding
+    return max(candidates, key=lambda candidate: (candidate[0], -ENCODINGS.index(candidate[1])))[1]
+
+
+def compress(body: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    """Compress a whole body in one go."""
+    level = _levels()[encoding] if level is None else level
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=level).compress(body)
+    if encoding == "br":
+        return brotli.compress(body, quality=level)
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+def decompress(body: bytes, encoding: str) -> bytes:
+    """Decode a body compressed by ``compress``."""
+    if encoding == "zstd":
+        return zstandard.ZstdDecompressor().decompressobj().decompress(body)
+    if encoding == "br":
+        return brotli.decompress(body)
+    return gzip.decompress(body)
+
+
+def precompressed_encoding() -> Optional[str]:
+    """Encoding a cached body may be served in for the current request, if any."""
+    return _precompressed_encoding.get()
+
+
+class StreamCompressor:
+    """Incremental compressor; every chunk is flushed so it can be decoded on arrival."""
+
+    def __init__(self, encoding: str):
+        level = _levels()[encoding]
+        self.encoding = encoding
+        if encoding == "zstd":
+            self._zstd = zstandard.ZstdCompressor(level=level).compressobj()
+        elif encoding == "br":
+            self._brotli = brotli.Compressor(quality=level)
+        else:
+            self._gzip = zlib.compressobj(level, zlib.DEFLATED, 31)  # 31: gzip container
+
+    def chunk(self, data: bytes) -> bytes:
+        if self.encoding == "zstd":
+            return self._zstd.compress(data) + self._zstd.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        if self.encoding == "br":
+            return self._brotli.process(data) + self._brotli.flush()
+        return self._gzip.compress(data) + self._gzip.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "zstd":
+            return self._zstd.flush()
+        if self.encoding == "br":
+            return self._brotli.finish()
+        return self._gzip.flush()
+
+
+def _compressible(headers: MutableHeaders) -> bool:
+    return headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware:
+    """Compress responses in the encoding negotiated from Accept-Encoding."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not settings.COMPRESSION_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        encoding = negotiate(headers.get("accept-encoding"))
+
+        token = _precompressed_encoding.set(encoding)
+        try:
+            await self.app(scope, receive, self._wrap_send(send, encoding, scope["method"] == "HEAD"))
+        finally:
+            _precompressed_encoding.reset(token)
+
+    @staticmethod
+    def _wrap_send(send: Send, encoding: Optional[str], head: bool) -> Send:
+        start: Optional[Message] = None
+        compressor: Optional[StreamCompressor] = None
+        passthrough = False
+
+        async def wrapped(message: Message):
+            nonlocal start, compressor, passthrough
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                if _compressible(response_headers):
+                    response_headers.add_vary_header("Accept-Encoding")
+                if (
+                    encoding is None or head
+                    or message["status"] in (204, 304)
+                    or "content-encoding" in response_headers
+                    or not _compressible(response_headers)
+                ):
+                    passthrough = True
+                    await send(message)
+                    return
+                # Held until the first body chunk shows whether it is streamed
+                start = message
+                return
+
+            if (
+                passthrough or encoding is None or start is None
+                or message["type"] != "http.response.body"
+            ):
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            response_headers = MutableHeaders(scope=start)
+
+            if compressor is None:
+                if not more_body:
+                    # Whole body in one message
+                    if len(body) >= settings.COMPRESSION_MIN_SIZE:
+                        body = compress(body, encoding)
+                        _mark_encoded(response_headers, encoding)
+                        response_headers["content-length"] = str(len(body))
+                    await send(start)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+
+                compressor = StreamCompressor(encoding)
+                _mark_encoded(response_headers, encoding)
+                del response_headers["content-length"]
+                await send(start)
+
+            data = compressor.chunk(body) if body else b""
+            if not more_body:
+                data += compressor.finish()
+            await send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+        return wrapped
+
+
+def _mark_encoded(headers: MutableHeaders, encoding: str):
+    headers["content-encoding"] = encoding
+    # Compressed bytes differ from the identity ones; only a weak tag still holds
+    etag = headers.get("etag")
+    if etag is not None and not etag.startswith("W/"):
+        headers["etag"] = f"W/{etag}"
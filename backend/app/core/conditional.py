@@ -0,0 +1,154 @@
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, Tuple
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from fastapi import Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func
+import hashlib
+import time
+
+from app.core.cache import response_cache
+from app.core.msgpack_codec import MEDIA_TYPE as MSGPACK_MEDIA_TYPE, accepts_msgpack, packb
+
+# Authenticated responses may be stored by shared caches only if they revalidate
+CACHE_CONTROL = "no-cache, must-revalidate"
+
+# (model, filter criteria) pairs whose rows make up a response
+ValidatorSource = Tuple[Any, Sequence[Any]]
+
+
+async def compute_validators(
+    db: AsyncSession,
+    sources: List[ValidatorSource],
+    *key_parts: Any
+) -> Tuple[str, Optional[datetime]]:
+    """Derive a weak ETag and Last-Modified from max(updated_at) and row counts.
+
+    All sources are aggregated in a single round trip without loading rows.
+    ``key_parts`` (route, scope, paging) distinguish representations that
+    share the same underlying rows.
+    """
+    columns = []
+    for model, criteria in sources:
+        columns.append(
+            select(func.max(model.updated_at)).where(*criteria).scalar_subquery()
+        )
+        columns.append(
+            select(func.count()).select_from(model).where(*criteria).scalar_subquery()
+        )
+
+    row = (await db.execute(select(*columns))).one()
+
+    stamps = [stamp for stamp in row[0::2] if stamp is not None]
+    last_modified = max(stamps) if stamps else None
+
+    return _weak_etag(key_parts, tuple(row)), last_modified
+
+
+async def generation_validators(
+    entities: Sequence[str],
+    *key_parts: Any
+) -> Optional[Tuple[str, Optional[datetime]]]:
+    """Derive a weak ETag and Last-Modified from the response cache's generation counters.
+
+    Every write path invalidates the entities it touches, which bumps their
+    counters, so the validators move on updates and deletes alike without a
+    query. Returns None when the cache backend is unavailable.
+    """
+    state = await response_cache.generations(entities)
+    if state is None:
+        return None
+    counters, changed_at = state
+
+    last_modified = None
+    # Within the same second a further change would not move the HTTP date
+    if changed_at is not None and time.time() - changed_at >= 1:
+        last_modified = datetime.fromtimestamp(changed_at, timezone.utc)
+
+    return _weak_etag(key_parts, counters), last_modified
+
+
+def _weak_etag(key_parts: Tuple[Any, ...], state: tuple) -> str:
+    fingerprint = repr((key_parts, state)).encode()
+    return f'W/"{hashlib.blake2b(fingerprint, digest_size=12).hexdigest()}"'
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    """Evaluate If-None-Match (preferred) or If-Modified-Since."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        opaque = etag[2:] if etag.startswith("W/") else etag
+        candidates = [tag.strip() for tag in if_none_match.split(",")]
+        return any(
+            (tag[2:] if tag.startswith("W/") else tag) == opaque
+            for tag in candidates
+        )
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        # HTTP dates have one-second resolution
+        return last_modified.replace(microsecond=0) <= since
+
+    return False
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime]) -> dict:
+    headers = {
+        "ETag": etag,
+        "Cache-Control": CACHE_CONTROL,
+        "Vary": "Authorization",
+    }
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(
+            last_modified.astimezone(timezone.utc), usegmt=True
+        )
+    return headers
+
+
+async def conditional_response(
+    request: Request,
+    db: AsyncSession,
+    sources: List[ValidatorSource],
+    key_parts: Tuple[Any, ...],
+    respond: Callable[[], Awaitable[Any]],
+    entities: Sequence[str] = ()
+) -> Response:
+    """Answer 304 when the client's copy is current, otherwise build the response.
+
+    With ``entities`` (the response cache entities whose invalidation covers
+    every row of the response) and a cache backend, validators come from the
+    generation counters. Otherwise they are aggregated from ``sources``, and
+    no Last-Modified is sent: max(updated_at) does not move when a row is
+    deleted, so If-Modified-Since could answer 304 for a changed response;
+    the row count only reaches the client through the ETag.
+    """
+    validators = await generation_validators(entities, *key_parts) if entities else None
+    if validators is not None:
+        etag, last_modified = validators
+    else:
+        etag, _ = await compute_validators(db, sources, *key_parts)
+        last_modified = None
+    headers = validator_headers(etag, last_modified)
+
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response = await respond()
+    if not isinstance(response, Response):
+        if accepts_msgpack(request.headers.get("accept")):
+            # Packed straight from the models; MessagePackMiddleware leaves it as is
+            response = Response(content=packb(response), media_type=MSGPACK_MEDIA_TYPE)
+        else:
+            response = JSONResponse(content=jsonable_encoder(response))
+    response.headers.update(headers)
+    return response
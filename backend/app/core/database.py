@@ -1,6 +1,7 @@
+from typing import ClassVar
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy import MetaData
+from sqlalchemy import MetaData, Table, text
 from app.core.config import settings
 import logging
 
@@ -28,6 +29,9 @@ AsyncSessionLocal = async_sessionmaker(
 
 class Base(DeclarativeBase):
     """Base class for all database models."""
+    # Every model maps one Table (DeclarativeBase only promises a FromClause)
+    __table__: ClassVar[Table]
+
     metadata = MetaData(
         naming_convention={
             "ix": "ix_%(column_0_label)s",
@@ -56,7 +60,10 @@ async def init_db():
     """Initialize database tables."""
     async with engine.begin() as conn:
         # Import all models to register them
-        from app.models import user, team, event, submission, evaluation  # noqa
+        from app.models import user, team, event, event_result, submission, submission_status_change, evaluation, evaluation_lease, judge_assignment  # noqa
+        
+        # Trigram indexes used by search need the pg_trgm extension
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         
         # Create all tables
         await conn.run_sync(Base.metadata.create_all)
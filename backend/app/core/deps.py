@@ -1,22 +1,37 @@
 from typing import Optional
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from app.core.database import get_db
+from app.core.database import get_db, AsyncSessionLocal
 from app.core.security import verify_token
 from app.models.user import AppUser, UserRole
 from app.schemas.user import TokenData
 from uuid import UUID
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
+
+# Request-state key under which POST /batch hands its read-only sub-requests
+# the (access token, user) it already authenticated
+BATCH_PRINCIPAL = "batch_principal"
 
 
 async def get_current_user(
+    request: Request,
     db: AsyncSession = Depends(get_db),
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> AppUser:
     """Get current authenticated user from JWT token."""
+    shared = request.scope.get("state", {}).get(BATCH_PRINCIPAL)
+    if shared is not None and shared[0] == credentials.credentials:
+        return shared[1]
+    
+    return await authenticate(db, credentials)
+
+
+async def authenticate(db: AsyncSession, credentials: HTTPAuthorizationCredentials) -> AppUser:
+    """Resolve a bearer token to its user, outside of request dependencies."""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -42,6 +57,7 @@ async def get_current_user(
         AppUser.user_id == user_uuid,
         AppUser.deleted_at.is_(None)
     )
+    # Never cached: a deleted or demoted user must lose access at once
     result = await db.execute(stmt)
     user = result.scalar_one_or_none()
     
@@ -116,6 +132,38 @@ async def get_optional_current_user(
         return None
     
     try:
-        return await get_current_user(db, credentials)
+        return await authenticate(db, credentials)
     except HTTPException:
-        return None
\ No newline at end of file
+        return None
+
+
+async def get_stream_user(
+    token: Optional[str] = Query(None, description="Access token for clients that cannot send headers"),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)
+) -> AppUser:
+    """Authenticate a long-lived stream without holding a DB session open."""
+    if credentials is None and token:
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    
+    if credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    # Use a short-lived session: the stream may stay open for hours
+    async with AsyncSessionLocal() as db:
+        user = await authenticate(db, credentials)
+    
+    return await get_current_active_user(user)
+
+
+async def get_batch_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> AppUser:
+    """Authenticate a batch once, without holding a DB session while it runs."""
+    async with AsyncSessionLocal() as db:
+        user = await authenticate(db, credentials)
+    
+    return await get_current_active_user(user)
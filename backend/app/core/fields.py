@@ -0,0 +1,79 @@
+"""Sparse fieldsets: ``?fields=name,status`` on list and detail endpoints.
+
+Requested names are validated against the endpoint's response schema.
+List endpoints push the selection into their query, selecting only those
+columns, and serialize the rows straight to dicts without building response
+models. Detail endpoints build their usual model and dump only the requested
+fields.
+"""
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from sqlalchemy.sql import Select
+
+# None means "every field of the schema"
+FieldSelection = Optional[Tuple[str, ...]]
+
+
+def sparse_fields(schema: Type[BaseModel]) -> Callable[..., FieldSelection]:
+    """Dependency parsing ``fields=`` against the fields of ``schema``.
+
+    The selection comes back in schema order, so ``a,b`` and ``b,a`` share
+    cache entries and ETags.
+    """
+    allowed = tuple(schema.model_fields)
+
+    def dependency(
+        fields: Optional[str] = Query(
+            None, description=f"Comma-separated subset of: {', '.join(allowed)}"
+        )
+    ) -> FieldSelection:
+        if fields is None:
+            return None
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = sorted(requested - set(allowed))
+        if not requested or unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(unknown) or '(none given)'}; "
+                       f"allowed: {', '.join(allowed)}"
+            )
+        return tuple(name for name in allowed if name in requested)
+
+    return dependency
+
+
+def project(
+    model: Any,
+    fields: Sequence[str],
+    expressions: Optional[Dict[str, Any]] = None
+) -> Select:
+    """SELECT of just the requested fields, labelled with their field names.
+
+    Fields map to the model's column of the same name unless ``expressions``
+    gives a SQL expression for them (a joined column, a count subquery...).
+    """
+    expressions = expressions or {}
+    columns = []
+    for name in fields:
+        column = expressions[name] if name in expressions else getattr(model, name)
+        columns.append(column.label(name))
+    return select(*columns)
+
+
+async def fetch_fields(db: AsyncSession, stmt: Select) -> List[dict]:
+    """Run a projected SELECT and return its rows as plain dicts."""
+    result = await db.execute(stmt)
+    return [dict(row) for row in result.mappings()]
+
+
+def pick(payload: Any, fields: FieldSelection) -> Any:
+    """Trim a built response model, or list of models, to the selected fields."""
+    if fields is None:
+        return payload
+    include = set(fields)
+    if isinstance(payload, list):
+        return [item.model_dump(include=include) for item in payload]
+    return payload.model_dump(include=include)
@@ -0,0 +1,119 @@
+"""Request-scoped batching loaders for building responses.
+
+Response builders often need a related row per item: a submission's team
+name, an evaluation's judge. Looking each up as the item is built costs a
+query per item. Here, builders ``await loaders.get(Team).load(team_id)``
+instead, and run concurrently (``asyncio.gather``). Keys requested in the
+same turn of the event loop are collected and resolved with one
+``WHERE pk = ANY(:ids)`` query per model. Results are memoized for the rest
+of the request, so repeated keys never hit the database twice.
+"""
+from typing import Any, Dict, Generic, Hashable, Iterable, List, Optional, Set, Type, TypeVar
+from fastapi import Depends
+from sqlalchemy import select
+from sqlalchemy.orm import class_mapper
+from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
+
+from app.core.database import get_db
+from app.core.lookup import any_id
+
+V = TypeVar("V")
+
+
+class DataLoader(Generic[V]):
+    """Batches and memoizes primary-key lookups of one model within a request."""
+
+    def __init__(self, db: AsyncSession, model: Type[V], lock: asyncio.Lock):
+        self.db = db
+        self.model = model
+        self.primary_key = class_mapper(model).primary_key[0]
+        self._lock = lock
+        self._futures: Dict[Hashable, asyncio.Future] = {}
+        self._queue: List[Hashable] = []
+        # The event loop only keeps weak references to tasks
+        self._pending: Set[asyncio.Task] = set()
+        self.batches = 0
+
+    def load(self, key: Hashable) -> "asyncio.Future[Optional[V]]":
+        """Future resolving to the row with this primary key, or None if there is none."""
+        future = self._futures.get(key)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._futures[key] = future
+        if not self._queue:
+            # Dispatch once the builders scheduled this turn have all asked
+            loop.call_soon(self._start_dispatch)
+        self._queue.append(key)
+        return future
+
+    async def require(self, key: Hashable) -> V:
+        """Like ``load``, for keys a foreign key guarantees; a missing row is an error."""
+        value = await self.load(key)
+        if value is None:
+            raise LookupError(f"{self.model.__name__} {key!r} not found")
+        return value
+
+    async def load_many(self, keys: Iterable[Hashable]) -> List[Optional[V]]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: Hashable, value: V):
+        """Seed the memo with a row the caller already holds."""
+        if key not in self._futures:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._futures[key] = future
+
+    def _start_dispatch(self):
+        task = asyncio.ensure_future(self._dispatch())
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _dispatch(self):
+        keys, self._queue = self._queue, []
+        try:
+            # One session serves every loader of the request, and it cannot
+            # run two statements at once
+            async with self._lock:
+                stmt = select(self.model).where(any_id(self.primary_key, list(keys)))
+                rows = (await self.db.execute(stmt)).scalars().all()
+            self.batches += 1
+        except Exception as e:
+            for key in keys:
+                future = self._futures.pop(key)
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        found = {getattr(row, self.primary_key.key): row for row in rows}
+        for key in keys:
+            future = self._futures[key]
+            if not future.done():
+                future.set_result(found.get(key))
+
+
+class Loaders:
+    """The DataLoaders of one request, one per model, created on first use."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self._lock = asyncio.Lock()
+        self._loaders: Dict[type, DataLoader] = {}
+
+    def get(self, model: Type[V]) -> DataLoader[V]:
+        loader = self._loaders.get(model)
+        if loader is None:
+            loader = self._loaders[model] = DataLoader(self.db, model, self._lock)
+        return loader
+
+    def stats(self) -> Dict[str, Any]:
+        """Batch queries run per model, for logging and benchmarks."""
+        return {model.__name__: loader.batches for model, loader in self._loaders.items()}
+
+
+def get_loaders(db: AsyncSession = Depends(get_db)) -> Loaders:
+    """Dependency: fresh loaders bound to the request's session."""
+    return Loaders(db)
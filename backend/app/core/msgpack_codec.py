@@ -0,0 +1,233 @@
+"""MessagePack as an alternative wire format: ``Accept: application/msgpack``.
+
+Routes keep producing JSON; ``MessagePackMiddleware`` transcodes at the edge,
+so every route and error response is covered alike. Responses built through
+``conditional_response`` or the response cache are packed from their models
+instead, and there UUIDs and timestamps travel in compact binary form rather
+than as 36- and 32-character strings:
+
+* UUIDs as extension type 1 holding the 16 raw bytes;
+* timezone-aware datetimes as the standard MessagePack timestamp extension
+  (type -1, seconds and nanoseconds since the epoch).
+
+Transcoded JSON keeps every string a string: a value's type is never guessed
+from its content, so a team named like a timestamp stays a name.
+
+Request bodies sent as ``Content-Type: application/msgpack`` are decoded the
+same way and handed to the route as JSON, so validation is unchanged.
+"""
+from contextvars import ContextVar
+from datetime import datetime
+from enum import Enum
+from typing import Any, List, Optional
+from uuid import UUID
+import json
+
+import msgpack
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+MEDIA_TYPE = "application/msgpack"
+MEDIA_TYPES = (MEDIA_TYPE, "application/x-msgpack")
+UUID_EXT_TYPE = 1
+
+# ETags of the MessagePack variant get this suffix: the bytes differ from the
+# JSON variant, so the tag must too
+ETAG_SUFFIX = "-msgpack"
+
+# Whether the current request is answered in MessagePack
+_prefers_msgpack: ContextVar[bool] = ContextVar("prefers_msgpack", default=False)
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, UUID):
+        return msgpack.ExtType(UUID_EXT_TYPE, value.bytes)
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, Enum):
+        return value.value
+    # Anything else (naive datetimes, dates, decimals...) as JSON would render it
+    return jsonable_encoder(value)
+
+
+def _ext_hook(code: int, data: bytes) -> Any:
+    if code == UUID_EXT_TYPE:
+        return UUID(bytes=data)
+    return msgpack.ExtType(code, data)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot encode {type(value).__name__} as JSON")
+
+
+def packb(value: Any) -> bytes:
+    """Encode response values (models, UUIDs, aware datetimes...) as MessagePack."""
+    return msgpack.packb(value, default=_default, datetime=True)
+
+
+def unpackb(data: bytes) -> Any:
+    """Decode MessagePack, turning the UUID and timestamp extensions into objects."""
+    return msgpack.unpackb(data, ext_hook=_ext_hook, timestamp=3)
+
+
+def json_to_msgpack(body: bytes) -> bytes:
+    return packb(json.loads(body))
+
+
+def msgpack_to_json(body: bytes) -> bytes:
+    return json.dumps(unpackb(body), default=_json_default).encode()
+
+
+def is_msgpack(content_type: Optional[str]) -> bool:
+    return content_type is not None and content_type.split(";")[0].strip().lower() in MEDIA_TYPES
+
+
+def accepts_msgpack(accept: Optional[str]) -> bool:
+    """Whether MessagePack is acceptable and preferred at least as much as JSON."""
+    if not accept:
+        return False
+    msgpack_q = json_q = 0.0
+    for media_range in accept.split(","):
+        media_type, *params = [part.strip() for part in media_range.split(";")]
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        media_type = media_type.lower()
+        if media_type in MEDIA_TYPES:
+            msgpack_q = max(msgpack_q, q)
+        elif media_type in ("application/json", "application/*", "*/*"):
+            json_q = max(json_q, q)
+    return msgpack_q > 0 and msgpack_q >= json_q
+
+
+def prefers_msgpack() -> bool:
+    """Whether the current request's response is sent as MessagePack."""
+    return _prefers_msgpack.get()
+
+
+def _untag(if_none_match: str) -> str:
+    return if_none_match.replace(f'{ETAG_SUFFIX}"', '"')
+
+
+def _tag(etag: str) -> str:
+    return etag[:-1] + ETAG_SUFFIX + '"' if etag.endswith('"') else etag
+
+
+async def _read_body(receive: Receive) -> bytes:
+    chunks: List[bytes] = []
+    while True:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            return b"".join(chunks)
+
+
+async def _reject(send: Send, detail: str):
+    body = json.dumps({"detail": detail}).encode()
+    await send({
+        "type": "http.response.start",
+        "status": 400,
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+class MessagePackMiddleware:
+    """Negotiate MessagePack request and response bodies for JSON routes."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        respond_msgpack = accepts_msgpack(headers.get("accept"))
+
+        if is_msgpack(headers.get("content-type")):
+            try:
+                body = msgpack_to_json(await _read_body(receive))
+            except (ValueError, TypeError, msgpack.ExtraData, msgpack.FormatError, msgpack.StackError):
+                await _reject(send, "Malformed MessagePack body")
+                return
+
+            scope = dict(scope)
+            request_headers = MutableHeaders(scope=scope)
+            request_headers["content-type"] = "application/json"
+            request_headers["content-length"] = str(len(body))
+            receive = self._replay(body, receive)
+
+        if respond_msgpack and "if-none-match" in headers:
+            scope = dict(scope)
+            MutableHeaders(scope=scope)["if-none-match"] = _untag(headers["if-none-match"])
+
+        token = _prefers_msgpack.set(respond_msgpack)
+        try:
+            await self.app(scope, receive, self._wrap_send(send, respond_msgpack))
+        finally:
+            _prefers_msgpack.reset(token)
+
+    @staticmethod
+    def _replay(body: bytes, receive: Receive) -> Receive:
+        sent = False
+
+        async def replay() -> Message:
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            # Body consumed; pass through the client's disconnect
+            return await receive()
+
+        return replay
+
+    @staticmethod
+    def _wrap_send(send: Send, respond_msgpack: bool) -> Send:
+        start: Optional[Message] = None
+        chunks: List[bytes] = []
+
+        async def wrapped(message: Message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                is_json = response_headers.get("content-type", "").startswith("application/json")
+                if is_json or message["status"] == 304:
+                    response_headers.add_vary_header("Accept")
+                if respond_msgpack and "etag" in response_headers:
+                    response_headers["etag"] = _tag(response_headers["etag"])
+                if not (respond_msgpack and is_json):
+                    await send(message)
+                    return
+                start = message
+                return
+
+            if start is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            content = b"".join(chunks)
+            body = json_to_msgpack(content) if content else b""
+            response_headers = MutableHeaders(scope=start)
+            response_headers["content-type"] = MEDIA_TYPE
+            response_headers["content-length"] = str(len(body))
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        return wrapped
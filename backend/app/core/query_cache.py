@@ -0,0 +1,275 @@
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Set
+from collections import OrderedDict, defaultdict
+from sqlalchemy import event
+from sqlalchemy.engine import FrozenResult
+from sqlalchemy.orm import Session, ORMExecuteState
+from sqlalchemy.orm.loading import merge_frozen_result
+from sqlalchemy.sql import ClauseElement, visitors
+from sqlalchemy.sql.dml import UpdateBase
+from sqlalchemy.sql.selectable import NamedFromClause
+from sqlalchemy.sql.util import find_tables
+import asyncio
+import logging
+import time
+
+from app.core.cache import response_cache
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Execution option / Session.info flag that opts a SELECT into the cache
+QUERY_CACHE_OPTION = "query_cache"
+
+# session.info keys
+_WRITTEN_TABLES = "query_cache_written_tables"
+_CAPTURED_TABLES = "query_cache_captured_tables"
+
+# Invalidation entity published to the other workers
+TABLE_ENTITY = "table"
+
+
+def cached(statement):
+    """Opt a single SELECT into the query-result cache."""
+    return statement.execution_options(**{QUERY_CACHE_OPTION: True})
+
+
+def enable_for_session(session) -> None:
+    """Opt every SELECT of a (sync or async) session into the query-result cache."""
+    session.info[QUERY_CACHE_OPTION] = True
+
+
+def _written_tables(elements: Iterable[Any]) -> Set[str]:
+    """Tables written by the INSERT/UPDATE/DELETE statements among ``elements``."""
+    return {
+        element.table.name
+        for element in elements
+        if isinstance(element, UpdateBase) and isinstance(element.table, NamedFromClause)
+    }
+
+
+class CacheEntry(NamedTuple):
+    """Detached result snapshot plus the table versions it was read at."""
+    result: FrozenResult
+    versions: Dict[str, int]
+    expires_at: float
+
+
+class QueryCacheStats:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+
+    def snapshot(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "hit_rate": self.hits / total if total else None,
+        }
+
+
+class QueryCache:
+    """Process-local ORM query-result cache keyed by statement and parameters.
+
+    Every cached result remembers the version of each table it read from.
+    Versions are bumped whenever a flush or ORM-enabled DML statement touches
+    a table, again when the writing transaction ends, and on every other
+    worker through the response cache invalidation channel. A result whose
+    tables have moved on is never served, nor one older than
+    QUERY_CACHE_TTL_SECONDS, which bounds staleness should a pub/sub message
+    be lost. Without that channel other workers' writes go unseen, so the
+    cache is only installed alongside it.
+
+    Writes issued as raw SQL through ``Connection.execute`` bypass the ORM
+    events and are not tracked.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.stats = QueryCacheStats()
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._versions: Dict[str, int] = defaultdict(int)
+        self._statement_cache: Dict[Any, str] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._installed = False
+
+    def install(self):
+        """Register the session hooks (idempotent)."""
+        if self._installed:
+            return
+        event.listen(Session, "do_orm_execute", self._on_execute)
+        event.listen(Session, "after_flush", self._on_flush)
+        event.listen(Session, "after_commit", self._on_transaction_end)
+        event.listen(Session, "after_rollback", self._on_transaction_end)
+        response_cache.add_listener(self._on_invalidation)
+        self._installed = True
+
+    def uninstall(self):
+        """Remove the session hooks and invalidation listener (idempotent)."""
+        if not self._installed:
+            return
+        event.remove(Session, "do_orm_execute", self._on_execute)
+        event.remove(Session, "after_flush", self._on_flush)
+        event.remove(Session, "after_commit", self._on_transaction_end)
+        event.remove(Session, "after_rollback", self._on_transaction_end)
+        response_cache.remove_listener(self._on_invalidation)
+        self._installed = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def metrics(self) -> dict:
+        return {"entries": len(self._entries), **self.stats.snapshot()}
+
+    def clear(self):
+        self._entries.clear()
+
+    def bump(self, tables: Iterable[str]):
+        for table in tables:
+            self._versions[table] += 1
+
+    def _is_current(self, entry: CacheEntry) -> bool:
+        if entry.expires_at <= time.monotonic():
+            return False
+        return all(
+            self._versions[table] == version
+            for table, version in entry.versions.items()
+        )
+
+    def _key(self, state: ORMExecuteState, statement: ClauseElement) -> Optional[str]:
+        parameters = state.parameters or {}
+        cache_key = statement._generate_cache_key()
+        # Not for executemany-style parameter lists
+        if cache_key is None or not isinstance(parameters, Mapping):
+            return None
+        return cache_key.to_offline_string(self._statement_cache, statement, parameters)
+
+    @staticmethod
+    def _statement_tables(state: ORMExecuteState, statement: ClauseElement) -> Set[str]:
+        tables = {table.name for table in find_tables(statement, include_aliases=True)}
+        for mapper in state.all_mappers:
+            tables.update(table.name for table in mapper.tables)
+        return tables
+
+    def _on_execute(self, state: ORMExecuteState):
+        session = state.session
+        statement = state.statement
+        if not isinstance(statement, ClauseElement):
+            return None
+
+        if not state.is_select:
+            if state.is_update or state.is_delete or state.is_insert:
+                # Includes data-modifying CTEs (WITH ... UPDATE ... INSERT)
+                tables = _written_tables(visitors.iterate(statement))
+                self.bump(tables)
+                session.info.setdefault(_WRITTEN_TABLES, set()).update(tables)
+            return None
+
+        # Data-modifying CTEs of a SELECT are tracked when attached with add_cte()
+        written = _written_tables(cte.element for cte in getattr(statement, "_independent_ctes", ()))
+        if written:
+            self.bump(written)
+            session.info.setdefault(_WRITTEN_TABLES, set()).update(written)
+            return None
+
+        captured = session.info.get(_CAPTURED_TABLES)
+        if state.is_relationship_load:
+            # Eager loads issued while filling a cache miss
+            if captured is not None:
+                for table in self._statement_tables(state, statement):
+                    captured.setdefault(table, self._versions[table])
+            return None
+
+        enabled = state.execution_options.get(
+            QUERY_CACHE_OPTION, session.info.get(QUERY_CACHE_OPTION, False)
+        )
+        if not enabled or captured is not None:
+            return None
+        # Results read inside a writing transaction may never be committed
+        if session.info.get(_WRITTEN_TABLES) or session.new or session.dirty or session.deleted:
+            return None
+        if state.execution_options.get("populate_existing"):
+            return None
+
+        key = self._key(state, statement)
+        if key is None:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            if self._is_current(entry):
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return merge_frozen_result(session, statement, entry.result, load=False)()
+            self.stats.stale += 1
+            del self._entries[key]
+
+        self.stats.misses += 1
+        # Read versions before querying so a concurrent write makes the entry stale
+        versions = {table: self._versions[table] for table in self._statement_tables(state, statement)}
+        session.info[_CAPTURED_TABLES] = versions
+        try:
+            frozen = state.invoke_statement().freeze()
+        finally:
+            session.info.pop(_CAPTURED_TABLES, None)
+
+        self._store(key, CacheEntry(
+            self._snapshot(statement, frozen),
+            versions,
+            time.monotonic() + settings.QUERY_CACHE_TTL_SECONDS
+        ))
+        return frozen()
+
+    @staticmethod
+    def _snapshot(statement, frozen: FrozenResult) -> FrozenResult:
+        """Copy the loaded objects so later changes in the caller's session do not leak in."""
+        scratch = Session()
+        try:
+            return merge_frozen_result(scratch, statement, frozen, load=False)
+        finally:
+            scratch.expunge_all()
+
+    def _store(self, key: str, entry: CacheEntry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _on_flush(self, session: Session, flush_context):
+        tables: Set[str] = set()
+        for instance in list(session.new) + list(session.dirty) + list(session.deleted):
+            mapper = getattr(instance, "__mapper__", None)
+            if mapper is not None:
+                tables.update(table.name for table in mapper.tables)
+        if tables:
+            self.bump(tables)
+            session.info.setdefault(_WRITTEN_TABLES, set()).update(tables)
+
+    def _on_transaction_end(self, session: Session):
+        tables = session.info.pop(_WRITTEN_TABLES, None)
+        if not tables:
+            return
+        # Bump again: other sessions may have cached pre-commit rows meanwhile
+        self.bump(tables)
+        self._publish(tables)
+
+    def _publish(self, tables: Set[str]):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(response_cache.notify(TABLE_ENTITY, sorted(tables)))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _on_invalidation(self, entity: str, entity_ids: List[str]):
+        """Apply table writes made by other workers."""
+        if entity == "*":
+            self.clear()
+        elif entity == TABLE_ENTITY:
+            self.bump(entity_ids)
+
+
+query_cache = QueryCache(settings.QUERY_CACHE_MAX_ENTRIES)
@@ -0,0 +1,48 @@
+from typing import Optional
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+from app.core.config import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Shared Redis client (None when Redis is unavailable)
+redis_client: Optional[aioredis.Redis] = None
+
+
+async def init_redis() -> Optional[aioredis.Redis]:
+    """Connect to Redis, leaving the client unset if it is unreachable."""
+    global redis_client
+
+    client = aioredis.from_url(
+        settings.REDIS_URL,
+        encoding="utf-8",
+        decode_responses=False,
+        socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT_SECONDS,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+    )
+    try:
+        await client.ping()
+    except (RedisError, OSError) as e:
+        logger.warning(f"Redis unavailable, continuing without it: {e}")
+        await client.close()
+        redis_client = None
+        return None
+
+    redis_client = client
+    logger.info("Redis connection established")
+    return redis_client
+
+
+def get_redis() -> Optional[aioredis.Redis]:
+    """Return the shared Redis client, if connected."""
+    return redis_client
+
+
+async def close_redis():
+    """Close the shared Redis client."""
+    global redis_client
+    if redis_client is not None:
+        await redis_client.close()
+        redis_client = None
+        logger.info("Redis connection closed")
@@ -0,0 +1,125 @@
+from typing import Any, Awaitable, Callable, Dict, Optional
+from collections import defaultdict
+from fastapi import Request, Response
+from starlette.datastructures import MutableHeaders
+import asyncio
+import functools
+
+from app.core.compression import decompress, precompressed_encoding
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.user import AppUser
+
+# Request headers that change the representation and must be part of the key
+VARYING_HEADERS = ("accept", "if-none-match", "if-modified-since")
+
+
+class CoalescingStats:
+    """Per-route count of executed (leader) and shared (follower) requests."""
+
+    def __init__(self):
+        self.leaders: Dict[str, int] = defaultdict(int)
+        self.followers: Dict[str, int] = defaultdict(int)
+
+    def snapshot(self) -> dict:
+        routes = {}
+        for route in set(self.leaders) | set(self.followers):
+            leaders = self.leaders[route]
+            followers = self.followers[route]
+            routes[route] = {
+                "executed": leaders,
+                "coalesced": followers,
+                "coalescing_ratio": followers / (leaders + followers) if leaders + followers else None,
+            }
+        return routes
+
+
+class SingleFlight:
+    """Share one in-flight computation between identical concurrent requests."""
+
+    def __init__(self):
+        self.stats = CoalescingStats()
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    @staticmethod
+    def key(route: str, request: Request, user: Optional[AppUser], per_user: bool) -> str:
+        """Key on path, query, representation headers, content coding and authorization scope.
+
+        The coding is the one negotiated from Accept-Encoding, since cached
+        bodies may be served precompressed in it.
+        """
+        scope = "anonymous"
+        if user is not None:
+            scope = str(user.user_id) if per_user else user.role.value
+        headers = "|".join(request.headers.get(name, "") for name in VARYING_HEADERS)
+        encoding = precompressed_encoding() or "identity"
+        return f"{route}|{scope}|{request.url.path}?{request.url.query}|{headers}|{encoding}"
+
+    async def do(self, route: str, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``fn`` unless an identical call is in flight, then share its result."""
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats.followers[route] += 1
+            return _copy_result(await asyncio.shield(task), precompressed_encoding())
+
+        self.stats.leaders[route] += 1
+        task = asyncio.ensure_future(fn())
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so a disconnecting leader does not cancel its followers;
+        # ``fn`` must therefore not use anything the leader's request owns
+        return await asyncio.shield(task)
+
+
+def _copy_result(result: Any, encoding: Optional[str]) -> Any:
+    """Give each follower its own Response object (bodies are shared bytes).
+
+    A body precompressed in another coding than the follower negotiated is
+    decoded; the compression middleware then encodes it for the follower.
+    """
+    if not isinstance(result, Response):
+        return result
+
+    copy = Response(content=result.body, status_code=result.status_code)
+    copy.raw_headers = list(result.raw_headers)
+    headers = MutableHeaders(raw=copy.raw_headers)
+    coding = headers.get("content-encoding")
+    if coding is not None and coding != encoding:
+        copy.body = decompress(result.body, coding)
+        del headers["content-encoding"]
+        headers["content-length"] = str(len(copy.body))
+    return copy
+
+
+def coalesce(route: str, per_user: bool = False):
+    """Opt a GET endpoint into request coalescing if listed in COALESCED_ROUTES.
+
+    The endpoint must accept ``request: Request``; ``current_user`` is used for
+    the authorization scope. Routes whose output depends on the individual
+    caller (not just the role) must pass ``per_user=True``.
+
+    The shared computation outlives the leader's request when the leader
+    disconnects, so it runs on a session of its own instead of the leader's
+    ``db``, which the request teardown closes.
+    """
+    def decorator(endpoint: Callable[..., Awaitable[Any]]):
+        if route not in settings.COALESCED_ROUTES:
+            return endpoint
+
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            request: Request = kwargs["request"]
+            key = SingleFlight.key(route, request, kwargs.get("current_user"), per_user)
+
+            async def run():
+                async with AsyncSessionLocal() as db:
+                    return await endpoint(*args, **{**kwargs, "db": db})
+
+            return await single_flight.do(route, key, run)
+
+        return wrapper
+
+    return decorator
+
+
+single_flight = SingleFlight()
@@ -3,11 +3,20 @@ from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from contextlib import asynccontextmanager
+import asyncio
 import logging
 import structlog
 
 from app.core.config import settings
-from app.core.database import init_db, close_db
+from app.core.msgpack_codec import MessagePackMiddleware
+from app.core.compression import CompressionMiddleware
+from app.core.database import init_db, close_db, AsyncSessionLocal
+from app.core.redis import init_redis, close_redis
+from app.core.broadcast import broadcaster
+from app.core.cache import response_cache, build_backend
+from app.core.query_cache import query_cache
+from app.services.event_scheduler import event_scheduler
+from app.services.cache_warmup_service import CacheWarmupService
 from app.api.api_v1.api import api_router
 
 
@@ -33,18 +42,55 @@ structlog.configure(
 logger = structlog.get_logger()
 
 
+async def warm_up_cache():
+    """Preload hot cache entries, giving up after CACHE_WARMUP_TIMEOUT_SECONDS."""
+    async def run():
+        async with AsyncSessionLocal() as db:
+            await CacheWarmupService.warm(db)
+    
+    try:
+        await asyncio.wait_for(run(), timeout=settings.CACHE_WARMUP_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        logger.warning("Cache warm-up timed out", timeout=settings.CACHE_WARMUP_TIMEOUT_SECONDS)
+    except Exception as e:
+        logger.error("Cache warm-up failed", error=str(e))
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
     # Startup
+    app.state.ready = False
     logger.info("Starting up KazRockets API", version=settings.VERSION)
     await init_db()
     logger.info("Database initialized")
+    redis = await init_redis()
+    await response_cache.configure(build_backend(redis), redis)
+    logger.info("Response cache configured", enabled=response_cache.enabled)
+    if settings.QUERY_CACHE_ENABLED and response_cache.broadcasts:
+        query_cache.install()
+        logger.info("Query-result cache installed", max_entries=settings.QUERY_CACHE_MAX_ENTRIES)
+    elif settings.QUERY_CACHE_ENABLED:
+        logger.warning("Query-result cache disabled: no invalidation channel (Redis unavailable)")
+    await broadcaster.start(redis)
+    logger.info("Live update broadcaster started", redis_enabled=redis is not None)
+    if settings.EVENT_SCHEDULER_ENABLED:
+        event_scheduler.start()
+        logger.info("Event lifecycle scheduler started")
+    if settings.CACHE_WARMUP_ENABLED:
+        await warm_up_cache()
+    app.state.ready = True
+    logger.info("Worker ready")
     
     yield
     
     # Shutdown
+    app.state.ready = False
     logger.info("Shutting down KazRockets API")
+    await event_scheduler.stop()
+    await broadcaster.stop()
+    await response_cache.stop()
+    await close_redis()
     await close_db()
     logger.info("Database connections closed")
 
@@ -60,6 +106,13 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# MessagePack content negotiation (Accept / Content-Type: application/msgpack)
+app.add_middleware(MessagePackMiddleware)
+
+# Response compression (gzip, brotli, zstd); wraps MessagePack so its output
+# is compressed too
+app.add_middleware(CompressionMiddleware)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -91,6 +144,17 @@ async def health_check():
     }
 
 
+@app.get("/ready", status_code=status.HTTP_200_OK)
+async def readiness_check(request: Request):
+    """Readiness endpoint: 503 until startup (including cache warm-up) completes."""
+    if not getattr(request.app.state, "ready", False):
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "starting"}
+        )
+    return {"status": "ready"}
+
+
 @app.get("/", status_code=status.HTTP_200_OK)
 async def root():
     """Root endpoint."""
@@ -1,15 +1,24 @@
 from .user import AppUser, UserRole
 from .team import Team
 from .event import CompetitiveEvent
+from .event_result import EventResult
 from .submission import Submission, SubmissionStatus
+from .submission_status_change import SubmissionStatusChange
 from .evaluation import Evaluation
+from .evaluation_lease import EvaluationLease
+from .judge_assignment import JudgeAssignment, JudgeConflict
 
 __all__ = [
     "AppUser",
     "UserRole", 
     "Team",
     "CompetitiveEvent",
+    "EventResult",
     "Submission",
     "SubmissionStatus",
+    "SubmissionStatusChange",
     "Evaluation",
+    "EvaluationLease",
+    "JudgeAssignment",
+    "JudgeConflict",
 ]
\ No newline at end of file
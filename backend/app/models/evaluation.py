@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, CheckConstraint
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, CheckConstraint, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -43,6 +43,13 @@ class Evaluation(Base):
     # Constraints
     __table_args__ = (
         CheckConstraint('score >= 0 AND score <= 100', name='check_score_range'),
+        # One active evaluation per judge per submission (upsert conflict target)
+        Index(
+            'uq_evaluations_judge_submission_active',
+            'judge_id', 'submission_id',
+            unique=True,
+            postgresql_where=text('deleted_at IS NULL')
+        ),
     )
     
     # Relationships
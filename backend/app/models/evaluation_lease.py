@@ -0,0 +1,29 @@
+from sqlalchemy import Column, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class EvaluationLease(Base):
+    """A judge's time-limited claim on a submission handed out by the work queue."""
+    __tablename__ = "evaluation_leases"
+
+    submission_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("submissions.submission_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    judge_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("app_users.user_id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True
+    )
+    leased_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return (
+            f"<EvaluationLease(submission_id={self.submission_id}, "
+            f"judge_id={self.judge_id}, expires_at={self.expires_at})>"
+        )
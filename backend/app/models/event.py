@@ -1,6 +1,6 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, DateTime, ForeignKey, Computed, Index, text, literal_column
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
+from sqlalchemy.orm import Mapped, relationship, deferred
 from sqlalchemy.sql import func
 from uuid import uuid4
 from app.core.database import Base
@@ -33,11 +33,53 @@ class CompetitiveEvent(Base):
         onupdate=func.now(), 
         nullable=False
     )
+    closed_at = Column(DateTime(timezone=True), nullable=True)  # Set when results are frozen
     deleted_at = Column(DateTime(timezone=True), nullable=True)  # Soft delete
     
+    # Search (GET /search): word/prefix matches via the tsvector, typos via trigrams
+    search_vector: Mapped[str] = deferred(Column(
+        TSVECTOR,
+        Computed("to_tsvector('simple', title)", persisted=True)
+    ))
+    
+    __table_args__ = (
+        # Calendar filters (GET /events): status and date-window overlap via the
+        # range, ordering and upcoming via (start_date, end_date)
+        Index(
+            'ix_competitive_events_period',
+            text("tstzrange(start_date, end_date, '[]')"),
+            postgresql_using='gist',
+            postgresql_where=text('deleted_at IS NULL')
+        ),
+        Index(
+            'ix_competitive_events_start_date_end_date',
+            'start_date', 'end_date',
+            postgresql_where=text('deleted_at IS NULL')
+        ),
+        Index(
+            'ix_competitive_events_search_vector',
+            'search_vector',
+            postgresql_using='gin',
+            postgresql_where=text('deleted_at IS NULL')
+        ),
+        Index(
+            'ix_competitive_events_title_trgm',
+            'title',
+            postgresql_using='gin',
+            postgresql_ops={'title': 'gin_trgm_ops'},
+            postgresql_where=text('deleted_at IS NULL')
+        ),
+    )
+    
     # Relationships
     winner_team = relationship("Team", back_populates="won_events")
     submissions = relationship("Submission", back_populates="event")
+    result = relationship("EventResult", back_populates="event", uselist=False)
+    
+    @classmethod
+    def period(cls):
+        """Inclusive [start_date, end_date] range; the same expression as the GiST index."""
+        return func.tstzrange(cls.start_date, cls.end_date, literal_column("'[]'"))
     
     def __repr__(self):
         return f"<CompetitiveEvent(event_id={self.event_id}, title={self.title})>"
@@ -57,6 +99,8 @@ class CompetitiveEvent(Base):
     @property
     def is_finished(self):
         """Check if event has finished."""
+        if self.closed_at is not None:
+            return True
         from datetime import datetime, timezone
         now = datetime.now(timezone.utc)
         return now > self.end_date
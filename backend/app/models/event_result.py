@@ -0,0 +1,34 @@
+from sqlalchemy import Column, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class EventResult(Base):
+    """Frozen results snapshot of a finished event."""
+    __tablename__ = "event_results"
+
+    event_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("competitive_events.event_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    stats = Column(JSONB, nullable=False)  # EventStats
+    rankings = Column(JSONB, nullable=False)  # List[EvaluationRanking]
+    winner_team_id = Column(UUID(as_uuid=True), nullable=True)
+
+    # Timestamps
+    finalized_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False
+    )
+
+    # Relationships
+    event = relationship("CompetitiveEvent", back_populates="result")
+
+    def __repr__(self):
+        return f"<EventResult(event_id={self.event_id}, finalized_at={self.finalized_at})>"
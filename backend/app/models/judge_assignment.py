@@ -0,0 +1,57 @@
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class JudgeAssignment(Base):
+    """A submission pre-assigned to a judge by the assignment engine."""
+    __tablename__ = "judge_assignments"
+
+    submission_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("submissions.submission_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    judge_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("app_users.user_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    event_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("competitive_events.event_id", ondelete="CASCADE"),
+        nullable=False
+    )
+    assigned_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        # A judge's workload per event
+        Index('ix_judge_assignments_judge_event', 'judge_id', 'event_id'),
+        Index('ix_judge_assignments_event', 'event_id'),
+    )
+
+    def __repr__(self):
+        return f"<JudgeAssignment(submission_id={self.submission_id}, judge_id={self.judge_id})>"
+
+
+class JudgeConflict(Base):
+    """Declared conflict of interest: the judge must not review this team's work."""
+    __tablename__ = "judge_conflicts"
+
+    judge_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("app_users.user_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    team_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("teams.team_id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True
+    )
+    reason = Column(String, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<JudgeConflict(judge_id={self.judge_id}, team_id={self.team_id})>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Enum, ForeignKey
+from sqlalchemy import Column, String, Integer, DateTime, Enum, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -41,6 +41,10 @@ class Submission(Base):
         default=SubmissionStatus.PENDING
     )
     
+    # Score aggregates over active evaluations, maintained by EvaluationService
+    evaluation_count = Column(Integer, nullable=False, default=0, server_default=text('0'))
+    score_total = Column(Integer, nullable=False, default=0, server_default=text('0'))
+    
     # Timestamps
     submitted_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(
@@ -51,10 +55,28 @@ class Submission(Base):
     )
     deleted_at = Column(DateTime(timezone=True), nullable=True)  # Soft delete
     
+    # Constraints
+    __table_args__ = (
+        # One active submission per team per event
+        Index(
+            'uq_submissions_team_event_active',
+            'team_id', 'event_id',
+            unique=True,
+            postgresql_where=text('deleted_at IS NULL')
+        ),
+        # Judging work queue: least-reviewed pending submissions first
+        Index(
+            'ix_submissions_review_queue',
+            'evaluation_count', 'submitted_at',
+            postgresql_where=text("status = 'PENDING' AND deleted_at IS NULL")
+        ),
+    )
+    
     # Relationships
     team = relationship("Team", back_populates="submissions")
     event = relationship("CompetitiveEvent", back_populates="submissions")
     evaluations = relationship("Evaluation", back_populates="submission")
+    status_changes = relationship("SubmissionStatusChange", back_populates="submission")
     
     def __repr__(self):
         return f"<Submission(submission_id={self.submission_id}, status={self.status})>"
@@ -66,15 +88,11 @@ class Submission(Base):
     
     @property
     def average_score(self):
-        """Calculate average score from all evaluations."""
-        if not self.evaluations:
+        """Average score of active evaluations, from the stored aggregates."""
+        if not self.evaluation_count:
             return None
         
-        active_evaluations = [e for e in self.evaluations if e.is_active]
-        if not active_evaluations:
-            return None
-            
-        return sum(e.score for e in active_evaluations) / len(active_evaluations)
+        return self.score_total / self.evaluation_count
     
     def soft_delete(self):
         """Soft delete the submission."""
@@ -0,0 +1,41 @@
+from sqlalchemy import Column, DateTime, Enum, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.core.database import Base
+from app.models.submission import SubmissionStatus
+
+
+class SubmissionStatusChange(Base):
+    """Audit record of one submission status transition."""
+    __tablename__ = "submission_status_changes"
+
+    change_id = Column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        # Generated server-side so INSERT ... SELECT gets one ID per row
+        server_default=func.gen_random_uuid()
+    )
+    submission_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("submissions.submission_id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+    old_status: Column[SubmissionStatus] = Column(Enum(SubmissionStatus), nullable=False)
+    new_status: Column[SubmissionStatus] = Column(Enum(SubmissionStatus), nullable=False)
+    changed_by = Column(
+        UUID(as_uuid=True),
+        ForeignKey("app_users.user_id", ondelete="SET NULL"),
+        nullable=True
+    )
+    changed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    # Relationships
+    submission = relationship("Submission", back_populates="status_changes")
+
+    def __repr__(self):
+        return (
+            f"<SubmissionStatusChange(submission_id={self.submission_id}, "
+            f"{self.old_status} -> {self.new_status})>"
+        )
@@ -1,6 +1,6 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, DateTime, ForeignKey, Computed, Index, text
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
+from sqlalchemy.orm import Mapped, relationship, deferred
 from sqlalchemy.sql import func
 from uuid import uuid4
 from app.core.database import Base
@@ -33,6 +33,28 @@ class Team(Base):
     )
     deleted_at = Column(DateTime(timezone=True), nullable=True)  # Soft delete
     
+    # Search (GET /search): word/prefix matches via the tsvector, typos via trigrams
+    search_vector: Mapped[str] = deferred(Column(
+        TSVECTOR,
+        Computed("to_tsvector('simple', name)", persisted=True)
+    ))
+    
+    __table_args__ = (
+        Index(
+            'ix_teams_search_vector',
+            'search_vector',
+            postgresql_using='gin',
+            postgresql_where=text('deleted_at IS NULL')
+        ),
+        Index(
+            'ix_teams_name_trgm',
+            'name',
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'},
+            postgresql_where=text('deleted_at IS NULL')
+        ),
+    )
+    
     # Relationships
     captain = relationship("AppUser", foreign_keys=[captain_id], back_populates="captained_teams")
     members = relationship("AppUser", foreign_keys="AppUser.team_id", back_populates="team")
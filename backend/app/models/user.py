@@ -1,6 +1,6 @@
-from sqlalchemy import Column, String, DateTime, Enum, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, DateTime, Enum, ForeignKey, Computed, Index, text
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
+from sqlalchemy.orm import Mapped, relationship, deferred
 from sqlalchemy.sql import func
 from uuid import uuid4
 import enum
@@ -43,6 +43,35 @@ class AppUser(Base):
     )
     deleted_at = Column(DateTime(timezone=True), nullable=True)  # Soft delete
     
+    # Search (GET /search): word/prefix matches via the tsvector, typos via trigrams
+    search_vector: Mapped[str] = deferred(Column(
+        TSVECTOR,
+        Computed("to_tsvector('simple', name || ' ' || email)", persisted=True)
+    ))
+    
+    __table_args__ = (
+        Index(
+            'ix_app_users_search_vector',
+            'search_vector',
+            postgresql_using='gin',
+            postgresql_where=text('deleted_at IS NULL')
+        ),
+        Index(
+            'ix_app_users_name_trgm',
+            'name',
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'},
+            postgresql_where=text('deleted_at IS NULL')
+        ),
+        Index(
+            'ix_app_users_email_trgm',
+            'email',
+            postgresql_using='gin',
+            postgresql_ops={'email': 'gin_trgm_ops'},
+            postgresql_where=text('deleted_at IS NULL')
+        ),
+    )
+    
     # Relationships
     team = relationship("Team", foreign_keys=[team_id], back_populates="members")
     captained_teams = relationship("Team", foreign_keys="Team.captain_id", back_populates="captain")
@@ -9,18 +9,25 @@ from .team import (
 )
 from .event import (
     Event, EventCreate, EventUpdate, EventInDB, EventWithWinner,
-    EventSummary, EventStats, DeclareWinnerRequest
+    EventSummary, EventStats, EventResults, DeclareWinnerRequest, EventStatus
 )
 from .submission import (
     Submission, SubmissionCreate, SubmissionUpdate, SubmissionInDB,
     SubmissionWithDetails, SubmissionSummary, SubmissionStats,
-    FileUploadResponse, SubmissionStatusUpdate
+    FileUploadResponse, SubmissionStatusUpdate, SubmissionStatusFilter,
+    SubmissionBulkStatusUpdate, SubmissionBulkStatusResult
 )
 from .evaluation import (
     Evaluation, EvaluationCreate, EvaluationUpdate, EvaluationInDB,
     EvaluationWithDetails, EvaluationSummary, SubmissionEvaluations,
-    JudgeEvaluationStats, EvaluationRanking
+    JudgeEvaluationStats, EvaluationRanking, EvaluationBatchCreate,
+    EvaluationBatchItemResult, EvaluationBatchResult, EvaluationNextRequest,
+    EvaluationTask
 )
+from .assignment import JudgeAssignmentRequest, JudgeAssignmentResult
+from .search import SearchHit, SearchResults
+from .lookup import LookupResult
+from .batch import BatchSubRequest, BatchRequest, BatchSubResponse, BatchResponse
 
 __all__ = [
     # User schemas
@@ -34,15 +41,30 @@ __all__ = [
     
     # Event schemas
     "Event", "EventCreate", "EventUpdate", "EventInDB", "EventWithWinner",
-    "EventSummary", "EventStats", "DeclareWinnerRequest",
+    "EventSummary", "EventStats", "EventResults", "DeclareWinnerRequest", "EventStatus",
     
     # Submission schemas
     "Submission", "SubmissionCreate", "SubmissionUpdate", "SubmissionInDB",
     "SubmissionWithDetails", "SubmissionSummary", "SubmissionStats",
-    "FileUploadResponse", "SubmissionStatusUpdate",
+    "FileUploadResponse", "SubmissionStatusUpdate", "SubmissionStatusFilter",
+    "SubmissionBulkStatusUpdate", "SubmissionBulkStatusResult",
     
     # Evaluation schemas
     "Evaluation", "EvaluationCreate", "EvaluationUpdate", "EvaluationInDB",
     "EvaluationWithDetails", "EvaluationSummary", "SubmissionEvaluations",
-    "JudgeEvaluationStats", "EvaluationRanking",
+    "JudgeEvaluationStats", "EvaluationRanking", "EvaluationBatchCreate",
+    "EvaluationBatchItemResult", "EvaluationBatchResult", "EvaluationNextRequest",
+    "EvaluationTask",
+    
+    # Assignment schemas
+    "JudgeAssignmentRequest", "JudgeAssignmentResult",
+    
+    # Search schemas
+    "SearchHit", "SearchResults",
+    
+    # Batch lookup schemas
+    "LookupResult",
+    
+    # Batch request schemas
+    "BatchSubRequest", "BatchRequest", "BatchSubResponse", "BatchResponse",
 ]
\ No newline at end of file
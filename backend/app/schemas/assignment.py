@@ -0,0 +1,24 @@
+from typing import Optional, List
+from pydantic import BaseModel, Field
+from uuid import UUID
+
+
+class JudgeAssignmentRequest(BaseModel):
+    judges_per_submission: int = Field(3, ge=1, le=20)
+    judge_ids: Optional[List[UUID]] = Field(None, description="Defaults to every active judge")
+    dry_run: bool = False
+
+
+class JudgeAssignmentResult(BaseModel):
+    """Summary of an assignment run for one event."""
+    event_id: UUID
+    dry_run: bool
+    submissions: int
+    judges: int
+    assigned: int
+    short_submissions: int = Field(..., description="Submissions left with fewer than k judges")
+    missing_assignments: int
+    min_load: int
+    max_load: int
+    max_pair_repeats: int
+    elapsed_ms: float
@@ -0,0 +1,33 @@
+from typing import Any, Dict, List, Literal, Optional
+from pydantic import BaseModel, Field
+
+from app.core.config import settings
+
+BatchMethod = Literal["GET", "POST", "PUT", "PATCH", "DELETE"]
+
+
+class BatchSubRequest(BaseModel):
+    """One API call of a batch; ``path`` is relative to the API prefix and may carry a query."""
+    id: Optional[str] = Field(None, max_length=64)  # Echoed back, for matching responses
+    method: BatchMethod = "GET"
+    path: str = Field(..., min_length=1, examples=["/events/?status=ongoing"])
+    headers: Dict[str, str] = {}
+    body: Optional[Any] = None
+
+
+class BatchRequest(BaseModel):
+    """Sub-requests to run together."""
+    requests: List[BatchSubRequest] = Field(..., min_length=1, max_length=settings.BATCH_MAX_REQUESTS)
+
+
+class BatchSubResponse(BaseModel):
+    """Outcome of one sub-request, in request order."""
+    id: Optional[str] = None
+    status: int
+    headers: Dict[str, str] = {}
+    body: Optional[Any] = None
+
+
+class BatchResponse(BaseModel):
+    """Responses to every sub-request of a batch."""
+    responses: List[BatchSubResponse]
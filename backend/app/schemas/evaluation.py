@@ -1,7 +1,9 @@
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field, validator
 from datetime import datetime
 from uuid import UUID
+from app.core.config import settings
+from app.schemas.submission import Submission
 
 
 class EvaluationBase(BaseModel):
@@ -14,6 +16,21 @@ class EvaluationCreate(EvaluationBase):
     pass
 
 
+class EvaluationBatchCreate(BaseModel):
+    items: List[EvaluationCreate] = Field(..., min_length=1, max_length=settings.EVALUATION_BATCH_MAX_ITEMS)
+
+
+class EvaluationNextRequest(BaseModel):
+    """Optionally restrict the work queue to one event."""
+    event_id: Optional[UUID] = None
+
+
+class EvaluationTask(BaseModel):
+    """A submission handed to a judge by the work queue."""
+    submission: Submission
+    lease_expires_at: datetime
+
+
 class EvaluationUpdate(BaseModel):
     score: Optional[int] = Field(None, ge=0, le=100, description="Score must be between 0 and 100")
     comments: Optional[str] = Field(None, max_length=1000)
@@ -35,6 +52,23 @@ class Evaluation(EvaluationInDB):
     pass
 
 
+class EvaluationBatchItemResult(BaseModel):
+    """Outcome of one item of a batch, in request order."""
+    index: int
+    submission_id: UUID
+    status: str  # "created", "updated" or "error"
+    evaluation: Optional[Evaluation] = None
+    detail: Optional[str] = None
+
+
+class EvaluationBatchResult(BaseModel):
+    """Per-item results of a batch evaluation write."""
+    results: List[EvaluationBatchItemResult] = []
+    created: int = 0
+    updated: int = 0
+    failed: int = 0
+
+
 class EvaluationWithDetails(Evaluation):
     """Evaluation response with additional details."""
     judge_name: str
@@ -79,5 +113,9 @@ class EvaluationRanking(BaseModel):
     rank: int
     submission_id: UUID
     team_name: str
-    average_score: float
-    evaluation_count: int
\ No newline at end of file
+    average_score: float  # Raw mean of the submission's scores
+    evaluation_count: int
+    # Trimmed mean of judge-normalized scores (the ranking key) and its confidence interval
+    score: Optional[float] = None
+    score_low: Optional[float] = None
+    score_high: Optional[float] = None
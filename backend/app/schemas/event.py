@@ -2,6 +2,15 @@ from typing import Optional, List
 from pydantic import BaseModel, Field, validator
 from datetime import datetime
 from uuid import UUID
+import enum
+from app.schemas.evaluation import EvaluationRanking
+
+
+class EventStatus(str, enum.Enum):
+    """Calendar filter for GET /events."""
+    ONGOING = "ongoing"
+    UPCOMING = "upcoming"
+    FINISHED = "finished"
 
 
 class EventBase(BaseModel):
@@ -39,6 +48,7 @@ class EventInDB(EventBase):
     winner_team_id: Optional[UUID] = None
     created_at: datetime
     updated_at: datetime
+    closed_at: Optional[datetime] = None
     deleted_at: Optional[datetime] = None
     
     class Config:
@@ -82,4 +92,17 @@ class EventStats(BaseModel):
 
 
 class DeclareWinnerRequest(BaseModel):
-    winner_team_id: UUID
\ No newline at end of file
+    """Declare an event's winner; omit the team to take the top of the final rankings."""
+    winner_team_id: Optional[UUID] = None
+
+
+class EventResults(BaseModel):
+    """Frozen results snapshot of a finished event."""
+    event_id: UUID
+    stats: EventStats
+    rankings: List[EvaluationRanking] = []
+    winner_team_id: Optional[UUID] = None
+    finalized_at: datetime
+    
+    class Config:
+        from_attributes = True
@@ -0,0 +1,12 @@
+from typing import Generic, List, TypeVar
+from pydantic import BaseModel
+from uuid import UUID
+
+T = TypeVar("T")
+
+
+class LookupResult(BaseModel, Generic[T]):
+    """Entities resolved by ``?ids=``, in request order, plus the IDs not returned."""
+    items: List[T] = []
+    missing: List[UUID] = []  # No such entity, or deleted
+    forbidden: List[UUID] = []  # Not viewable by the caller; on restricted lookups, may not exist either
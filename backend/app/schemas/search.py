@@ -0,0 +1,20 @@
+from typing import List, Literal, Optional
+from pydantic import BaseModel
+from uuid import UUID
+
+SearchType = Literal["team", "user", "event"]
+
+
+class SearchHit(BaseModel):
+    """One search match; ``subtitle`` is the email for users (organizers only)."""
+    type: SearchType
+    id: UUID
+    title: str
+    subtitle: Optional[str] = None
+    score: float
+
+
+class SearchResults(BaseModel):
+    """Matches across entity types, best first."""
+    query: str
+    results: List[SearchHit] = []
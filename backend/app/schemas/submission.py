@@ -1,5 +1,5 @@
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from datetime import datetime
 from uuid import UUID
 from app.models.submission import SubmissionStatus
@@ -83,4 +83,37 @@ class SubmissionStatusUpdate(BaseModel):
     old_status: SubmissionStatus
     new_status: SubmissionStatus
     updated_by: UUID
-    updated_at: datetime
\ No newline at end of file
+    updated_at: datetime
+
+
+class SubmissionStatusFilter(BaseModel):
+    """Selects pending submissions for a bulk transition."""
+    event_id: Optional[UUID] = None
+    team_id: Optional[UUID] = None
+    min_evaluations: Optional[int] = Field(None, ge=0)
+    min_average_score: Optional[float] = Field(None, ge=0, le=100)
+    max_average_score: Optional[float] = Field(None, ge=0, le=100)
+
+
+class SubmissionBulkStatusUpdate(BaseModel):
+    """Move pending submissions, named by ID or by filter, to a final status."""
+    status: SubmissionStatus
+    submission_ids: Optional[List[UUID]] = Field(None, min_length=1)
+    filter: Optional[SubmissionStatusFilter] = None
+    
+    @model_validator(mode="after")
+    def check_target(self):
+        if self.status == SubmissionStatus.PENDING:
+            raise ValueError("Submissions can only be moved to APPROVED or REJECTED")
+        if (self.submission_ids is None) == (self.filter is None):
+            raise ValueError("Provide exactly one of submission_ids or filter")
+        return self
+
+
+class SubmissionBulkStatusResult(BaseModel):
+    """Outcome of a bulk status transition."""
+    status: SubmissionStatus
+    updated: int = 0
+    skipped: int = 0  # Requested IDs that were missing or no longer pending
+    submission_ids: List[UUID] = []
+    skipped_ids: List[UUID] = []
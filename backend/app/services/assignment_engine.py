@@ -0,0 +1,143 @@
+"""Greedy judge-assignment engine.
+
+Pure Python with no database access, so the API, the CLI and the benchmark
+all share it. Each submission gets ``k`` judges. Judges are taken from a
+min-heap keyed on current load, so the work stays balanced. A judge is
+skipped when they have a conflict of interest with the submitting team, or
+when they would sit on a panel with someone they have already shared
+``max_pair_repeats`` panels with. Cost is O(S * k * log J) plus the judges
+skipped along the way, with no pass over all judge pairs.
+"""
+from typing import Dict, Hashable, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+from collections import defaultdict
+import heapq
+import math
+
+JudgeId = Hashable
+SubmissionId = Hashable
+TeamId = Hashable
+
+
+class AssignmentPlan(NamedTuple):
+    """New (submission, judge) pairs plus submissions left short of k judges."""
+    assignments: List[Tuple[SubmissionId, JudgeId]]
+    shortfall: Dict[SubmissionId, int]
+    loads: Dict[JudgeId, int]
+    max_pair_repeats: int
+
+    def summary(self) -> dict:
+        loads = list(self.loads.values())
+        return {
+            "assigned": len(self.assignments),
+            "short_submissions": len(self.shortfall),
+            "missing_assignments": sum(self.shortfall.values()),
+            "min_load": min(loads) if loads else 0,
+            "max_load": max(loads) if loads else 0,
+            "max_pair_repeats": self.max_pair_repeats,
+        }
+
+
+def pair_repeat_limit(submissions: int, judges: int, k: int) -> int:
+    """Panels any two judges may share if pairings were spread evenly."""
+    if judges < 2 or k < 2:
+        return 1
+    pairings = submissions * k * (k - 1) / 2
+    return max(1, math.ceil(pairings / (judges * (judges - 1) / 2)))
+
+
+def assign_judges(
+    submissions: Sequence[Tuple[SubmissionId, TeamId]],
+    judges: Sequence[JudgeId],
+    k: int,
+    conflicts: Iterable[Tuple[JudgeId, TeamId]] = (),
+    existing: Optional[Dict[SubmissionId, List[JudgeId]]] = None,
+    initial_loads: Optional[Dict[JudgeId, int]] = None
+) -> AssignmentPlan:
+    """Assign ``k`` judges to every submission.
+
+    ``existing`` panels are kept and topped up. ``initial_loads`` counts
+    work judges already have (in this or other events). When the pairing
+    rule leaves a panel short, it is relaxed for that panel. Conflicts of
+    interest are never relaxed.
+    """
+    existing = existing or {}
+    # Work on judge indices: int hashing and pair keys are much cheaper than UUIDs
+    index_of: Dict[JudgeId, int] = {judge: index for index, judge in enumerate(judges)}
+    count = len(judges)
+    conflicted: Set[Tuple[int, TeamId]] = {
+        (index_of[judge], team_id) for judge, team_id in conflicts if judge in index_of
+    }
+    loads: List[int] = [0] * count
+    for judge_id, load in (initial_loads or {}).items():
+        if judge_id in index_of:
+            loads[index_of[judge_id]] = load
+
+    def pair(a: int, b: int) -> int:
+        return a * count + b if a < b else b * count + a
+
+    pair_counts: Dict[int, int] = defaultdict(int)
+    panels: Dict[SubmissionId, List[int]] = {}
+    for submission_id, panel_judges in existing.items():
+        panel = [index_of[judge] for judge in panel_judges if judge in index_of]
+        panels[submission_id] = panel
+        for i, a in enumerate(panel):
+            for b in panel[i + 1:]:
+                pair_counts[pair(a, b)] += 1
+
+    limit = pair_repeat_limit(len(submissions), count, k)
+    # Judge index breaks load ties so results are deterministic
+    heap = [(load, judge) for judge, load in enumerate(loads)]
+    heapq.heapify(heap)
+
+    assignments: List[Tuple[SubmissionId, JudgeId]] = []
+    shortfall: Dict[SubmissionId, int] = {}
+
+    for submission_id, team_id in submissions:
+        panel = list(panels.get(submission_id, ()))
+        # Existing panel members that are no longer judges still count towards k
+        needed = k - len(existing.get(submission_id, ()))
+        if needed <= 0:
+            continue
+
+        chosen: List[Tuple[int, int]] = []  # (load, judge index)
+        deferred: List[Tuple[int, int]] = []  # Passed over only for repeated pairings
+        skipped: List[Tuple[int, int]] = []
+        while len(chosen) < needed and heap:
+            entry = heapq.heappop(heap)
+            judge = entry[1]
+            if judge in panel or (judge, team_id) in conflicted:
+                skipped.append(entry)
+            elif any(pair_counts.get(pair(judge, other), 0) >= limit for other in panel):
+                deferred.append(entry)
+            else:
+                chosen.append(entry)
+                panel.append(judge)
+
+        # Relax the pairing rule before leaving the panel short, taking the
+        # least-repeated pairing first
+        while len(chosen) < needed and deferred:
+            entry = min(deferred, key=lambda candidate: (
+                max(pair_counts.get(pair(candidate[1], other), 0) for other in panel),
+                candidate[0]
+            ))
+            deferred.remove(entry)
+            chosen.append(entry)
+            panel.append(entry[1])
+
+        for entry in deferred + skipped:
+            heapq.heappush(heap, entry)
+        kept = len(panel) - len(chosen)
+        for position, (load, judge) in enumerate(chosen, start=kept):
+            for other in panel[:position]:
+                pair_counts[pair(judge, other)] += 1
+            loads[judge] = load + 1
+            heapq.heappush(heap, (load + 1, judge))
+            assignments.append((submission_id, judges[judge]))
+
+        if len(chosen) < needed:
+            shortfall[submission_id] = needed - len(chosen)
+
+    max_repeats = max(pair_counts.values(), default=0)
+    return AssignmentPlan(
+        assignments, shortfall, dict(zip(judges, loads)), max_repeats
+    )
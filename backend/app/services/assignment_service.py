@@ -0,0 +1,117 @@
+from typing import List, Optional
+from collections import defaultdict
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Select, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from fastapi import HTTPException, status
+from uuid import UUID
+import asyncio
+import time
+
+from app.models.event import CompetitiveEvent
+from app.models.judge_assignment import JudgeAssignment, JudgeConflict
+from app.models.submission import Submission, SubmissionStatus
+from app.models.user import AppUser, UserRole
+from app.schemas.assignment import JudgeAssignmentResult
+from app.services.assignment_engine import assign_judges
+
+
+class AssignmentService:
+    """Service class for pre-assigning submissions to judges."""
+
+    @staticmethod
+    async def assign_event(
+        db: AsyncSession,
+        event_id: UUID,
+        judges_per_submission: int,
+        judge_ids: Optional[List[UUID]] = None,
+        dry_run: bool = False
+    ) -> JudgeAssignmentResult:
+        """Top up every non-rejected submission of an event to k judges.
+
+        Existing assignments are kept and count towards judge load. A judge
+        affiliated with a team (``AppUser.team_id``) or with a declared
+        ``JudgeConflict`` is never assigned that team's submissions.
+        """
+        stmt: Select = select(CompetitiveEvent.event_id).where(
+            CompetitiveEvent.event_id == event_id,
+            CompetitiveEvent.deleted_at.is_(None)
+        )
+        if (await db.execute(stmt)).scalar_one_or_none() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Event not found"
+            )
+
+        stmt = select(Submission.submission_id, Submission.team_id).where(
+            Submission.event_id == event_id,
+            Submission.deleted_at.is_(None),
+            Submission.status != SubmissionStatus.REJECTED
+        ).order_by(Submission.submitted_at)
+        submissions = [tuple(row) for row in await db.execute(stmt)]
+
+        stmt = select(AppUser.user_id, AppUser.team_id).where(
+            AppUser.role == UserRole.JUDGE,
+            AppUser.deleted_at.is_(None)
+        )
+        if judge_ids is not None:
+            stmt = stmt.where(AppUser.user_id.in_(set(judge_ids)))
+        judge_rows = list(await db.execute(stmt))
+        judges = [row.user_id for row in judge_rows]
+        if not judges:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="No active judges to assign"
+            )
+
+        conflicts = {(row.user_id, row.team_id) for row in judge_rows if row.team_id is not None}
+        stmt = select(JudgeConflict.judge_id, JudgeConflict.team_id).where(
+            JudgeConflict.judge_id.in_(judges)
+        )
+        conflicts.update(tuple(row) for row in await db.execute(stmt))
+
+        stmt = select(JudgeAssignment.submission_id, JudgeAssignment.judge_id).where(
+            JudgeAssignment.event_id == event_id
+        )
+        existing = defaultdict(list)
+        for submission_id, judge_id in await db.execute(stmt):
+            existing[submission_id].append(judge_id)
+
+        # Balance against everything the judges already review, in any event
+        stmt = select(JudgeAssignment.judge_id, func.count()).where(
+            JudgeAssignment.judge_id.in_(judges)
+        ).group_by(JudgeAssignment.judge_id)
+        loads = dict(tuple(row) for row in await db.execute(stmt))
+
+        # CPU-bound; keep the event loop serving other requests meanwhile
+        started = time.perf_counter()
+        plan = await asyncio.to_thread(
+            assign_judges,
+            submissions,
+            judges,
+            judges_per_submission,
+            conflicts=conflicts,
+            existing=existing,
+            initial_loads=loads
+        )
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        if plan.assignments and not dry_run:
+            # executemany, batched by the driver (no parameter-count limit)
+            await db.execute(
+                pg_insert(JudgeAssignment).on_conflict_do_nothing(),
+                [
+                    {"submission_id": submission_id, "judge_id": judge_id, "event_id": event_id}
+                    for submission_id, judge_id in plan.assignments
+                ]
+            )
+            await db.commit()
+
+        return JudgeAssignmentResult(
+            event_id=event_id,
+            dry_run=dry_run,
+            submissions=len(submissions),
+            judges=len(judges),
+            elapsed_ms=round(elapsed_ms, 1),
+            **plan.summary()
+        )
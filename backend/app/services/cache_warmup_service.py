@@ -0,0 +1,118 @@
+from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func
+from sqlalchemy.orm import selectinload
+import logging
+import time
+
+from app.core.cache import response_cache, ResponseCache
+from app.core.config import settings
+from app.models.event import CompetitiveEvent
+from app.models.submission import Submission
+from app.models.team import Team
+from app.models.user import UserRole
+from app.schemas.event import Event
+from app.services.event_lifecycle_service import EventLifecycleService
+from app.services.team_service import TeamService
+
+logger = logging.getLogger(__name__)
+
+# Page fetched by dashboards that do not pass skip/limit
+DEFAULT_PAGE = (0, 100)
+
+
+class CacheWarmupService:
+    """Service class for preloading hot cache entries before a worker serves traffic."""
+
+    @staticmethod
+    async def _store_for_all_scopes(key_for_scope, payload, ttl: int):
+        for role in UserRole:
+            await response_cache.store(key_for_scope(role.value), payload, ttl)
+
+    @staticmethod
+    async def warm_events(db: AsyncSession) -> List[CompetitiveEvent]:
+        """Cache the default event list page and every ongoing or upcoming event."""
+        skip, limit = DEFAULT_PAGE
+        stmt = select(CompetitiveEvent).where(
+            CompetitiveEvent.deleted_at.is_(None)
+        ).order_by(
+            CompetitiveEvent.start_date, CompetitiveEvent.event_id
+        ).offset(skip).limit(limit)
+        events = (await db.execute(stmt)).scalars().all()
+        payload = [Event.model_validate(event) for event in events]
+        for role in UserRole:
+            key = await response_cache.list_key("event", role.value, skip, limit)
+            await response_cache.store(key, payload, settings.CACHE_TTL_EVENT_LIST_SECONDS)
+
+        stmt = select(CompetitiveEvent).where(
+            CompetitiveEvent.deleted_at.is_(None),
+            CompetitiveEvent.end_date >= func.now()
+        ).order_by(CompetitiveEvent.start_date)
+        live_events = list((await db.execute(stmt)).scalars().all())
+        for event in live_events:
+            await CacheWarmupService._store_for_all_scopes(
+                lambda scope: ResponseCache.detail_key("event", event.event_id, scope),
+                Event.model_validate(event),
+                settings.CACHE_TTL_EVENT_DETAIL_SECONDS
+            )
+
+        return live_events
+
+    @staticmethod
+    async def warm_teams(db: AsyncSession, events: List[CompetitiveEvent]) -> int:
+        """Cache rosters of teams that submitted to the given events."""
+        event_ids = [event.event_id for event in events]
+        if not event_ids:
+            return 0
+
+        team_ids = select(Submission.team_id).where(
+            Submission.event_id.in_(event_ids),
+            Submission.deleted_at.is_(None)
+        )
+        stmt = select(Team).options(
+            selectinload(Team.captain),
+            selectinload(Team.members)
+        ).where(
+            Team.team_id.in_(team_ids),
+            Team.deleted_at.is_(None)
+        )
+        teams = (await db.execute(stmt)).scalars().all()
+        for team in teams:
+            await CacheWarmupService._store_for_all_scopes(
+                lambda scope: ResponseCache.detail_key("team", team.team_id, scope),
+                TeamService.to_team_with_members(team),
+                settings.CACHE_TTL_TEAM_DETAIL_SECONDS
+            )
+
+        return len(teams)
+
+    @staticmethod
+    async def warm_leaderboards(db: AsyncSession, events: List[CompetitiveEvent]) -> int:
+        """Cache current rankings of events that have already started."""
+        started = [event for event in events if event.is_ongoing]
+        for event in started:
+            event_id = Event.model_validate(event).event_id
+            rankings = await EventLifecycleService.compute_rankings(db, event_id)
+            await CacheWarmupService._store_for_all_scopes(
+                lambda scope: ResponseCache.detail_key("leaderboard", event_id, scope),
+                rankings,
+                settings.CACHE_TTL_LEADERBOARD_SECONDS
+            )
+
+        return len(started)
+
+    @staticmethod
+    async def warm(db: AsyncSession):
+        """Run every warm-up step."""
+        if not response_cache.enabled:
+            logger.info("Response cache disabled, skipping warm-up")
+            return
+
+        started = time.monotonic()
+        events = await CacheWarmupService.warm_events(db)
+        teams = await CacheWarmupService.warm_teams(db, events)
+        leaderboards = await CacheWarmupService.warm_leaderboards(db, events)
+        logger.info(
+            f"Cache warmed in {time.monotonic() - started:.2f}s: "
+            f"{len(events)} events, {teams} teams, {leaderboards} leaderboards"
+        )
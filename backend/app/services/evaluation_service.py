@@ -0,0 +1,343 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+from datetime import timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, delete, exists, func, literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Row
+from fastapi import HTTPException, status
+from uuid import UUID
+
+from app.core.cache import response_cache
+from app.core.config import settings
+from app.core.loader import Loaders
+from app.models.event import CompetitiveEvent
+from app.models.evaluation import Evaluation
+from app.models.evaluation_lease import EvaluationLease
+from app.models.submission import Submission, SubmissionStatus
+from app.models.team import Team
+from app.models.user import AppUser
+from app.schemas.evaluation import (
+    Evaluation as EvaluationSchema, EvaluationCreate,
+    EvaluationBatchItemResult, EvaluationBatchResult, EvaluationTask, EvaluationWithDetails
+)
+from app.schemas.submission import Submission as SubmissionSchema
+from app.services.live_update_service import LiveUpdateService
+import asyncio
+
+
+class EvaluationService:
+    """Service class for evaluation writes and per-submission score aggregates."""
+
+    @staticmethod
+    async def with_details(loaders: Loaders, evaluation: Evaluation) -> EvaluationWithDetails:
+        """Evaluation with its judge's name and its submission's team and event.
+
+        The submission is loaded first, then its team and event; built
+        concurrently for a page, that is one query per model for the page.
+        """
+        judge, submission = await asyncio.gather(
+            loaders.get(AppUser).require(evaluation.judge_id),
+            loaders.get(Submission).require(evaluation.submission_id)
+        )
+        team, event = await asyncio.gather(
+            loaders.get(Team).require(submission.team_id),
+            loaders.get(CompetitiveEvent).require(submission.event_id)
+        )
+        return EvaluationWithDetails.model_validate({
+            **EvaluationSchema.model_validate(evaluation).model_dump(),
+            "judge_name": judge.name,
+            "submission_team_name": team.name,
+            "submission_event_title": event.title,
+        })
+
+    @staticmethod
+    async def list_with_details(
+        loaders: Loaders,
+        evaluations: Sequence[Evaluation]
+    ) -> List[EvaluationWithDetails]:
+        return list(await asyncio.gather(
+            *(EvaluationService.with_details(loaders, evaluation) for evaluation in evaluations)
+        ))
+
+    @staticmethod
+    async def lock_submissions(db: AsyncSession, submission_ids: Sequence[UUID]) -> Dict[UUID, Row]:
+        """Lock active submissions (in key order, so batches cannot deadlock).
+
+        Holding the row lock serializes concurrent scoring of a submission, so
+        the aggregate refresh always sees every committed evaluation.
+        """
+        stmt = select(
+            Submission.submission_id,
+            Submission.team_id,
+            Submission.event_id
+        ).where(
+            Submission.submission_id.in_(set(submission_ids)),
+            Submission.deleted_at.is_(None)
+        ).order_by(Submission.submission_id).with_for_update()
+
+        result = await db.execute(stmt)
+        return {row.submission_id: row for row in result}
+
+    @staticmethod
+    async def write_evaluations(
+        db: AsyncSession,
+        judge: AppUser,
+        items: Sequence[EvaluationCreate],
+        overwrite: bool = True
+    ) -> List[Row]:
+        """Insert evaluations in one statement, re-scoring existing ones if ``overwrite``.
+
+        Returned rows carry every evaluation column plus ``created``. Without
+        ``overwrite`` rows that already exist are skipped and not returned.
+        """
+        values = pg_insert(Evaluation).values([
+            {
+                "submission_id": item.submission_id,
+                "judge_id": judge.user_id,
+                "score": item.score,
+                "comments": item.comments,
+            }
+            for item in items
+        ])
+        index_elements = [Evaluation.judge_id, Evaluation.submission_id]
+        index_where = Evaluation.deleted_at.is_(None)
+        if overwrite:
+            upsert = values.on_conflict_do_update(
+                index_elements=index_elements,
+                index_where=index_where,
+                set_={
+                    "score": values.excluded.score,
+                    "comments": values.excluded.comments,
+                    "updated_at": func.now(),
+                }
+            )
+        else:
+            upsert = values.on_conflict_do_nothing(
+                index_elements=index_elements, index_where=index_where
+            )
+
+        # xmax is only zero on rows this statement inserted
+        stmt = upsert.returning(
+            *Evaluation.__table__.c,
+            literal_column("(xmax = 0)").label("created")
+        )
+        result = await db.execute(stmt)
+        return list(result)
+
+    @staticmethod
+    async def refresh_aggregates(db: AsyncSession, submission_ids: Sequence[UUID]) -> List[Row]:
+        """Recompute evaluation_count and score_total of the given submissions."""
+        active = select(
+            Evaluation.submission_id,
+            func.count().label("evaluation_count"),
+            func.sum(Evaluation.score).label("score_total")
+        ).where(
+            Evaluation.submission_id.in_(set(submission_ids)),
+            Evaluation.deleted_at.is_(None)
+        ).group_by(Evaluation.submission_id).subquery()
+
+        table = Submission.__table__
+        stmt = update(table).where(
+            table.c.submission_id == active.c.submission_id
+        ).values(
+            evaluation_count=active.c.evaluation_count,
+            score_total=active.c.score_total
+        ).returning(
+            table.c.submission_id,
+            table.c.team_id,
+            table.c.event_id,
+            table.c.evaluation_count,
+            table.c.score_total
+        )
+        result = await db.execute(stmt)
+        return list(result)
+
+    @staticmethod
+    async def release_leases(db: AsyncSession, judge: AppUser, submission_ids: Sequence[UUID]):
+        """Drop the judge's work-queue leases on submissions they just scored."""
+        stmt = delete(EvaluationLease).where(
+            EvaluationLease.judge_id == judge.user_id,
+            EvaluationLease.submission_id.in_(set(submission_ids))
+        ).execution_options(synchronize_session=False)
+        await db.execute(stmt)
+
+    @staticmethod
+    async def publish_scored(evaluation_ids: Sequence[UUID], aggregates: Sequence[Row]):
+        """Invalidate caches and push leaderboard deltas after commit."""
+        await response_cache.invalidate("evaluation", evaluation_ids)
+        await response_cache.invalidate("submission", [row.submission_id for row in aggregates])
+        for row in aggregates:
+            await LiveUpdateService.submission_scored(
+                row.submission_id,
+                row.team_id,
+                row.event_id,
+                row.score_total / row.evaluation_count if row.evaluation_count else None,
+                row.evaluation_count
+            )
+
+    @staticmethod
+    async def upsert_evaluation(
+        db: AsyncSession,
+        judge: AppUser,
+        evaluation_data: EvaluationCreate,
+        overwrite: bool = True
+    ) -> Tuple[Row, bool]:
+        """Score a submission, re-scoring it if this judge already did.
+
+        Returns the evaluation row and whether it was newly created.
+        """
+        submissions = await EvaluationService.lock_submissions(db, [evaluation_data.submission_id])
+        if not submissions:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Submission not found"
+            )
+
+        rows = await EvaluationService.write_evaluations(
+            db, judge, [evaluation_data], overwrite=overwrite
+        )
+        if not rows:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Submission already evaluated by this judge, use PUT to re-score"
+            )
+
+        evaluation = rows[0]
+        await EvaluationService.release_leases(db, judge, [evaluation.submission_id])
+        aggregates = await EvaluationService.refresh_aggregates(db, [evaluation.submission_id])
+        await db.commit()
+
+        await EvaluationService.publish_scored([evaluation.evaluation_id], aggregates)
+        return evaluation, evaluation.created
+
+    @staticmethod
+    async def batch_upsert(
+        db: AsyncSession,
+        judge: AppUser,
+        items: Sequence[EvaluationCreate]
+    ) -> EvaluationBatchResult:
+        """Score many submissions in one transaction with a single multi-row upsert.
+
+        Items naming a missing submission, or a submission already named
+        earlier in the batch, fail individually; the rest are written. The
+        batch size is bounded by EvaluationBatchCreate.
+        """
+        submissions = await EvaluationService.lock_submissions(
+            db, [item.submission_id for item in items]
+        )
+
+        results: List[EvaluationBatchItemResult] = []
+        accepted: Dict[UUID, int] = {}  # submission_id -> index in results
+        for index, item in enumerate(items):
+            result = EvaluationBatchItemResult(
+                index=index, submission_id=item.submission_id, status="error"
+            )
+            if item.submission_id not in submissions:
+                result.detail = "Submission not found"
+            elif item.submission_id in accepted:
+                # ON CONFLICT cannot touch the same row twice in one statement
+                result.detail = f"Duplicate of item {accepted[item.submission_id]}"
+            else:
+                accepted[item.submission_id] = index
+            results.append(result)
+
+        batch = EvaluationBatchResult(results=results)
+        if not accepted:
+            await db.rollback()
+            batch.failed = len(results)
+            return batch
+
+        rows = await EvaluationService.write_evaluations(
+            db, judge, [items[index] for index in accepted.values()]
+        )
+        await EvaluationService.release_leases(db, judge, list(accepted))
+        aggregates = await EvaluationService.refresh_aggregates(db, list(accepted))
+        await db.commit()
+
+        for row in rows:
+            result = results[accepted[row.submission_id]]
+            result.status = "created" if row.created else "updated"
+            result.evaluation = EvaluationSchema.model_validate(row)
+
+        batch.created = sum(1 for result in results if result.status == "created")
+        batch.updated = sum(1 for result in results if result.status == "updated")
+        batch.failed = sum(1 for result in results if result.status == "error")
+
+        await EvaluationService.publish_scored([row.evaluation_id for row in rows], aggregates)
+        return batch
+
+    @staticmethod
+    async def next_submission(
+        db: AsyncSession,
+        judge: AppUser,
+        event_id: Optional[UUID] = None
+    ) -> Optional[EvaluationTask]:
+        """Lease the next submission this judge should review, if any.
+
+        A judge holding an unexpired lease gets the same submission back.
+        Otherwise the least-reviewed pending submission that still needs
+        reviews (counting other judges' live leases) and that the judge has
+        not scored is locked with SKIP LOCKED, so concurrent judges never
+        wait on each other or receive the same slot, and leased until
+        EVALUATION_LEASE_SECONDS from now.
+        """
+        criteria = [
+            Submission.deleted_at.is_(None),
+            Submission.status == SubmissionStatus.PENDING,
+        ]
+        if event_id is not None:
+            criteria.append(Submission.event_id == event_id)
+
+        held_stmt = select(Submission, EvaluationLease.expires_at).join(
+            EvaluationLease,
+            (EvaluationLease.submission_id == Submission.submission_id) &
+            (EvaluationLease.judge_id == judge.user_id) &
+            (EvaluationLease.expires_at > func.now())
+        ).where(*criteria).order_by(EvaluationLease.leased_at).limit(1)
+        held = (await db.execute(held_stmt)).one_or_none()
+        if held is not None:
+            submission, expires_at = held
+            return EvaluationTask(
+                submission=SubmissionSchema.model_validate(submission),
+                lease_expires_at=expires_at
+            )
+
+        live_leases = select(func.count()).where(
+            EvaluationLease.submission_id == Submission.submission_id,
+            EvaluationLease.expires_at > func.now()
+        ).correlate(Submission).scalar_subquery()
+        already_scored = exists().where(
+            Evaluation.submission_id == Submission.submission_id,
+            Evaluation.judge_id == judge.user_id,
+            Evaluation.deleted_at.is_(None)
+        )
+        stmt = select(Submission).where(
+            *criteria,
+            Submission.evaluation_count + live_leases < settings.EVALUATION_REVIEWS_PER_SUBMISSION,
+            ~already_scored
+        ).order_by(
+            Submission.evaluation_count, Submission.submitted_at
+        ).limit(1).with_for_update(of=Submission, skip_locked=True)
+        submission = (await db.execute(stmt)).scalar_one_or_none()
+        if submission is None:
+            await db.rollback()
+            return None
+
+        lease = pg_insert(EvaluationLease).values(
+            submission_id=submission.submission_id,
+            judge_id=judge.user_id,
+            expires_at=func.now() + timedelta(seconds=settings.EVALUATION_LEASE_SECONDS)
+        )
+        lease_stmt = lease.on_conflict_do_update(
+            index_elements=[EvaluationLease.submission_id, EvaluationLease.judge_id],
+            set_={"leased_at": func.now(), "expires_at": lease.excluded.expires_at}
+        ).returning(EvaluationLease.expires_at)
+        expires_at = (await db.execute(lease_stmt)).scalar_one()
+        await db.commit()
+
+        return EvaluationTask(
+            submission=SubmissionSchema.model_validate(submission),
+            lease_expires_at=expires_at
+        )
@@ -0,0 +1,385 @@
+from typing import List, Optional
+from datetime import datetime, timezone
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, func, text
+from sqlalchemy.dialects.postgresql import insert
+from fastapi import HTTPException, status
+from uuid import UUID
+from itertools import chain
+import asyncio
+
+import numpy as np
+
+from app.core.broadcast import broadcaster, event_channel, team_channel
+from app.core.cache import LocalLRUCache, response_cache
+from app.core.config import settings
+from app.models.event import CompetitiveEvent
+from app.models.event_result import EventResult
+from app.models.submission import Submission, SubmissionStatus
+from app.models.evaluation import Evaluation
+from app.models.team import Team
+from app.schemas.event import Event, EventStats, EventResults
+from app.schemas.evaluation import EvaluationRanking
+from app.services.ranking_engine import rank_submissions
+
+# Advisory lock id shared by all workers running the lifecycle scheduler
+EVENT_LIFECYCLE_LOCK_ID = 7_202_601
+
+
+class EventLifecycleService:
+    """Service class for closing finished events and freezing their results."""
+
+    # Snapshots only change when a winner is declared, which invalidates "event"
+    # on every worker, so each worker keeps its own copy (str(event_id) ->
+    # EventResults); only snapshots that exist are cached
+    _results_cache = LocalLRUCache(settings.EVENT_RESULTS_CACHE_MAX_ENTRIES)
+
+    @staticmethod
+    async def compute_stats(db: AsyncSession, event: Event) -> EventStats:
+        """Aggregate submission and evaluation counts for an event."""
+        submission_stmt = select(
+            func.count(Submission.submission_id),
+            func.count().filter(Submission.status == SubmissionStatus.PENDING),
+            func.count().filter(Submission.status == SubmissionStatus.APPROVED),
+            func.count().filter(Submission.status == SubmissionStatus.REJECTED),
+        ).where(
+            Submission.event_id == event.event_id,
+            Submission.deleted_at.is_(None)
+        )
+        total, pending, approved, rejected = (await db.execute(submission_stmt)).one()
+
+        evaluation_stmt = select(
+            func.count(Evaluation.evaluation_id),
+            func.avg(Evaluation.score)
+        ).join(
+            Submission, Submission.submission_id == Evaluation.submission_id
+        ).where(
+            Submission.event_id == event.event_id,
+            Submission.deleted_at.is_(None),
+            Evaluation.deleted_at.is_(None)
+        )
+        total_evaluations, average_score = (await db.execute(evaluation_stmt)).one()
+
+        return EventStats(
+            event_id=event.event_id,
+            title=event.title,
+            total_submissions=total,
+            pending_submissions=pending,
+            approved_submissions=approved,
+            rejected_submissions=rejected,
+            total_evaluations=total_evaluations,
+            average_score=float(average_score) if average_score is not None else None
+        )
+
+    @staticmethod
+    def _build_rankings(rows: List[tuple]) -> List[EvaluationRanking]:
+        """Run the ranking engine over per-submission judge/score arrays."""
+        counts = [len(scores) for _, _, _, scores in rows]
+        total = sum(counts)
+        arrays = rank_submissions(
+            np.repeat(np.arange(len(rows)), counts),
+            np.fromiter(chain.from_iterable(row[2] for row in rows), dtype=np.int64, count=total),
+            np.fromiter(chain.from_iterable(row[3] for row in rows), dtype=np.float64, count=total),
+            len(rows),
+            normalization=settings.RANKING_NORMALIZATION,
+            trim=settings.RANKING_TRIM_FRACTION,
+            confidence=settings.RANKING_CONFIDENCE
+        )
+
+        def optional(value) -> Optional[float]:
+            return None if np.isnan(value) else float(value)
+
+        return [
+            EvaluationRanking(
+                rank=rank,
+                submission_id=rows[index][0],
+                team_name=rows[index][1],
+                average_score=float(arrays.raw_mean[index]),
+                evaluation_count=int(arrays.n_evaluations[index]),
+                score=optional(arrays.score[index]),
+                score_low=optional(arrays.low[index]),
+                score_high=optional(arrays.high[index])
+            )
+            for rank, index in enumerate(arrays.order().tolist(), start=1)
+        ]
+
+    @staticmethod
+    async def compute_rankings(db: AsyncSession, event_id: UUID) -> List[EvaluationRanking]:
+        """Rank an event's non-rejected submissions by judge-normalized score.
+
+        One query returns, per submission, its judges (as dense indices
+        numbered by Postgres) and scores as arrays. The maths runs in the
+        NumPy ranking engine, off the event loop.
+        """
+        scored = select(
+            Evaluation.submission_id,
+            (func.dense_rank().over(order_by=Evaluation.judge_id) - 1).label("judge_index"),
+            Evaluation.score
+        ).join(
+            Submission, Submission.submission_id == Evaluation.submission_id
+        ).where(
+            Submission.event_id == event_id,
+            Submission.deleted_at.is_(None),
+            Submission.status != SubmissionStatus.REJECTED,
+            Evaluation.deleted_at.is_(None)
+        ).subquery("scored")
+
+        stmt = select(
+            Submission.submission_id,
+            Team.name,
+            func.array_agg(scored.c.judge_index),
+            func.array_agg(scored.c.score)
+        ).join(
+            scored, scored.c.submission_id == Submission.submission_id
+        ).join(
+            Team, Team.team_id == Submission.team_id
+        ).group_by(
+            Submission.submission_id, Team.name
+        ).order_by(Submission.submission_id)
+
+        rows = [tuple(row) for row in await db.execute(stmt)]
+        if not rows:
+            return []
+        return await asyncio.to_thread(EventLifecycleService._build_rankings, rows)
+
+    @staticmethod
+    async def finalize_event(db: AsyncSession, event: CompetitiveEvent) -> EventResults:
+        """Close an event's submission window and write its results snapshot (no commit)."""
+        snapshot = Event.model_validate(event)
+        stats = await EventLifecycleService.compute_stats(db, snapshot)
+        rankings = await EventLifecycleService.compute_rankings(db, snapshot.event_id)
+
+        values = {
+            "event_id": snapshot.event_id,
+            "stats": stats.model_dump(mode="json"),
+            "rankings": [ranking.model_dump(mode="json") for ranking in rankings],
+            "winner_team_id": snapshot.winner_team_id,
+        }
+        insert_stmt = insert(EventResult).values(**values)
+        stmt = insert_stmt.on_conflict_do_update(
+            index_elements=[EventResult.event_id],
+            set_={
+                "stats": insert_stmt.excluded.stats,
+                "rankings": insert_stmt.excluded.rankings,
+                "winner_team_id": insert_stmt.excluded.winner_team_id,
+                "updated_at": func.now(),
+            }
+        ).returning(EventResult.finalized_at)
+        finalized_at = (await db.execute(stmt)).scalar_one()
+
+        # Database time, written with the next flush
+        event.closed_at = func.now()  # type: ignore[assignment]
+
+        return EventResults(
+            event_id=snapshot.event_id,
+            stats=stats,
+            rankings=rankings,
+            winner_team_id=snapshot.winner_team_id,
+            finalized_at=finalized_at
+        )
+
+    @staticmethod
+    async def finalize_due_events(db: AsyncSession) -> List[EventResults]:
+        """Finalize every ended event, if this worker wins the advisory lock."""
+        # Transaction-scoped lock: released by the commit below
+        locked = await db.execute(
+            text("SELECT pg_try_advisory_xact_lock(:lock_id)"),
+            {"lock_id": EVENT_LIFECYCLE_LOCK_ID}
+        )
+        if not locked.scalar():
+            await db.rollback()
+            return []
+
+        stmt = select(CompetitiveEvent).where(
+            CompetitiveEvent.end_date <= func.now(),
+            CompetitiveEvent.closed_at.is_(None),
+            CompetitiveEvent.deleted_at.is_(None)
+        ).order_by(
+            CompetitiveEvent.end_date
+        ).with_for_update(skip_locked=True)  # Events being declared are finalized by the declaration
+        events = (await db.execute(stmt)).scalars().all()
+
+        results = [await EventLifecycleService.finalize_event(db, event) for event in events]
+        await db.commit()
+
+        # Warm caches and notify subscribers once the snapshots are durable
+        # (invalidating "event" also drops cached submission windows everywhere)
+        if results:
+            await response_cache.invalidate("event", [r.event_id for r in results])
+            await response_cache.invalidate("leaderboard", [r.event_id for r in results])
+        for event_results in results:
+            EventLifecycleService._results_cache.set(
+                str(event_results.event_id), event_results, settings.EVENT_RESULTS_CACHE_TTL_SECONDS
+            )
+            await broadcaster.publish(
+                event_channel(event_results.event_id),
+                "event.finished",
+                event_results.model_dump()
+            )
+
+        return results
+
+    @staticmethod
+    async def _ranked_winner(db: AsyncSession, rankings: List[EvaluationRanking]) -> UUID:
+        """Team of the top-ranked submission; refuses to break a tie at the top."""
+        if not rankings:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="No ranked submissions, declare a winner explicitly"
+            )
+
+        def key(ranking: EvaluationRanking) -> tuple:
+            # Snapshots frozen before normalized scores existed only have the raw average
+            score = ranking.score if ranking.score is not None else ranking.average_score
+            return score, ranking.evaluation_count
+
+        if len(rankings) > 1 and key(rankings[0]) == key(rankings[1]):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Top rankings are tied, declare a winner explicitly"
+            )
+
+        stmt = select(Submission.team_id).where(
+            Submission.submission_id == rankings[0].submission_id
+        )
+        return (await db.execute(stmt)).scalar_one()
+
+    @staticmethod
+    async def declare_winner(
+        db: AsyncSession,
+        event_id: UUID,
+        winner_team_id: Optional[UUID] = None
+    ) -> EventResults:
+        """Declare an event's winner and freeze it into the results snapshot.
+
+        Without an explicit team the winner is the team of the top-ranked
+        submission in the final rankings. The event row is locked for the
+        whole transaction, so concurrent declarations (and the scheduler)
+        queue behind it and the winner column and snapshot are written
+        together or not at all.
+        """
+        stmt = select(CompetitiveEvent).where(
+            CompetitiveEvent.event_id == event_id,
+            CompetitiveEvent.deleted_at.is_(None)
+        ).with_for_update()
+        event = (await db.execute(stmt)).scalar_one_or_none()
+        if event is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Event not found"
+            )
+        if not event.is_finished:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Event has not finished yet"
+            )
+        if event.winner_team_id is not None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Winner already declared"
+            )
+
+        # Rankings are final once frozen; only freeze them here if the scheduler has not yet
+        finalized = event.closed_at is None
+        if finalized:
+            results = await EventLifecycleService.finalize_event(db, event)
+        else:
+            results = await EventLifecycleService.get_results(db, event_id)
+            if results is None:
+                finalized = True
+                results = await EventLifecycleService.finalize_event(db, event)
+
+        if winner_team_id is None:
+            winner_team_id = await EventLifecycleService._ranked_winner(db, results.rankings)
+        else:
+            stmt = select(Submission.submission_id).where(
+                Submission.event_id == event_id,
+                Submission.team_id == winner_team_id,
+                Submission.deleted_at.is_(None),
+                Submission.status != SubmissionStatus.REJECTED
+            ).limit(1)
+            if (await db.execute(stmt)).scalar_one_or_none() is None:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Team has no eligible submission in this event"
+                )
+
+        event.winner_team_id = winner_team_id
+        stmt = update(EventResult).where(
+            EventResult.event_id == event_id
+        ).values(
+            winner_team_id=winner_team_id,
+            updated_at=func.now()
+        )
+        await db.execute(stmt)
+        await db.commit()
+
+        results = results.model_copy(update={"winner_team_id": winner_team_id})
+        # Drops every worker's copy of the old snapshot before caching the new one
+        await response_cache.invalidate("event", [event_id])
+        await response_cache.invalidate("leaderboard", [event_id])
+        EventLifecycleService._results_cache.set(
+            str(event_id), results, settings.EVENT_RESULTS_CACHE_TTL_SECONDS
+        )
+
+        data = results.model_dump()
+        if finalized:
+            await broadcaster.publish(event_channel(event_id), "event.finished", data)
+        await broadcaster.publish(event_channel(event_id), "event.winner", data)
+        await broadcaster.publish(team_channel(winner_team_id), "event.winner", data)
+
+        return results
+
+    @staticmethod
+    async def next_end_date(db: AsyncSession) -> Optional[datetime]:
+        """Return the end date of the next event still awaiting finalization."""
+        stmt = select(func.min(CompetitiveEvent.end_date)).where(
+            CompetitiveEvent.closed_at.is_(None),
+            CompetitiveEvent.deleted_at.is_(None)
+        )
+        result = await db.execute(stmt)
+        return result.scalar()
+
+    @staticmethod
+    async def get_results(db: AsyncSession, event_id: UUID) -> Optional[EventResults]:
+        """Get a live event's frozen results, from cache when possible (None if deleted)."""
+        cached = EventLifecycleService._results_cache.get(str(event_id))
+        if cached is not None:
+            return cached
+
+        # Deleting an event invalidates "event", which drops its cached snapshot
+        stmt = select(EventResult).join(
+            CompetitiveEvent, CompetitiveEvent.event_id == EventResult.event_id
+        ).where(
+            EventResult.event_id == event_id,
+            CompetitiveEvent.deleted_at.is_(None)
+        )
+        result = await db.execute(stmt)
+        snapshot = result.scalar_one_or_none()
+        if snapshot is None:
+            return None
+
+        event_results = EventResults.model_validate(snapshot)
+        EventLifecycleService._results_cache.set(
+            str(event_id), event_results, settings.EVENT_RESULTS_CACHE_TTL_SECONDS
+        )
+        return event_results
+
+    @staticmethod
+    def seconds_until(moment: Optional[datetime]) -> Optional[float]:
+        """Seconds from now until a timestamp (negative if it has passed)."""
+        if moment is None:
+            return None
+        return (moment - datetime.now(timezone.utc)).total_seconds()
+
+
+def _on_cache_invalidation(entity: str, entity_ids: list):
+    """Drop cached snapshots when any worker writes an event."""
+    if entity == "*":
+        EventLifecycleService._results_cache.clear()
+    elif entity == "event":
+        for event_id in entity_ids:
+            EventLifecycleService._results_cache.delete(event_id)
+
+
+response_cache.add_listener(_on_cache_invalidation)
@@ -0,0 +1,57 @@
+from typing import Optional
+import asyncio
+import logging
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.services.event_lifecycle_service import EventLifecycleService
+
+logger = logging.getLogger(__name__)
+
+
+class EventScheduler:
+    """Background task that finalizes events as soon as they reach end_date."""
+
+    def __init__(self, interval_seconds: int = settings.EVENT_SCHEDULER_INTERVAL_SECONDS):
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the scheduler loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the scheduler loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            delay = self.interval_seconds
+            try:
+                async with AsyncSessionLocal() as db:
+                    finalized = await EventLifecycleService.finalize_due_events(db)
+                    for event_results in finalized:
+                        logger.info(f"Finalized results for event {event_results.event_id}")
+
+                    # Wake up right at the next deadline instead of waiting a full tick
+                    until_next = EventLifecycleService.seconds_until(
+                        await EventLifecycleService.next_end_date(db)
+                    )
+                    if until_next is not None:
+                        delay = min(delay, max(until_next, 0.5))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Event scheduler tick failed: {e}")
+
+            await asyncio.sleep(delay)
+
+
+event_scheduler = EventScheduler()
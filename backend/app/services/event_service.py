@@ -0,0 +1,68 @@
+from typing import List, Optional
+from datetime import datetime, timezone
+from sqlalchemy import ColumnElement, DateTime, func, literal, literal_column, or_
+
+from app.core.config import settings
+from app.models.event import CompetitiveEvent
+from app.schemas.event import EventStatus
+
+
+class EventService:
+    """Service class for event calendar queries."""
+
+    @staticmethod
+    def calendar_now(now: Optional[datetime] = None) -> datetime:
+        """Current time rounded down to EVENT_CALENDAR_GRANULARITY_SECONDS.
+
+        Status filters compare against this instead of the exact time, so
+        every request within one step builds the same list and shares its
+        cache entry. A status change shows up at most one step late.
+        """
+        now = now or datetime.now(timezone.utc)
+        step = settings.EVENT_CALENDAR_GRANULARITY_SECONDS
+        return datetime.fromtimestamp(now.timestamp() // step * step, timezone.utc)
+
+    @staticmethod
+    def as_utc(moment: Optional[datetime]) -> Optional[datetime]:
+        """Aware UTC copy of a calendar bound; naive values are taken as UTC."""
+        if moment is None:
+            return None
+        if moment.tzinfo is None:
+            return moment.replace(tzinfo=timezone.utc)
+        return moment.astimezone(timezone.utc)
+
+    @staticmethod
+    def calendar_criteria(
+        status: Optional[EventStatus] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        now: Optional[datetime] = None
+    ) -> List:
+        """WHERE criteria for the event calendar, in SQL rather than per-row properties.
+
+        Mirrors ``CompetitiveEvent.is_ongoing`` / ``is_finished``. Ongoing
+        and window filters go through the GiST index on the event period,
+        upcoming through the (start_date, end_date) B-tree.
+        """
+        criteria: List[ColumnElement[bool]] = [CompetitiveEvent.deleted_at.is_(None)]
+        moment = literal(now, DateTime(timezone=True))
+        if status == EventStatus.ONGOING:
+            criteria.append(CompetitiveEvent.period().op("@>")(moment))
+        elif status == EventStatus.UPCOMING:
+            criteria.append(CompetitiveEvent.start_date > moment)
+        elif status == EventStatus.FINISHED:
+            criteria.append(or_(
+                CompetitiveEvent.end_date < moment,
+                CompetitiveEvent.closed_at.is_not(None)
+            ))
+
+        if date_from is not None or date_to is not None:
+            # Events overlapping the window; a missing bound leaves that side open
+            window = func.tstzrange(
+                literal(date_from, DateTime(timezone=True)),
+                literal(date_to, DateTime(timezone=True)),
+                literal_column("'[]'")
+            )
+            criteria.append(CompetitiveEvent.period().op("&&")(window))
+
+        return criteria
@@ -0,0 +1,100 @@
+from typing import NamedTuple, Optional
+from datetime import datetime, timezone
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from fastapi import HTTPException, status
+from uuid import UUID
+
+from app.core.cache import LocalLRUCache, response_cache
+from app.core.config import settings
+from app.models.event import CompetitiveEvent
+
+
+class EventWindow(NamedTuple):
+    """Submission window of an event."""
+    start_date: datetime
+    end_date: datetime
+    closed: bool
+    deleted: bool
+
+    def is_open(self, now: datetime) -> bool:
+        return (
+            not self.deleted
+            and not self.closed
+            and self.start_date <= now <= self.end_date
+        )
+
+
+class EventWindowCache:
+    """Process-local map of event -> submission window, read on every submission."""
+
+    # event_id -> EventWindow; unknown events are not cached, so random IDs
+    # cannot fill it
+    _windows = LocalLRUCache(settings.EVENT_WINDOW_CACHE_MAX_ENTRIES)
+
+    @staticmethod
+    async def get(db: AsyncSession, event_id: UUID) -> Optional[EventWindow]:
+        """Get an event's window, loading it on a miss (None if the event does not exist)."""
+        cached = EventWindowCache._windows.get(str(event_id))
+        if cached is not None:
+            return cached
+
+        stmt = select(
+            CompetitiveEvent.start_date,
+            CompetitiveEvent.end_date,
+            CompetitiveEvent.closed_at,
+            CompetitiveEvent.deleted_at
+        ).where(CompetitiveEvent.event_id == event_id)
+        row = (await db.execute(stmt)).one_or_none()
+
+        if row is None:
+            return None
+
+        start_date, end_date, closed_at, deleted_at = row
+        window = EventWindow(start_date, end_date, closed_at is not None, deleted_at is not None)
+        EventWindowCache._windows.set(str(event_id), window, settings.EVENT_WINDOW_CACHE_TTL_SECONDS)
+        return window
+
+    @staticmethod
+    def invalidate(event_id: Optional[UUID] = None):
+        """Drop one cached window, or all of them."""
+        if event_id is None:
+            EventWindowCache._windows.clear()
+        else:
+            EventWindowCache._windows.delete(str(event_id))
+
+    @staticmethod
+    async def require_open(db: AsyncSession, event_id: UUID) -> EventWindow:
+        """Ensure an event exists and is accepting submissions."""
+        window = await EventWindowCache.get(db, event_id)
+        if window is None or window.deleted:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Event not found"
+            )
+
+        now = datetime.now(timezone.utc)
+        if now < window.start_date:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Event has not started yet"
+            )
+        if not window.is_open(now):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Submission window for this event is closed"
+            )
+
+        return window
+
+
+def _on_cache_invalidation(entity: str, entity_ids: list):
+    """Drop cached windows when any worker writes an event."""
+    if entity == "*":
+        EventWindowCache.invalidate()
+    elif entity == "event":
+        for event_id in entity_ids:
+            EventWindowCache.invalidate(UUID(event_id))
+
+
+response_cache.add_listener(_on_cache_invalidation)
@@ -0,0 +1,95 @@
+from typing import Dict, Iterable, List, Optional
+from collections import defaultdict
+from uuid import UUID
+
+from app.core.broadcast import broadcaster, event_channel, team_channel
+from app.core.cache import response_cache
+from app.models.submission import Submission, SubmissionStatus
+from app.schemas.submission import Submission as SubmissionSchema
+
+
+class LiveUpdateService:
+    """Service class for pushing live updates to subscribed dashboards."""
+
+    @staticmethod
+    async def submission_created(submission: Submission):
+        """Announce a new submission to its team and event."""
+        created = SubmissionSchema.model_validate(submission)
+        data = {
+            "submission_id": created.submission_id,
+            "team_id": created.team_id,
+            "event_id": created.event_id,
+            "status": created.status.value,
+            "submitted_at": created.submitted_at,
+        }
+        await broadcaster.publish(team_channel(created.team_id), "submission.created", data)
+        await broadcaster.publish(event_channel(created.event_id), "submission.created", data)
+
+    @staticmethod
+    async def status_changed(
+        submission_id: UUID,
+        team_id: UUID,
+        event_id: UUID,
+        old_status: SubmissionStatus,
+        new_status: SubmissionStatus
+    ):
+        """Announce a submission status transition."""
+        data = {
+            "submission_id": submission_id,
+            "team_id": team_id,
+            "event_id": event_id,
+            "old_status": old_status.value,
+            "new_status": new_status.value,
+        }
+        await broadcaster.publish(team_channel(team_id), "submission.status", data)
+        await broadcaster.publish(event_channel(event_id), "submission.status", data)
+
+    @staticmethod
+    async def statuses_changed(
+        submissions: Iterable,
+        old_status: SubmissionStatus,
+        new_status: SubmissionStatus
+    ):
+        """Announce a bulk status transition: one message per affected team and event.
+
+        ``submissions`` are rows with ``submission_id``, ``team_id`` and ``event_id``.
+        """
+        by_team: Dict[UUID, List[dict]] = defaultdict(list)
+        by_event: Dict[UUID, List[dict]] = defaultdict(list)
+        for row in submissions:
+            change = {
+                "submission_id": row.submission_id,
+                "team_id": row.team_id,
+                "event_id": row.event_id,
+            }
+            by_team[row.team_id].append(change)
+            by_event[row.event_id].append(change)
+
+        statuses = {"old_status": old_status.value, "new_status": new_status.value}
+        for team_id, changes in by_team.items():
+            data = {"team_id": team_id, **statuses, "submissions": changes}
+            await broadcaster.publish(team_channel(team_id), "submission.status.batch", data)
+        for event_id, changes in by_event.items():
+            data = {"event_id": event_id, **statuses, "submissions": changes}
+            await broadcaster.publish(event_channel(event_id), "submission.status.batch", data)
+
+    @staticmethod
+    async def submission_scored(
+        submission_id: UUID,
+        team_id: UUID,
+        event_id: UUID,
+        average_score: Optional[float],
+        evaluation_count: int
+    ):
+        """Publish the updated score aggregate of a submission as a leaderboard delta."""
+        await response_cache.invalidate("leaderboard", [event_id])
+        
+        data = {
+            "submission_id": submission_id,
+            "team_id": team_id,
+            "event_id": event_id,
+            "average_score": average_score,
+            "evaluation_count": evaluation_count,
+        }
+        await broadcaster.publish(event_channel(event_id), "leaderboard", data)
+        await broadcaster.publish(team_channel(team_id), "leaderboard", data)
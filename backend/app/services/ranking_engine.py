@@ -0,0 +1,258 @@
+"""Judge-score normalization and ranking engine.
+
+Raw scores are not comparable across judges: a lenient judge's 80 may be a
+strict judge's 60. Before submissions are compared, each judge's scores are
+therefore normalized:
+
+* ``zscore``: standardize per judge, then map back onto the 0-100 scale using
+  the event-wide mean and standard deviation, so numbers still read as scores.
+  A judge whose scores are all equal contributes the event-wide mean.
+* ``rank``: replace each score by its percentile among the judge's own scores
+  (ties share their average position). A judge with one score gives 50.
+* ``none``: keep raw scores.
+
+A submission's score is the trimmed mean of its normalized scores. The
+confidence interval comes from the winsorized standard error of that trimmed
+mean (Tukey-McLaughlin) and a normal quantile.
+
+``rank_submissions`` is vectorized with NumPy. ``rank_submissions_reference``
+is a plain Python version of the same maths, used to check it.
+"""
+from typing import Dict, List, NamedTuple, Optional, Sequence
+from collections import defaultdict
+from statistics import NormalDist
+import math
+
+import numpy as np
+import numpy.typing as npt
+
+NORMALIZATIONS = ("zscore", "rank", "none")
+
+
+class RankingArrays(NamedTuple):
+    """Per-submission results, indexed by submission index.
+
+    ``score``, ``low`` and ``high`` are NaN where they are undefined: no
+    scores left after trimming, or fewer than two scores for an interval.
+    """
+    n_evaluations: np.ndarray
+    raw_mean: np.ndarray
+    score: np.ndarray
+    low: np.ndarray
+    high: np.ndarray
+
+    def order(self) -> np.ndarray:
+        """Submission indices, best first: by score, then by evaluation count."""
+        score = np.where(np.isnan(self.score), -np.inf, self.score)
+        # lexsort sorts by its last key first; stable, so full ties keep index order
+        return np.lexsort((-self.n_evaluations, -score))
+
+
+def _check_options(normalization: str, trim: float, confidence: float):
+    if normalization not in NORMALIZATIONS:
+        raise ValueError(f"normalization must be one of {', '.join(NORMALIZATIONS)}")
+    if not 0 <= trim < 0.5:
+        raise ValueError("trim must be in [0, 0.5)")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be in (0, 1)")
+
+
+def _zscore(judge: np.ndarray, scores: np.ndarray) -> np.ndarray:
+    judges = int(judge.max()) + 1
+    counts = np.bincount(judge, minlength=judges)
+    means = np.bincount(judge, weights=scores, minlength=judges) / np.maximum(counts, 1)
+    centered = scores - means[judge]
+    spread = np.sqrt(np.bincount(judge, weights=centered ** 2, minlength=judges) / np.maximum(counts, 1))
+    spread = spread[judge]
+    z = np.divide(centered, spread, out=np.zeros_like(centered), where=spread > 0)
+    return scores.mean() + z * scores.std()
+
+
+def _percentile_rank(judge: np.ndarray, scores: np.ndarray) -> np.ndarray:
+    n = len(scores)
+    order = np.lexsort((scores, judge))
+    sorted_judge = judge[order]
+    sorted_scores = scores[order]
+
+    # Runs of equal (judge, score) share the average of their positions
+    new_run = np.ones(n, dtype=bool)
+    new_run[1:] = (sorted_judge[1:] != sorted_judge[:-1]) | (sorted_scores[1:] != sorted_scores[:-1])
+    run_start = np.flatnonzero(new_run)
+    run_end = np.append(run_start[1:], n)
+    run_position = (run_start + run_end - 1) / 2
+    run_id = np.cumsum(new_run) - 1
+
+    counts = np.bincount(judge)
+    judge_start = np.cumsum(counts) - counts
+    position = run_position[run_id] - judge_start[sorted_judge]
+    denominator = (counts[sorted_judge] - 1).astype(np.float64)
+    percentile = np.divide(
+        position * 100, denominator, out=np.full(n, 50.0), where=denominator > 0
+    )
+
+    result = np.empty(n)
+    result[order] = percentile
+    return result
+
+
+def rank_submissions(
+    submission_index: npt.ArrayLike,
+    judge_index: npt.ArrayLike,
+    scores: npt.ArrayLike,
+    submissions: int,
+    normalization: str = "zscore",
+    trim: float = 0.1,
+    confidence: float = 0.95
+) -> RankingArrays:
+    """Normalize scores per judge and aggregate them per submission.
+
+    The three arrays are parallel columns, one entry per evaluation.
+    Indices are dense, from 0 to ``submissions - 1`` and from 0 to the
+    number of judges minus 1.
+    """
+    _check_options(normalization, trim, confidence)
+    submission = np.asarray(submission_index, dtype=np.int64)
+    judge = np.asarray(judge_index, dtype=np.int64)
+    raw = np.asarray(scores, dtype=np.float64)
+
+    counts = np.bincount(submission, minlength=submissions)
+    nan = np.full(submissions, np.nan)
+    if len(raw) == 0:
+        return RankingArrays(counts, nan, nan.copy(), nan.copy(), nan.copy())
+
+    raw_mean = np.divide(
+        np.bincount(submission, weights=raw, minlength=submissions), counts,
+        out=nan.copy(), where=counts > 0
+    )
+
+    if normalization == "zscore":
+        values = _zscore(judge, raw)
+    elif normalization == "rank":
+        values = _percentile_rank(judge, raw)
+    else:
+        values = raw
+
+    # Sort each submission's values to find its trimmed and winsorized range
+    order = np.lexsort((values, submission))
+    sorted_submission = submission[order]
+    sorted_values = values[order]
+    starts = np.cumsum(counts) - counts
+    position = np.arange(len(sorted_values)) - starts[sorted_submission]
+
+    cut = np.floor(trim * counts).astype(np.int64)
+    kept_counts = counts - 2 * cut
+    row_cut = cut[sorted_submission]
+    kept = (position >= row_cut) & (position < counts[sorted_submission] - row_cut)
+    trimmed_sum = np.bincount(
+        sorted_submission[kept], weights=sorted_values[kept], minlength=submissions
+    )
+    score = np.divide(trimmed_sum, kept_counts, out=nan.copy(), where=kept_counts > 0)
+
+    last = len(sorted_values) - 1
+    lowest = sorted_values[np.clip(starts + cut, 0, last)]
+    highest = sorted_values[np.clip(starts + counts - cut - 1, 0, last)]
+    winsorized = np.clip(sorted_values, lowest[sorted_submission], highest[sorted_submission])
+    winsorized_mean = np.bincount(sorted_submission, weights=winsorized, minlength=submissions) / np.maximum(counts, 1)
+    squares = np.bincount(
+        sorted_submission,
+        weights=(winsorized - winsorized_mean[sorted_submission]) ** 2,
+        minlength=submissions
+    )
+    spread = counts > 1
+    variance = np.divide(squares, counts - 1, out=nan.copy(), where=spread)
+    standard_error = np.divide(
+        np.sqrt(variance) * np.sqrt(counts), kept_counts, out=nan.copy(), where=spread
+    )
+
+    quantile = NormalDist().inv_cdf(0.5 + confidence / 2)
+    return RankingArrays(
+        counts,
+        raw_mean,
+        score,
+        score - quantile * standard_error,
+        score + quantile * standard_error
+    )
+
+
+class ReferenceRanking(NamedTuple):
+    n_evaluations: List[int]
+    raw_mean: List[Optional[float]]
+    score: List[Optional[float]]
+    low: List[Optional[float]]
+    high: List[Optional[float]]
+
+
+def rank_submissions_reference(
+    submission_index: Sequence[int],
+    judge_index: Sequence[int],
+    scores: Sequence[float],
+    submissions: int,
+    normalization: str = "zscore",
+    trim: float = 0.1,
+    confidence: float = 0.95
+) -> ReferenceRanking:
+    """Pure Python equivalent of ``rank_submissions``, with ``None`` for NaN."""
+    _check_options(normalization, trim, confidence)
+    scores = [float(score) for score in scores]
+
+    by_judge: Dict[int, List[int]] = defaultdict(list)
+    for row, judge in enumerate(judge_index):
+        by_judge[judge].append(row)
+
+    values = list(scores)
+    if normalization == "zscore" and scores:
+        overall_mean = sum(scores) / len(scores)
+        overall_spread = math.sqrt(sum((s - overall_mean) ** 2 for s in scores) / len(scores))
+        for rows in by_judge.values():
+            judge_scores = [scores[row] for row in rows]
+            mean = sum(judge_scores) / len(rows)
+            spread = math.sqrt(sum((s - mean) ** 2 for s in judge_scores) / len(rows))
+            for row in rows:
+                z = (scores[row] - mean) / spread if spread > 0 else 0.0
+                values[row] = overall_mean + z * overall_spread
+    elif normalization == "rank":
+        for rows in by_judge.values():
+            ordered = sorted(scores[row] for row in rows)
+            first: Dict[float, int] = {}
+            last: Dict[float, int] = {}
+            for position, score in enumerate(ordered):
+                first.setdefault(score, position)
+                last[score] = position
+            for row in rows:
+                if len(rows) == 1:
+                    values[row] = 50.0
+                else:
+                    middle = (first[scores[row]] + last[scores[row]]) / 2
+                    values[row] = middle * 100 / (len(rows) - 1)
+
+    by_submission: Dict[int, List[int]] = defaultdict(list)
+    for row, submission in enumerate(submission_index):
+        by_submission[submission].append(row)
+
+    quantile = NormalDist().inv_cdf(0.5 + confidence / 2)
+    result = ReferenceRanking([], [], [], [], [])
+    for submission in range(submissions):
+        rows = by_submission.get(submission, [])
+        n = len(rows)
+        result.n_evaluations.append(n)
+        result.raw_mean.append(sum(scores[row] for row in rows) / n if n else None)
+
+        ordered = sorted(values[row] for row in rows)
+        cut = math.floor(trim * n)
+        kept = ordered[cut:n - cut]
+        trimmed_mean = sum(kept) / len(kept) if kept else None
+        result.score.append(trimmed_mean)
+
+        if trimmed_mean is None or n < 2:
+            result.low.append(None)
+            result.high.append(None)
+            continue
+        lowest, highest = ordered[cut], ordered[n - cut - 1]
+        winsorized = [min(max(value, lowest), highest) for value in ordered]
+        mean = sum(winsorized) / n
+        spread = math.sqrt(sum((value - mean) ** 2 for value in winsorized) / (n - 1))
+        standard_error = spread * math.sqrt(n) / len(kept)
+        result.low.append(trimmed_mean - quantile * standard_error)
+        result.high.append(trimmed_mean + quantile * standard_error)
+
+    return result
@@ -0,0 +1,169 @@
+from typing import Iterable, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import ColumnElement, select, func, or_, case, literal, literal_column
+from sqlalchemy.orm import aliased
+import re
+
+from app.models.event import CompetitiveEvent
+from app.models.team import Team
+from app.models.user import AppUser, UserRole
+from app.schemas.search import SearchHit, SearchResults, SearchType
+from app.schemas.team import TeamSummary
+
+_WORD = re.compile(r"[^\W_]+")  # Letters and digits; "_" is a tsquery-parser separator
+
+# Same configuration as the generated search_vector columns (no stemming, any language)
+SEARCH_CONFIG: ColumnElement[str] = literal_column("'simple'::regconfig")
+
+# Added to the trigram score of rows whose words start with the query's words,
+# so prefix matches rank above fuzzy ones
+PREFIX_MATCH_BONUS = 1.0
+
+
+class SearchService:
+    """Service class for full-text and fuzzy search."""
+
+    @staticmethod
+    def prefix_tsquery(query: str) -> Optional[str]:
+        """Turn free text into a tsquery matching every word as a prefix.
+
+        Only word characters are kept, so user input can never produce
+        tsquery syntax: ``"kaz rock!"`` becomes ``"kaz:* & rock:*"``.
+        """
+        words = _WORD.findall(query.lower())
+        if not words:
+            return None
+        return " & ".join(f"{word}:*" for word in words)
+
+    @staticmethod
+    def _match(vector, columns: list, query: str):
+        """WHERE clause and score for one entity.
+
+        A row matches when its tsvector matches every query word as a prefix
+        or, to forgive typos, when a column is trigram-similar to the query
+        (``<%``, word similarity). Both are answered from GIN indexes.
+        """
+        text = literal(query)
+        clauses = [text.op("<%")(column) for column in columns]
+        score: ColumnElement[float] = func.greatest(*[func.word_similarity(text, column) for column in columns])
+
+        tsquery = SearchService.prefix_tsquery(query)
+        if tsquery is not None:
+            matches = vector.op("@@")(func.to_tsquery(SEARCH_CONFIG, tsquery))
+            clauses.append(matches)
+            score = score + case((matches, PREFIX_MATCH_BONUS), else_=0.0)
+
+        return or_(*clauses), score
+
+    @staticmethod
+    async def _search_teams(db: AsyncSession, query: str, limit: int) -> List[SearchHit]:
+        condition, score = SearchService._match(Team.search_vector, [Team.name], query)
+        stmt = select(Team.team_id, Team.name, score.label("score")).where(
+            Team.deleted_at.is_(None),
+            condition
+        ).order_by(score.desc(), Team.name).limit(limit)
+
+        return [
+            SearchHit(type="team", id=row.team_id, title=row.name, score=row.score)
+            for row in await db.execute(stmt)
+        ]
+
+    @staticmethod
+    async def _search_users(db: AsyncSession, query: str, limit: int) -> List[SearchHit]:
+        condition, score = SearchService._match(
+            AppUser.search_vector, [AppUser.name, AppUser.email], query
+        )
+        stmt = select(AppUser.user_id, AppUser.name, AppUser.email, score.label("score")).where(
+            AppUser.deleted_at.is_(None),
+            condition
+        ).order_by(score.desc(), AppUser.name).limit(limit)
+
+        return [
+            SearchHit(type="user", id=row.user_id, title=row.name, subtitle=row.email, score=row.score)
+            for row in await db.execute(stmt)
+        ]
+
+    @staticmethod
+    async def _search_events(db: AsyncSession, query: str, limit: int) -> List[SearchHit]:
+        condition, score = SearchService._match(
+            CompetitiveEvent.search_vector, [CompetitiveEvent.title], query
+        )
+        stmt = select(CompetitiveEvent.event_id, CompetitiveEvent.title, score.label("score")).where(
+            CompetitiveEvent.deleted_at.is_(None),
+            condition
+        ).order_by(score.desc(), CompetitiveEvent.start_date.desc()).limit(limit)
+
+        return [
+            SearchHit(type="event", id=row.event_id, title=row.title, score=row.score)
+            for row in await db.execute(stmt)
+        ]
+
+    @staticmethod
+    def visible_types(user: AppUser) -> List[SearchType]:
+        """Entity types a user may search; user accounts are organizer-only, as in GET /users."""
+        if user.role == UserRole.ORGANIZER:
+            return ["team", "user", "event"]
+        return ["team", "event"]
+
+    @staticmethod
+    async def search(
+        db: AsyncSession,
+        user: AppUser,
+        query: str,
+        types: Optional[Iterable[SearchType]] = None,
+        limit: int = 10
+    ) -> SearchResults:
+        """Search teams, users and events the user may see, best matches first."""
+        allowed = SearchService.visible_types(user)
+        requested = set(types) if types is not None else set(allowed)
+        wanted = [search_type for search_type in allowed if search_type in requested]
+        searches = {
+            "team": SearchService._search_teams,
+            "user": SearchService._search_users,
+            "event": SearchService._search_events,
+        }
+
+        hits: List[SearchHit] = []
+        for search_type in wanted:
+            hits.extend(await searches[search_type](db, query, limit))
+        hits.sort(key=lambda hit: hit.score, reverse=True)
+
+        return SearchResults(query=query, results=hits[:limit])
+
+    @staticmethod
+    async def autocomplete_teams(db: AsyncSession, query: str, limit: int = 8) -> List[TeamSummary]:
+        """Suggest teams to join as the user types.
+
+        Names starting with the text come first, then names with a word
+        starting with each typed word, shortest names first. The captain name
+        and member count come from the same query, so the join picker needs
+        no follow-up requests.
+        """
+        escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        starts_with = Team.name.ilike(f"{escaped}%")  # Served by the trigram index
+        clauses = [starts_with]
+        tsquery = SearchService.prefix_tsquery(query)
+        if tsquery is not None:
+            clauses.append(Team.search_vector.op("@@")(func.to_tsquery(SEARCH_CONFIG, tsquery)))
+
+        member_count = select(func.count(AppUser.user_id)).where(
+            AppUser.team_id == Team.team_id,
+            AppUser.deleted_at.is_(None)
+        ).correlate(Team).scalar_subquery()
+
+        captain = aliased(AppUser)
+        stmt = select(
+            Team.team_id,
+            Team.name,
+            captain.name.label("captain_name"),
+            member_count.label("member_count")
+        ).join(
+            captain, captain.user_id == Team.captain_id
+        ).where(
+            Team.deleted_at.is_(None),
+            or_(*clauses)
+        ).order_by(
+            starts_with.desc(), func.length(Team.name), Team.name
+        ).limit(limit)
+
+        return [TeamSummary.model_validate(row) for row in await db.execute(stmt)]
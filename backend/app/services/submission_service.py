@@ -0,0 +1,149 @@
+from typing import List, Sequence
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, insert, update, literal, bindparam, any_, cast
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+
+from app.core.cache import response_cache
+from app.core.loader import Loaders
+from app.models.event import CompetitiveEvent
+from app.models.submission import Submission, SubmissionStatus
+from app.models.submission_status_change import SubmissionStatusChange
+from app.models.team import Team
+from app.models.user import AppUser
+from app.schemas.submission import (
+    SubmissionBulkStatusUpdate, SubmissionBulkStatusResult, SubmissionStatusFilter,
+    SubmissionWithDetails, Submission as SubmissionSchema
+)
+from app.services.live_update_service import LiveUpdateService
+import asyncio
+
+
+class SubmissionService:
+    """Service class for submission operations."""
+
+    @staticmethod
+    async def with_details(loaders: Loaders, submission: Submission) -> SubmissionWithDetails:
+        """Submission with its team name and event title, resolved through the loaders."""
+        team, event = await asyncio.gather(
+            loaders.get(Team).require(submission.team_id),
+            loaders.get(CompetitiveEvent).require(submission.event_id)
+        )
+        return SubmissionWithDetails.model_validate({
+            **SubmissionSchema.model_validate(submission).model_dump(),
+            "team_name": team.name,
+            "event_title": event.title,
+            "average_score": submission.average_score,
+            "evaluation_count": submission.evaluation_count,
+        })
+
+    @staticmethod
+    async def list_with_details(
+        loaders: Loaders,
+        submissions: Sequence[Submission]
+    ) -> List[SubmissionWithDetails]:
+        """Build every submission concurrently, so each loader runs one query for the page."""
+        return list(await asyncio.gather(
+            *(SubmissionService.with_details(loaders, submission) for submission in submissions)
+        ))
+
+    @staticmethod
+    def _filter_criteria(table, status_filter: SubmissionStatusFilter) -> list:
+        criteria = []
+        if status_filter.event_id is not None:
+            criteria.append(table.c.event_id == status_filter.event_id)
+        if status_filter.team_id is not None:
+            criteria.append(table.c.team_id == status_filter.team_id)
+        if status_filter.min_evaluations is not None:
+            criteria.append(table.c.evaluation_count >= status_filter.min_evaluations)
+        # Averages compared as totals, so the stored aggregates need no division
+        if status_filter.min_average_score is not None:
+            criteria.append(table.c.evaluation_count > 0)
+            criteria.append(
+                table.c.score_total >= status_filter.min_average_score * table.c.evaluation_count
+            )
+        if status_filter.max_average_score is not None:
+            criteria.append(table.c.evaluation_count > 0)
+            criteria.append(
+                table.c.score_total <= status_filter.max_average_score * table.c.evaluation_count
+            )
+        return criteria
+
+    @staticmethod
+    async def bulk_transition(
+        db: AsyncSession,
+        update_data: SubmissionBulkStatusUpdate,
+        organizer: AppUser
+    ) -> SubmissionBulkStatusResult:
+        """Move pending submissions to APPROVED or REJECTED in one statement.
+
+        The UPDATE only matches rows that are still PENDING, so submissions
+        another organizer decided in the meantime are skipped rather than
+        overwritten. An audit row per transition is written by the same
+        statement, so the round trips do not grow with the batch.
+        """
+        table = Submission.__table__
+        criteria = [
+            table.c.status == SubmissionStatus.PENDING,
+            table.c.deleted_at.is_(None),
+        ]
+        if update_data.submission_ids is not None:
+            # One array parameter, however many IDs are sent
+            criteria.append(table.c.submission_id == any_(bindparam(
+                "submission_ids",
+                list(set(update_data.submission_ids)),
+                type_=ARRAY(PG_UUID(as_uuid=True))
+            )))
+        elif update_data.filter is not None:
+            # The schema requires one of submission_ids and filter
+            criteria.extend(SubmissionService._filter_criteria(table, update_data.filter))
+
+        updated = update(table).where(*criteria).values(
+            status=update_data.status
+        ).returning(
+            table.c.submission_id,
+            table.c.team_id,
+            table.c.event_id
+        ).cte("updated")
+
+        changes = SubmissionStatusChange.__table__
+        logged = insert(changes).from_select(
+            ["submission_id", "old_status", "new_status", "changed_by"],
+            # Explicit casts, Postgres does not infer SELECT-list parameter types
+            select(
+                updated.c.submission_id,
+                cast(literal(SubmissionStatus.PENDING.value), changes.c.old_status.type),
+                cast(literal(update_data.status.value), changes.c.new_status.type),
+                cast(literal(organizer.user_id), changes.c.changed_by.type)
+            )
+        ).cte("logged")
+
+        stmt = select(
+            updated.c.submission_id,
+            updated.c.team_id,
+            updated.c.event_id
+        ).add_cte(updated, logged)
+        rows = list(await db.execute(stmt))
+        await db.commit()
+
+        result = SubmissionBulkStatusResult(
+            status=update_data.status,
+            updated=len(rows),
+            submission_ids=[row.submission_id for row in rows]
+        )
+        if update_data.submission_ids is not None:
+            changed = set(result.submission_ids)
+            result.skipped_ids = [
+                submission_id for submission_id in dict.fromkeys(update_data.submission_ids)
+                if submission_id not in changed
+            ]
+            result.skipped = len(result.skipped_ids)
+
+        if rows:
+            await response_cache.invalidate("submission", result.submission_ids)
+            # Rejected submissions drop out of the rankings
+            await response_cache.invalidate("leaderboard", {row.event_id for row in rows})
+            await LiveUpdateService.statuses_changed(
+                rows, SubmissionStatus.PENDING, update_data.status
+            )
+
+        return result
@@ -1,13 +1,19 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, insert, update, func
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import selectinload, aliased
+from sqlalchemy.orm.attributes import set_committed_value
 from fastapi import HTTPException, status
-from uuid import UUID
+from uuid import UUID, uuid4
 
+from app.core.cache import response_cache
+from app.core.fields import project, fetch_fields
+from app.core.lookup import any_id
+from app.core.query_cache import cached
 from app.models.team import Team
 from app.models.user import AppUser, UserRole
-from app.schemas.team import TeamCreate, TeamUpdate
+from app.schemas.team import Team as TeamSchema, TeamCreate, TeamUpdate, TeamWithMembers, TeamSummary
 
 
 class TeamService:
@@ -30,23 +36,80 @@ class TeamService:
                 detail="Captain is already in a team"
             )
         
-        # Create team
-        team = Team(
+        # Create team, server defaults come back with the insert
+        stmt = insert(Team).values(
+            team_id=uuid4(),
             name=team_data.name,
             captain_id=captain.user_id
-        )
-        
-        db.add(team)
-        await db.flush()  # Get team_id without committing
+        ).returning(Team)
+        team = (await db.execute(stmt)).scalar_one()
         
-        # Add captain to team
-        captain.team_id = team.team_id
+        # Add captain to team unless a concurrent request got there first
+        join_stmt = update(AppUser).where(
+            AppUser.user_id == captain.user_id,
+            AppUser.team_id.is_(None),
+            AppUser.deleted_at.is_(None)
+        ).values(
+            team_id=team.team_id
+        ).returning(AppUser.user_id).execution_options(synchronize_session=False)
+        if (await db.execute(join_stmt)).scalar_one_or_none() is None:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Captain is already in a team"
+            )
         
         await db.commit()
-        await db.refresh(team)
+        set_committed_value(captain, "team_id", team.team_id)
+        # The captain is the only member, so the response needs no reload
+        set_committed_value(team, "captain", captain)
+        set_committed_value(team, "members", [captain])
+        await response_cache.invalidate("team", [team.team_id])
+        await response_cache.invalidate("user", [captain.user_id])
         
         return team
     
+    @staticmethod
+    def to_team_with_members(team: Team) -> TeamWithMembers:
+        """Build the team response with member details (captain and members loaded)."""
+        team_dict = TeamSchema.model_validate(team).model_dump()
+        team_dict["captain_name"] = team.captain.name
+        team_dict["members"] = [
+            {
+                "user_id": member.user_id,
+                "name": member.name,
+                "email": member.email,
+                "role": member.role.value
+            }
+            for member in team.members
+        ]
+        team_dict["member_count"] = len(team.members)
+        
+        return TeamWithMembers(**team_dict)
+    
+    @staticmethod
+    def to_team_summary(team: Team) -> TeamSummary:
+        """Build the team list entry (captain and members loaded)."""
+        return TeamSummary.model_validate({
+            "team_id": team.team_id,
+            "name": team.name,
+            "captain_name": team.captain.name,
+            "member_count": len(team.members),
+        })
+    
+    @staticmethod
+    async def get_teams_by_ids(db: AsyncSession, team_ids: List[UUID]) -> List[Team]:
+        """Get the active teams among the given IDs, with members, in one query."""
+        stmt = select(Team).options(
+            selectinload(Team.captain),
+            selectinload(Team.members)
+        ).where(
+            any_id(Team.team_id, team_ids),
+            Team.deleted_at.is_(None)
+        )
+        result = await db.execute(stmt)
+        return list(result.scalars().all())
+    
     @staticmethod
     async def get_team_by_id(db: AsyncSession, team_id: UUID) -> Optional[Team]:
         """Get team by ID with members."""
@@ -57,7 +120,7 @@ class TeamService:
             Team.team_id == team_id,
             Team.deleted_at.is_(None)
         )
-        result = await db.execute(stmt)
+        result = await db.execute(cached(stmt))
         return result.scalar_one_or_none()
     
     @staticmethod
@@ -77,6 +140,33 @@ class TeamService:
         result = await db.execute(stmt)
         return list(result.scalars().all())
     
+    @staticmethod
+    async def get_team_summary_fields(
+        db: AsyncSession,
+        fields: Sequence[str],
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[dict]:
+        """Get team summaries with only the given fields.
+        
+        The captain is joined and members counted only when those fields are
+        requested; member rows are never loaded.
+        """
+        captain = aliased(AppUser)
+        member_count = select(func.count(AppUser.user_id)).where(
+            AppUser.team_id == Team.team_id
+        ).correlate(Team).scalar_subquery()
+        
+        stmt = project(Team, fields, {
+            "captain_name": captain.name,
+            "member_count": member_count,
+        }).select_from(Team)
+        if "captain_name" in fields:
+            stmt = stmt.join(captain, captain.user_id == Team.captain_id)
+        stmt = stmt.where(Team.deleted_at.is_(None)).offset(skip).limit(limit)
+        
+        return await fetch_fields(db, stmt)
+    
     @staticmethod
     async def update_team(
         db: AsyncSession,
@@ -123,12 +213,13 @@ class TeamService:
         
         await db.commit()
         await db.refresh(team)
+        await response_cache.invalidate("team", [team_id])
         
         return team
     
     @staticmethod
-    async def join_team(db: AsyncSession, team_id: UUID, user: AppUser) -> Team:
-        """Add user to team."""
+    async def join_team(db: AsyncSession, team_id: UUID, user: AppUser) -> Row:
+        """Add user to team, returning the team's ID and name."""
         # Validate user is a participant
         if user.role != UserRole.PARTICIPANT:
             raise HTTPException(
@@ -143,20 +234,37 @@ class TeamService:
                 detail="User is already in a team"
             )
         
-        # Get team
-        team = await TeamService.get_team_by_id(db, team_id)
-        if not team:
+        # Join only an active team, and only if still teamless. Issued against
+        # the table since ORM UPDATE cannot return columns of the FROM table.
+        stmt = update(AppUser.__table__).where(
+            AppUser.user_id == user.user_id,
+            AppUser.team_id.is_(None),
+            AppUser.deleted_at.is_(None),
+            Team.team_id == team_id,
+            Team.deleted_at.is_(None)
+        ).values(
+            team_id=team_id
+        ).returning(Team.team_id, Team.name)
+        team = (await db.execute(stmt)).one_or_none()
+        
+        if team is None:
+            await db.rollback()
+            # Work out which condition failed only on the error path
+            if await TeamService.get_team_by_id(db, team_id) is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Team not found"
+                )
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Team not found"
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="User is already in a team"
             )
         
-        # Add user to team
-        user.team_id = team_id
         await db.commit()
+        set_committed_value(user, "team_id", team_id)
+        await response_cache.invalidate("team", [team_id])
+        await response_cache.invalidate("user", [user.user_id])
         
-        # Refresh team with updated members
-        await db.refresh(team)
         return team
     
     @staticmethod
@@ -199,32 +307,37 @@ class TeamService:
         # Remove user from team
         user.team_id = None
         await db.commit()
+        await response_cache.invalidate("team", [team.team_id])
+        await response_cache.invalidate("user", [user.user_id])
         
         return True
     
     @staticmethod
     async def delete_team(db: AsyncSession, team_id: UUID) -> bool:
         """Soft delete team."""
-        team = await TeamService.get_team_by_id(db, team_id)
-        if not team:
+        stmt = update(Team).where(
+            Team.team_id == team_id,
+            Team.deleted_at.is_(None)
+        ).values(
+            deleted_at=func.now()
+        ).returning(Team.team_id).execution_options(synchronize_session=False)
+        if (await db.execute(stmt)).scalar_one_or_none() is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Team not found"
             )
         
         # Remove all members from team
-        stmt = select(AppUser).where(
+        stmt = update(AppUser).where(
             AppUser.team_id == team_id,
             AppUser.deleted_at.is_(None)
-        )
-        result = await db.execute(stmt)
-        members = result.scalars().all()
-        
-        for member in members:
-            member.team_id = None
+        ).values(
+            team_id=None
+        ).returning(AppUser.user_id).execution_options(synchronize_session=False)
+        member_ids = (await db.execute(stmt)).scalars().all()
         
-        # Soft delete team
-        team.soft_delete()
         await db.commit()
+        await response_cache.invalidate("team", [team_id])
+        await response_cache.invalidate("user", member_ids)
         
         return True
\ No newline at end of file
@@ -1,10 +1,12 @@
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, func
 from sqlalchemy.orm import selectinload
 from fastapi import HTTPException, status
 from uuid import UUID
 
+from app.core.cache import response_cache
+from app.core.query_cache import cached
 from app.models.user import AppUser, UserRole
 from app.models.team import Team
 from app.schemas.user import UserCreate, UserUpdate
@@ -43,6 +45,7 @@ class UserService:
         db.add(user)
         await db.commit()
         await db.refresh(user)
+        await response_cache.invalidate("user", [user.user_id])
         
         return user
     
@@ -70,7 +73,7 @@ class UserService:
             AppUser.user_id == user_id,
             AppUser.deleted_at.is_(None)
         )
-        result = await db.execute(stmt)
+        result = await db.execute(cached(stmt))
         return result.scalar_one_or_none()
     
     @staticmethod
@@ -123,9 +126,12 @@ class UserService:
                 detail="Not enough permissions"
             )
         
+        previous_team_id = user.team_id
+        values: Dict[str, Any] = {}
+        
         # Update fields
         if user_data.name is not None:
-            user.name = user_data.name
+            values["name"] = user_data.name
         
         if user_data.email is not None:
             # Check if new email already exists
@@ -141,7 +147,7 @@ class UserService:
                         status_code=status.HTTP_400_BAD_REQUEST,
                         detail="Email already registered"
                     )
-            user.email = user_data.email
+            values["email"] = user_data.email
         
         if user_data.team_id is not None:
             # Validate team exists if team_id is provided
@@ -156,25 +162,43 @@ class UserService:
                         status_code=status.HTTP_404_NOT_FOUND,
                         detail="Team not found"
                     )
-            user.team_id = user_data.team_id
+            values["team_id"] = user_data.team_id
+        
+        if not values:
+            return user
         
+        # The updated row (with the new updated_at) comes back with the UPDATE
+        update_stmt = update(AppUser).where(
+            AppUser.user_id == user_id
+        ).values(**values).returning(AppUser)
+        user = (await db.execute(update_stmt)).scalar_one()
         await db.commit()
-        await db.refresh(user)
+        
+        # Team rosters embed member names and emails
+        await response_cache.invalidate("user", [user_id])
+        await response_cache.invalidate("team", [previous_team_id, user.team_id])
         
         return user
     
     @staticmethod
     async def delete_user(db: AsyncSession, user_id: UUID) -> bool:
         """Soft delete user."""
-        user = await UserService.get_user_by_id(db, user_id)
-        if not user:
+        stmt = update(AppUser).where(
+            AppUser.user_id == user_id,
+            AppUser.deleted_at.is_(None)
+        ).values(
+            deleted_at=func.now()
+        ).returning(AppUser.team_id).execution_options(synchronize_session=False)
+        row = (await db.execute(stmt)).one_or_none()
+        if row is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
         
-        user.soft_delete()
         await db.commit()
+        await response_cache.invalidate("user", [user_id])
+        await response_cache.invalidate("team", [row.team_id])
         
         return True
     
@@ -203,5 +227,6 @@ class UserService:
         # Update password
         user.password_hash = get_password_hash(new_password)
         await db.commit()
+        await response_cache.invalidate("user", [user_id])
         
         return True
\ No newline at end of file
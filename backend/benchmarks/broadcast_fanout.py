@@ -0,0 +1,64 @@
+"""Benchmark live-update fan-out to many SSE subscribers on a single worker.
+
+Usage (from backend/):
+    PYTHONPATH=. python benchmarks/broadcast_fanout.py --subscribers 5000 --messages 200
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.core.broadcast import Broadcaster, event_channel
+from uuid import uuid4
+
+
+async def consume(subscription, expected: int, latencies: list):
+    for _ in range(expected):
+        message = await subscription.get()
+        if message is None:
+            return
+        sent_at = float(message.frame.split(b'"sent_at": ')[1].split(b"}")[0])
+        latencies.append(time.perf_counter() - sent_at)
+
+
+async def run(subscribers: int, messages: int, slow: int):
+    broadcaster = Broadcaster()
+    channel = event_channel(uuid4())
+    latencies: list = []
+
+    subscriptions = [broadcaster.subscribe(channel) for _ in range(subscribers)]
+    consumers = [
+        asyncio.create_task(consume(sub, messages, latencies))
+        for sub in subscriptions[slow:]
+    ]
+
+    start = time.perf_counter()
+    for i in range(messages):
+        await broadcaster.publish(channel, "leaderboard", {"seq": i, "sent_at": time.perf_counter()})
+        await asyncio.sleep(0)
+    await asyncio.gather(*consumers)
+    elapsed = time.perf_counter() - start
+
+    deliveries = len(latencies)
+    print(f"subscribers:        {subscribers} ({slow} never read)")
+    print(f"messages:           {messages}")
+    print(f"deliveries:         {deliveries}")
+    print(f"total time:         {elapsed:.3f}s")
+    print(f"deliveries/sec:     {deliveries / elapsed:,.0f}")
+    print(f"latency p50:        {statistics.median(latencies) * 1000:.2f}ms")
+    print(f"latency p99:        {statistics.quantiles(latencies, n=100)[98] * 1000:.2f}ms")
+    print(f"dropped slow subs:  {sum(1 for s in subscriptions[:slow] if s.overflowed)}")
+    print(f"live subscribers:   {broadcaster.subscriber_count}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--subscribers", type=int, default=5000)
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--slow", type=int, default=50, help="subscribers that never drain their queue")
+    args = parser.parse_args()
+    asyncio.run(run(args.subscribers, args.messages, args.slow))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Benchmark POST /evaluations/batch against N single PUT /evaluations calls.
+
+Runs against a live API with a judge's access token. Each round re-scores
+the same submissions, so the database is left with one evaluation per
+submission for that judge.
+
+Usage (from backend/):
+    python benchmarks/evaluation_batch.py --base-url http://localhost:8000/api/v1 \
+        --token "$JUDGE_TOKEN" --items 50 --rounds 5
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+import httpx
+
+
+async def fetch_submission_ids(client: httpx.AsyncClient, items: int) -> list:
+    response = await client.get("/submissions/", params={"limit": 100})
+    response.raise_for_status()
+    ids = [submission["submission_id"] for submission in response.json()]
+    if len(ids) < items:
+        raise SystemExit(f"Need {items} submissions, found {len(ids)}")
+    return ids[:items]
+
+
+def payload(submission_id: str) -> dict:
+    return {"submission_id": submission_id, "score": random.randint(0, 100)}
+
+
+async def single_calls(client: httpx.AsyncClient, submission_ids: list) -> float:
+    start = time.perf_counter()
+    for submission_id in submission_ids:
+        response = await client.put("/evaluations/", json=payload(submission_id))
+        response.raise_for_status()
+    return time.perf_counter() - start
+
+
+async def batch_call(client: httpx.AsyncClient, submission_ids: list) -> float:
+    start = time.perf_counter()
+    response = await client.post(
+        "/evaluations/batch",
+        json={"items": [payload(submission_id) for submission_id in submission_ids]}
+    )
+    response.raise_for_status()
+    failed = response.json()["failed"]
+    if failed:
+        raise SystemExit(f"{failed} batch items failed")
+    return time.perf_counter() - start
+
+
+async def run(base_url: str, token: str, items: int, rounds: int):
+    headers = {"Authorization": f"Bearer {token}"}
+    async with httpx.AsyncClient(base_url=base_url, headers=headers, timeout=60) as client:
+        submission_ids = await fetch_submission_ids(client, items)
+
+        singles, batches = [], []
+        for _ in range(rounds):
+            singles.append(await single_calls(client, submission_ids))
+            batches.append(await batch_call(client, submission_ids))
+
+    single = statistics.median(singles)
+    batch = statistics.median(batches)
+    print(f"items per round:    {items}")
+    print(f"rounds:             {rounds}")
+    print(f"{items} single calls:  {single * 1000:.1f}ms (median)")
+    print(f"1 batch call:       {batch * 1000:.1f}ms (median)")
+    print(f"speedup:            {single / batch:.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--base-url", default="http://localhost:8000/api/v1")
+    parser.add_argument("--token", required=True, help="access token of a JUDGE user")
+    parser.add_argument("--items", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.base_url, args.token, args.items, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Benchmark the greedy judge-assignment engine on a synthetic event.
+
+Usage (from backend/):
+    PYTHONPATH=. python benchmarks/judge_assignment.py --submissions 10000 --judges 200 --k 3
+"""
+import argparse
+import random
+import time
+from uuid import uuid4
+
+from app.services.assignment_engine import assign_judges
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--submissions", type=int, default=10000)
+    parser.add_argument("--judges", type=int, default=200)
+    parser.add_argument("--k", type=int, default=3, help="judges per submission")
+    parser.add_argument("--teams", type=int, default=2000)
+    parser.add_argument("--conflicts", type=int, default=400, help="random judge/team conflicts")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    teams = [uuid4() for _ in range(args.teams)]
+    judges = [uuid4() for _ in range(args.judges)]
+    submissions = [(uuid4(), rng.choice(teams)) for _ in range(args.submissions)]
+    conflicts = {(rng.choice(judges), rng.choice(teams)) for _ in range(args.conflicts)}
+
+    start = time.perf_counter()
+    plan = assign_judges(submissions, judges, args.k, conflicts=conflicts)
+    elapsed = time.perf_counter() - start
+
+    team_of = dict(submissions)
+    violations = sum(1 for submission_id, judge in plan.assignments if (judge, team_of[submission_id]) in conflicts)
+    summary = plan.summary()
+
+    print(f"submissions x judges:  {args.submissions} x {args.judges} (k={args.k})")
+    print(f"time:                  {elapsed:.3f}s")
+    print(f"assignments:           {summary['assigned']}")
+    print(f"short submissions:     {summary['short_submissions']}")
+    print(f"judge load min/max:    {summary['min_load']}/{summary['max_load']}")
+    print(f"max pair repeats:      {summary['max_pair_repeats']}")
+    print(f"conflict violations:   {violations}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Stress POST /evaluations/next with many judges pulling concurrently.
+
+Registers --judges throwaway JUDGE accounts, then has all of them pull and
+score work until the queue drains. Checks that no judge got the same
+submission twice and that no submission was scored more than
+EVALUATION_REVIEWS_PER_SUBMISSION times.
+
+Usage (from backend/, against a stack seeded with pending submissions):
+    python benchmarks/judge_queue.py --base-url http://localhost:8000/api/v1 \
+        --judges 200 --reviews-per-submission 3
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from collections import Counter, defaultdict
+from uuid import uuid4
+
+import httpx
+
+
+async def register_judge(client: httpx.AsyncClient) -> str:
+    response = await client.post("/auth/register", json={
+        "email": f"bench-judge-{uuid4().hex[:12]}@example.com",
+        "password": "bench-password-123",
+        "name": "Benchmark Judge",
+        "role": "JUDGE",
+    })
+    response.raise_for_status()
+    return response.json()["tokens"]["access_token"]
+
+
+async def judge_loop(client: httpx.AsyncClient, token: str, event_id, seen: dict, latencies: list):
+    headers = {"Authorization": f"Bearer {token}"}
+    body = {"event_id": event_id} if event_id else {}
+    while True:
+        start = time.perf_counter()
+        response = await client.post("/evaluations/next", json=body, headers=headers)
+        latencies.append(time.perf_counter() - start)
+        if response.status_code == 204:
+            return
+        response.raise_for_status()
+        submission_id = response.json()["submission"]["submission_id"]
+        seen[token].append(submission_id)
+
+        response = await client.put(
+            "/evaluations/",
+            json={"submission_id": submission_id, "score": random.randint(0, 100)},
+            headers=headers
+        )
+        response.raise_for_status()
+
+
+async def run(base_url: str, judges: int, event_id, reviews_per_submission: int):
+    limits = httpx.Limits(max_connections=judges)
+    async with httpx.AsyncClient(base_url=base_url, timeout=60, limits=limits) as client:
+        tokens = await asyncio.gather(*(register_judge(client) for _ in range(judges)))
+
+        seen = defaultdict(list)
+        latencies: list = []
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            judge_loop(client, token, event_id, seen, latencies) for token in tokens
+        ))
+        elapsed = time.perf_counter() - start
+
+    per_judge_duplicates = sum(len(ids) - len(set(ids)) for ids in seen.values())
+    reviews = Counter(submission_id for ids in seen.values() for submission_id in ids)
+    over_reviewed = sum(1 for count in reviews.values() if count > reviews_per_submission)
+
+    print(f"judges:                 {judges}")
+    print(f"submissions reviewed:   {len(reviews)}")
+    print(f"reviews:                {sum(reviews.values())} in {elapsed:.2f}s")
+    print(f"pull latency p50:       {statistics.median(latencies) * 1000:.1f}ms")
+    print(f"pull latency p99:       {statistics.quantiles(latencies, n=100)[98] * 1000:.1f}ms")
+    print(f"same-judge duplicates:  {per_judge_duplicates}")
+    print(f"over-reviewed:          {over_reviewed}")
+    if per_judge_duplicates or over_reviewed:
+        raise SystemExit("FAILED")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--base-url", default="http://localhost:8000/api/v1")
+    parser.add_argument("--judges", type=int, default=200)
+    parser.add_argument("--event-id", default=None)
+    parser.add_argument("--reviews-per-submission", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(run(args.base_url, args.judges, args.event_id, args.reviews_per_submission))
+
+
+if __name__ == "__main__":
+    main()
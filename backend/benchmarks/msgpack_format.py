@@ -0,0 +1,113 @@
+"""Benchmark MessagePack against JSON for submission and evaluation lists.
+
+Builds --rows synthetic Submission and Evaluation response models and, for
+each format, reports the payload size and the time to encode and decode it:
+
+* json: jsonable_encoder + json.dumps, as FastAPI renders a response;
+* msgpack: the models packed directly, UUIDs and datetimes as ext types, as
+  conditional_response renders them;
+* msgpack (transcoded): MessagePackMiddleware's path, JSON body to
+  MessagePack; UUIDs and timestamps stay strings.
+
+Usage (from backend/):
+    PYTHONPATH=. python benchmarks/msgpack_format.py --rows 1000 --rounds 20
+"""
+import argparse
+import json
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+
+from app.core.msgpack_codec import json_to_msgpack, packb, unpackb
+from app.models.submission import SubmissionStatus
+from app.schemas.evaluation import Evaluation
+from app.schemas.submission import Submission
+
+
+def synthetic(rows: int, seed: int):
+    rng = random.Random(seed)
+    start = datetime(2025, 3, 1, tzinfo=timezone.utc)
+    teams = [uuid4() for _ in range(max(1, rows // 4))]
+    events = [uuid4() for _ in range(10)]
+    judges = [uuid4() for _ in range(50)]
+
+    submissions = []
+    for _ in range(rows):
+        submitted = start + timedelta(seconds=rng.randrange(30 * 86400))
+        team_id, event_id = rng.choice(teams), rng.choice(events)
+        submissions.append(Submission(
+            submission_id=uuid4(),
+            team_id=team_id,
+            event_id=event_id,
+            file_url=f"submissions/{event_id}/{team_id}/report.pdf",
+            status=rng.choice(list(SubmissionStatus)),
+            submitted_at=submitted,
+            updated_at=submitted + timedelta(seconds=rng.randrange(86400))
+        ))
+
+    evaluations = []
+    for _ in range(rows):
+        created = start + timedelta(seconds=rng.randrange(30 * 86400))
+        evaluations.append(Evaluation(
+            evaluation_id=uuid4(),
+            submission_id=rng.choice(submissions).submission_id,
+            judge_id=rng.choice(judges),
+            score=rng.randint(0, 100),
+            comments=rng.choice([None, "Solid work", "Needs a clearer methodology section"]),
+            created_at=created,
+            updated_at=created
+        ))
+    return submissions, evaluations
+
+
+def best(rounds: int, call) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def compare(label: str, models: list, rounds: int):
+    values = [model.model_dump() for model in models]
+    json_body = json.dumps(jsonable_encoder(values), separators=(",", ":")).encode()
+    msgpack_body = packb(values)
+
+    rows = [
+        ("json", len(json_body),
+         best(rounds, lambda: json.dumps(jsonable_encoder(models), separators=(",", ":")).encode()),
+         best(rounds, lambda: json.loads(json_body))),
+        ("msgpack", len(msgpack_body),
+         best(rounds, lambda: packb(models)),
+         best(rounds, lambda: unpackb(msgpack_body))),
+        ("msgpack (transcoded)", len(json_to_msgpack(json_body)),
+         best(rounds, lambda: json_to_msgpack(json_body)),
+         best(rounds, lambda: unpackb(msgpack_body))),
+    ]
+
+    print(f"{label} ({len(models)} rows)")
+    for name, size, encode, decode in rows:
+        print(f"  {name:<22} {size / 1024:8.1f} KiB   encode {encode:7.2f}ms   decode {decode:7.2f}ms")
+
+    if unpackb(msgpack_body) != values:
+        raise SystemExit("FAILED: MessagePack round trip changed the values")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    submissions, evaluations = synthetic(args.rows, args.seed)
+    compare("submissions", submissions, args.rounds)
+    compare("evaluations", evaluations, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark the NumPy ranking engine on synthetic evaluations.
+
+Every judge gets a random leniency offset and harshness scale, and each
+submission has a hidden true quality. The script times the vectorized
+engine, checks it against the pure Python reference, and reports how well
+each normalization recovers the true order (Spearman correlation).
+
+Usage (from backend/):
+    PYTHONPATH=. python benchmarks/ranking.py --submissions 20000 --judges 1000 \
+        --reviews 25 --normalization zscore
+"""
+import argparse
+import math
+import time
+
+import numpy as np
+
+from app.services.ranking_engine import NORMALIZATIONS, rank_submissions, rank_submissions_reference
+
+
+def synthetic(submissions: int, judges: int, reviews: int, seed: int):
+    rng = np.random.default_rng(seed)
+    quality = rng.normal(60, 12, submissions)
+    leniency = rng.normal(0, 10, judges)
+    harshness = rng.uniform(0.5, 1.5, judges)
+
+    submission_index = np.repeat(np.arange(submissions), reviews)
+    judge_index = rng.integers(0, judges, len(submission_index))
+    noise = rng.normal(0, 6, len(submission_index))
+    scores = (quality[submission_index] - 60) * harshness[judge_index] + 60 + leniency[judge_index] + noise
+    scores = np.clip(np.rint(scores), 0, 100).astype(np.int64)
+    return submission_index, judge_index, scores, quality
+
+
+def spearman(a: np.ndarray, b: np.ndarray) -> float:
+    return float(np.corrcoef(a.argsort().argsort(), b.argsort().argsort())[0, 1])
+
+
+def max_difference(fast: np.ndarray, reference: list) -> float:
+    expected = np.array([math.nan if value is None else value for value in reference])
+    if not np.array_equal(np.isnan(fast), np.isnan(expected)):
+        return math.inf
+    both = ~np.isnan(fast)
+    return float(np.max(np.abs(fast[both] - expected[both]), initial=0.0))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--submissions", type=int, default=20000)
+    parser.add_argument("--judges", type=int, default=1000)
+    parser.add_argument("--reviews", type=int, default=25, help="evaluations per submission")
+    parser.add_argument("--normalization", choices=NORMALIZATIONS, default="zscore")
+    parser.add_argument("--trim", type=float, default=0.1)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--skip-reference", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    submission_index, judge_index, scores, quality = synthetic(
+        args.submissions, args.judges, args.reviews, args.seed
+    )
+    options = {"normalization": args.normalization, "trim": args.trim}
+
+    timings = []
+    for _ in range(args.rounds):
+        start = time.perf_counter()
+        result = rank_submissions(submission_index, judge_index, scores, args.submissions, **options)
+        result.order()
+        timings.append(time.perf_counter() - start)
+
+    raw = rank_submissions(submission_index, judge_index, scores, args.submissions, normalization="none", trim=0)
+
+    print(f"evaluations:            {len(scores)} ({args.submissions} submissions x {args.reviews}, {args.judges} judges)")
+    print(f"normalization:          {args.normalization} (trim {args.trim})")
+    print(f"numpy engine:           {min(timings) * 1000:.1f}ms (best of {args.rounds})")
+    print(f"spearman vs truth, raw: {spearman(raw.raw_mean, quality):.4f}")
+    print(f"spearman vs truth:      {spearman(result.score, quality):.4f}")
+
+    if args.skip_reference:
+        return
+    start = time.perf_counter()
+    reference = rank_submissions_reference(
+        submission_index.tolist(), judge_index.tolist(), scores.tolist(), args.submissions, **options
+    )
+    elapsed = time.perf_counter() - start
+    difference = max(
+        max_difference(getattr(result, field), getattr(reference, field))
+        for field in ("raw_mean", "score", "low", "high")
+    )
+    print(f"python reference:       {elapsed * 1000:.1f}ms")
+    print(f"max abs difference:     {difference:.2e}")
+    if difference > 1e-6:
+        raise SystemExit("FAILED")
+
+
+if __name__ == "__main__":
+    main()
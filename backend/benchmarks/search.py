@@ -0,0 +1,144 @@
+"""Benchmark search and team autocomplete latency on a large seeded table.
+
+Seeds --rows synthetic teams and --rows users straight into the database
+configured by DATABASE_URL, then times SearchService.search and
+SearchService.autocomplete_teams for random full words, prefixes and
+typo'd words. EXPLAIN output for one query of each kind shows whether the
+GIN indexes are used. Seeded rows are removed at the end unless --keep.
+
+Usage (from backend/, against a database with the app's schema):
+    PYTHONPATH=. python benchmarks/search.py --rows 100000 --queries 300
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from uuid import uuid4
+
+from sqlalchemy import delete, insert, text
+
+from app.core.database import AsyncSessionLocal, engine
+from app.models.team import Team
+from app.models.user import AppUser, UserRole
+from app.services.search_service import SearchService
+
+SYLLABLES = ["kaz", "rock", "et", "sky", "nur", "al", "ma", "ty", "as", "tan", "bek", "ar", "on", "dev", "byte", "star"]
+BATCH = 5000
+
+
+def word(rng: random.Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3)))
+
+
+def typo(rng: random.Random, value: str) -> str:
+    position = rng.randrange(len(value))
+    return value[:position] + value[position + 1:]
+
+
+async def seed(rows: int, rng: random.Random, tag: str):
+    async with AsyncSessionLocal() as db:
+        captain_id = uuid4()
+        await db.execute(insert(AppUser).values(
+            user_id=captain_id,
+            email=f"{tag}-captain@example.com",
+            password_hash="!",
+            name="Search Benchmark",
+            role=UserRole.ORGANIZER
+        ))
+        for start in range(0, rows, BATCH):
+            count = min(BATCH, rows - start)
+            await db.execute(insert(Team), [
+                {"team_id": uuid4(), "name": f"{word(rng)} {word(rng)}".title(), "captain_id": captain_id}
+                for _ in range(count)
+            ])
+            await db.execute(insert(AppUser), [
+                {
+                    "user_id": uuid4(),
+                    "email": f"{tag}-{start + i}-{word(rng)}@example.com",
+                    "password_hash": "!",
+                    "name": f"{word(rng)} {word(rng)}".title(),
+                    "role": UserRole.PARTICIPANT,
+                }
+                for i in range(count)
+            ])
+        await db.commit()
+        await db.execute(text("ANALYZE teams"))
+        await db.execute(text("ANALYZE app_users"))
+        await db.commit()
+        return captain_id
+
+
+async def cleanup(tag: str, captain_id):
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(Team).where(Team.captain_id == captain_id))
+        await db.execute(delete(AppUser).where(AppUser.email.like(f"{tag}-%")))
+        await db.commit()
+
+
+async def timed(calls) -> list:
+    latencies = []
+    for call in calls:
+        start = time.perf_counter()
+        await call()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def report(label: str, latencies: list):
+    p99 = statistics.quantiles(latencies, n=100)[98] if len(latencies) > 1 else latencies[0]
+    print(f"{label:<24} p50 {statistics.median(latencies):7.2f}ms   p99 {p99:7.2f}ms")
+
+
+async def explain(db, stmt_text: str):
+    plan = (await db.execute(text(f"EXPLAIN {stmt_text}"))).scalars().all()
+    uses_index = any("Bitmap Index Scan" in line or "Index Scan" in line for line in plan)
+    return "index" if uses_index else "seq scan"
+
+
+async def run(rows: int, queries: int, seed_value: int, keep: bool):
+    rng = random.Random(seed_value)
+    tag = f"bench-search-{uuid4().hex[:8]}"
+    start = time.perf_counter()
+    captain_id = await seed(rows, rng, tag)
+    print(f"seeded {rows} teams and {rows} users in {time.perf_counter() - start:.1f}s")
+
+    try:
+        async with AsyncSessionLocal() as db:
+            organizer = AppUser(user_id=captain_id, role=UserRole.ORGANIZER)
+            words = [word(rng) for _ in range(queries)]
+
+            def search(query):
+                return lambda: SearchService.search(db, organizer, query)
+
+            def autocomplete(query):
+                return lambda: SearchService.autocomplete_teams(db, query)
+
+            report("search, full word", await timed([search(w) for w in words]))
+            report("search, prefix", await timed([search(w[:4]) for w in words]))
+            report("search, typo", await timed([search(typo(rng, w)) for w in words]))
+            report("autocomplete, 3 chars", await timed([autocomplete(w[:3]) for w in words]))
+            report("autocomplete, 6 chars", await timed([autocomplete(w[:6]) for w in words]))
+
+            sample = words[0]
+            print(f"plan, tsvector prefix:   {await explain(db, f'''SELECT team_id FROM teams WHERE deleted_at IS NULL AND search_vector @@ to_tsquery('simple', '{sample[:4]}:*')''')}")
+            print(f"plan, trigram:           {await explain(db, f'''SELECT team_id FROM teams WHERE deleted_at IS NULL AND '{typo(rng, sample)}' <% name''')}")
+            print(f"plan, anchored prefix:   {await explain(db, f'''SELECT team_id FROM teams WHERE deleted_at IS NULL AND name ILIKE '{sample[:4]}%' ''')}")
+    finally:
+        if not keep:
+            await cleanup(tag, captain_id)
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--keep", action="store_true", help="leave the seeded rows in place")
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.queries, args.seed, args.keep))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark ?fields= against full payloads on the submission and team lists.
+
+Fetches each list page with and without a sparse fieldset and reports body
+size and median latency. Conditional requests are avoided, so every call
+reaches the database or the response cache.
+
+Usage (from backend/):
+    python benchmarks/sparse_fields.py --base-url http://localhost:8000/api/v1 \
+        --token "$ORGANIZER_TOKEN" --rounds 50
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+CASES = [
+    ("/submissions/", "submission_id,status"),
+    ("/teams/", "team_id,name"),
+    ("/teams/", "team_id,name,member_count"),
+]
+
+
+async def measure(client: httpx.AsyncClient, path: str, params: dict, rounds: int):
+    latencies, size = [], 0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        response = await client.get(path, params=params)
+        latencies.append(time.perf_counter() - start)
+        response.raise_for_status()
+        size = len(response.content)
+    return statistics.median(latencies), size
+
+
+async def run(base_url: str, token: str, limit: int, rounds: int):
+    headers = {"Authorization": f"Bearer {token}"}
+    async with httpx.AsyncClient(base_url=base_url, headers=headers, timeout=60) as client:
+        for path, fields in CASES:
+            full_time, full_size = await measure(client, path, {"limit": limit}, rounds)
+            sparse_time, sparse_size = await measure(
+                client, path, {"limit": limit, "fields": fields}, rounds
+            )
+            print(f"{path} fields={fields}")
+            print(f"  payload:  {full_size} -> {sparse_size} bytes ({sparse_size / max(full_size, 1):.0%})")
+            print(f"  latency:  {full_time * 1000:.1f} -> {sparse_time * 1000:.1f}ms (median of {rounds})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--base-url", default="http://localhost:8000/api/v1")
+    parser.add_argument("--token", required=True, help="access token (an organizer sees every row)")
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(run(args.base_url, args.token, args.limit, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Harness for tests against the Postgres database from TEST_DATABASE_URL (as in CI).
+
+Every scenario starts from an empty schema and drives the application
+through httpx, its services through their own sessions, or both.
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, List, Optional
+from uuid import UUID, uuid4
+import asyncio
+import os
+
+import httpx
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.database import Base, get_db
+from app.core.security import create_access_token
+from app.main import app
+from app.models import AppUser, CompetitiveEvent, Submission, SubmissionStatus, Team, UserRole
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+requires_postgres = pytest.mark.skipif(TEST_DATABASE_URL is None, reason="TEST_DATABASE_URL is not set")
+
+Scenario = Callable[[httpx.AsyncClient, async_sessionmaker, List[str]], Awaitable[None]]
+
+
+def run(scenario: Scenario):
+    """Run ``scenario(client, sessions, statements)`` against a fresh schema.
+
+    ``statements`` collects every SQL statement sent to the database.
+    """
+    async def main():
+        engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+        async with engine.begin() as conn:
+            await conn.execute(text("DROP SCHEMA public CASCADE"))
+            await conn.execute(text("CREATE SCHEMA public"))
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            await conn.run_sync(Base.metadata.create_all)
+
+        sessions = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False, autoflush=False)
+
+        async def override_get_db():
+            async with sessions() as session:
+                yield session
+
+        statements: List[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", record)
+        app.dependency_overrides[get_db] = override_get_db
+        try:
+            async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+                await scenario(client, sessions, statements)
+        finally:
+            app.dependency_overrides.pop(get_db, None)
+            await engine.dispose()
+
+    asyncio.run(main())
+
+
+def auth(user: AppUser) -> dict:
+    token = create_access_token({"sub": str(user.user_id)})
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def add_user(sessions: async_sessionmaker, role: UserRole, **values) -> AppUser:
+    async with sessions() as session:
+        user = AppUser(
+            user_id=uuid4(),
+            email=f"{uuid4().hex}@example.com",
+            password_hash="not-a-real-hash",
+            name="Test User",
+            role=role,
+            **values
+        )
+        session.add(user)
+        await session.commit()
+        return user
+
+
+async def add_team(sessions: async_sessionmaker, captain: Optional[AppUser] = None, *members: AppUser) -> Team:
+    """Create a team; a captain is registered for it unless given."""
+    if captain is None:
+        captain = await add_user(sessions, UserRole.PARTICIPANT)
+    async with sessions() as session:
+        team = Team(team_id=uuid4(), name=f"Team {uuid4().hex[:8]}", captain_id=captain.user_id)
+        session.add(team)
+        await session.flush()
+        for user in (captain, *members):
+            (await session.get(AppUser, user.user_id)).team_id = team.team_id
+        await session.commit()
+        return team
+
+
+async def add_event(sessions: async_sessionmaker, ended: bool = False, **values) -> CompetitiveEvent:
+    """Create an event running around now, or one that has already ended."""
+    now = datetime.now(timezone.utc)
+    end = now - timedelta(days=1) if ended else now + timedelta(days=1)
+    async with sessions() as session:
+        event = CompetitiveEvent(
+            event_id=uuid4(),
+            title=f"Event {uuid4().hex[:8]}",
+            start_date=end - timedelta(days=2),
+            end_date=end,
+            **values
+        )
+        session.add(event)
+        await session.commit()
+        return event
+
+
+async def add_submission(
+    sessions: async_sessionmaker,
+    event_id: UUID,
+    team_id: UUID,
+    status: SubmissionStatus = SubmissionStatus.PENDING,
+    **values
+) -> Submission:
+    async with sessions() as session:
+        submission = Submission(
+            submission_id=uuid4(),
+            event_id=event_id,
+            team_id=team_id,
+            file_url=f"submissions/{event_id}/{team_id}/report.pdf",
+            status=status,
+            **values
+        )
+        session.add(submission)
+        await session.commit()
+        return submission
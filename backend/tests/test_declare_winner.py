@@ -0,0 +1,81 @@
+"""Declaring an event's winner: one declaration wins, ties and ineligible teams are refused."""
+import asyncio
+
+from app.models import CompetitiveEvent, Evaluation, SubmissionStatus, UserRole
+from tests.postgres import add_event, add_submission, add_team, add_user, auth, requires_postgres, run
+
+pytestmark = requires_postgres
+
+
+async def add_evaluation(sessions, submission, judge, score: int):
+    async with sessions() as session:
+        session.add(Evaluation(submission_id=submission.submission_id, judge_id=judge.user_id, score=score))
+        await session.commit()
+
+
+def test_concurrent_declarations():
+    async def scenario(client, sessions, statements):
+        organizer = await add_user(sessions, UserRole.ORGANIZER)
+        event = await add_event(sessions, ended=True)
+        teams = [await add_team(sessions) for _ in range(2)]
+        for team in teams:
+            await add_submission(sessions, event.event_id, team.team_id)
+
+        responses = await asyncio.gather(*(
+            client.post(
+                f"/api/v1/events/{event.event_id}/winner",
+                json={"winner_team_id": str(team.team_id)},
+                headers=auth(organizer)
+            )
+            for team in teams
+        ))
+
+        assert sorted(response.status_code for response in responses) == [200, 409]
+        winner = next(response for response in responses if response.status_code == 200).json()
+        async with sessions() as session:
+            stored = await session.get(CompetitiveEvent, event.event_id)
+        assert str(stored.winner_team_id) == winner["winner_team_id"]
+
+    run(scenario)
+
+
+def test_tie_at_the_top_is_refused():
+    async def scenario(client, sessions, statements):
+        organizer = await add_user(sessions, UserRole.ORGANIZER)
+        judge = await add_user(sessions, UserRole.JUDGE)
+        event = await add_event(sessions, ended=True)
+        for _ in range(2):
+            submission = await add_submission(sessions, event.event_id, (await add_team(sessions)).team_id)
+            await add_evaluation(sessions, submission, judge, 70)
+
+        response = await client.post(
+            f"/api/v1/events/{event.event_id}/winner", json={}, headers=auth(organizer)
+        )
+
+        assert response.status_code == 409
+        async with sessions() as session:
+            assert (await session.get(CompetitiveEvent, event.event_id)).winner_team_id is None
+
+    run(scenario)
+
+
+def test_team_without_eligible_submission_is_refused():
+    async def scenario(client, sessions, statements):
+        organizer = await add_user(sessions, UserRole.ORGANIZER)
+        event = await add_event(sessions, ended=True)
+        rejected = await add_team(sessions)
+        await add_submission(sessions, event.event_id, rejected.team_id, SubmissionStatus.REJECTED)
+        absent = await add_team(sessions)
+
+        for team in (rejected, absent):
+            response = await client.post(
+                f"/api/v1/events/{event.event_id}/winner",
+                json={"winner_team_id": str(team.team_id)},
+                headers=auth(organizer)
+            )
+            assert response.status_code == 400
+
+        async with sessions() as session:
+            assert (await session.get(CompetitiveEvent, event.event_id)).winner_team_id is None
+
+    run(scenario)
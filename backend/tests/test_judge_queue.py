@@ -0,0 +1,101 @@
+"""Concurrent judges pulling work from the evaluation queue (POST /evaluations/next)."""
+from collections import defaultdict
+from typing import Dict, List, Set
+from uuid import UUID
+import asyncio
+import random
+
+from sqlalchemy import func, select
+
+from app.core.config import settings
+from app.models import EvaluationLease, Submission, UserRole
+from app.schemas.evaluation import EvaluationCreate
+from app.services.evaluation_service import EvaluationService
+from tests.postgres import add_event, add_submission, add_team, add_user, requires_postgres, run
+
+pytestmark = requires_postgres
+
+SUBMISSIONS = 12
+JUDGES = 8
+
+
+def test_concurrent_judges_share_the_queue():
+    reviews = settings.EVALUATION_REVIEWS_PER_SUBMISSION
+
+    async def scenario(client, sessions, statements):
+        event = await add_event(sessions)
+        submissions = [
+            await add_submission(sessions, event.event_id, (await add_team(sessions)).team_id)
+            for _ in range(SUBMISSIONS)
+        ]
+        judges = [await add_user(sessions, UserRole.JUDGE) for _ in range(JUDGES)]
+
+        received: Dict[UUID, List[UUID]] = defaultdict(list)  # judge -> submissions handed out
+        in_flight: Dict[UUID, Set[UUID]] = defaultdict(set)  # submission -> judges holding a lease
+        scored: Dict[UUID, int] = defaultdict(int)
+
+        async def work(judge):
+            rng = random.Random(str(judge.user_id))
+            while True:
+                async with sessions() as db:
+                    task = await EvaluationService.next_submission(db, judge, event.event_id)
+                if task is None:
+                    return
+                submission_id = task.submission.submission_id
+                received[judge.user_id].append(submission_id)
+                in_flight[submission_id].add(judge.user_id)
+                assert len(in_flight[submission_id]) + scored[submission_id] <= reviews
+
+                await asyncio.sleep(rng.random() / 50)
+                async with sessions() as db:
+                    await EvaluationService.upsert_evaluation(
+                        db, judge, EvaluationCreate(submission_id=submission_id, score=rng.randint(0, 100))
+                    )
+                in_flight[submission_id].discard(judge.user_id)
+                scored[submission_id] += 1
+
+        await asyncio.gather(*(work(judge) for judge in judges))
+
+        # No judge is handed a submission twice, so none reviews its own earlier work
+        for handed_out in received.values():
+            assert len(handed_out) == len(set(handed_out))
+        assert sum(len(handed_out) for handed_out in received.values()) == SUBMISSIONS * reviews
+
+        async with sessions() as db:
+            counts = dict((await db.execute(
+                select(Submission.submission_id, Submission.evaluation_count)
+            )).all())
+            leases = (await db.execute(select(func.count()).select_from(EvaluationLease))).scalar_one()
+        assert counts == {submission.submission_id: reviews for submission in submissions}
+        assert leases == 0
+
+    run(scenario)
+
+
+def test_expired_lease_returns_submission_to_queue(monkeypatch):
+    monkeypatch.setattr(settings, "EVALUATION_REVIEWS_PER_SUBMISSION", 1)
+    monkeypatch.setattr(settings, "EVALUATION_LEASE_SECONDS", 1)
+
+    async def scenario(client, sessions, statements):
+        event = await add_event(sessions)
+        submission = await add_submission(sessions, event.event_id, (await add_team(sessions)).team_id)
+        first, second = [await add_user(sessions, UserRole.JUDGE) for _ in range(2)]
+
+        async with sessions() as db:
+            task = await EvaluationService.next_submission(db, first, event.event_id)
+        assert task.submission.submission_id == submission.submission_id
+
+        # The only review slot is leased
+        async with sessions() as db:
+            assert await EvaluationService.next_submission(db, second, event.event_id) is None
+
+        await asyncio.sleep(1.5)
+        async with sessions() as db:
+            task = await EvaluationService.next_submission(db, second, event.event_id)
+        assert task.submission.submission_id == submission.submission_id
+
+        # The first judge's lapsed lease no longer holds the slot for them
+        async with sessions() as db:
+            assert await EvaluationService.next_submission(db, first, event.event_id) is None
+
+    run(scenario)
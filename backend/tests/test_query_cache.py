@@ -0,0 +1,153 @@
+"""The query-result cache must never serve a read that a committed write has outdated."""
+from typing import Optional
+
+import pytest
+from sqlalchemy import String, create_engine, select, update
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+from app.core import query_cache as query_cache_module
+from app.core.cache import response_cache
+from app.core.query_cache import QueryCache, cached
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Account(Base):
+    __tablename__ = "account"
+
+    account_id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(50))
+    role: Mapped[str] = mapped_column(String(20))
+    deleted: Mapped[bool] = mapped_column(default=False)
+
+
+@pytest.fixture
+def cache():
+    query_cache = QueryCache(max_entries=100)
+    query_cache.install()
+    yield query_cache
+    query_cache.uninstall()
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Account(account_id=1, name="ada", role="PARTICIPANT"))
+        session.commit()
+    yield engine
+    engine.dispose()
+
+
+def active_account(session: Session, account_id: int = 1) -> Optional[Account]:
+    stmt = select(Account).where(Account.account_id == account_id, Account.deleted.is_(False))
+    return session.execute(cached(stmt)).scalar_one_or_none()
+
+
+def test_repeated_read_is_served_from_cache(cache, engine):
+    with Session(engine) as session:
+        assert active_account(session).name == "ada"
+    with Session(engine) as session:
+        assert active_account(session).name == "ada"
+
+    assert cache.stats.misses == 1
+    assert cache.stats.hits == 1
+
+
+def test_write_then_read_in_same_session(cache, engine):
+    with Session(engine) as session:
+        account = active_account(session)
+        account.role = "ORGANIZER"
+        session.flush()
+        assert active_account(session).role == "ORGANIZER"
+
+        session.execute(update(Account).where(Account.account_id == 1).values(name="grace"))
+        assert active_account(session).name == "grace"
+
+        session.commit()
+        assert active_account(session).name == "grace"
+
+
+def test_write_in_one_session_is_seen_by_another(cache, engine):
+    with Session(engine) as reader:
+        assert active_account(reader).role == "PARTICIPANT"
+
+    with Session(engine) as writer:
+        writer.execute(update(Account).where(Account.account_id == 1).values(role="JUDGE"))
+        writer.commit()
+
+    with Session(engine) as reader:
+        assert active_account(reader).role == "JUDGE"
+
+
+def test_soft_deleted_row_is_not_served(cache, engine):
+    with Session(engine) as reader:
+        assert active_account(reader) is not None
+
+    with Session(engine) as writer:
+        writer.get(Account, 1).deleted = True
+        writer.commit()
+
+    with Session(engine) as reader:
+        assert active_account(reader) is None
+
+
+def test_rolled_back_write_is_not_cached(cache, engine):
+    with Session(engine) as writer:
+        writer.get(Account, 1).name = "uncommitted"
+        writer.flush()
+        assert active_account(writer).name == "uncommitted"
+        writer.rollback()
+
+    with Session(engine) as reader:
+        assert active_account(reader).name == "ada"
+    with Session(engine) as reader:
+        assert active_account(reader).name == "ada"
+
+
+def test_read_during_concurrent_uncommitted_write_goes_stale(cache, engine):
+    with Session(engine) as writer:
+        writer.get(Account, 1).name = "pending"
+        writer.flush()
+
+        # Cached by another session while the write is still open
+        with Session(engine) as reader:
+            active_account(reader)
+
+        writer.rollback()
+
+    with Session(engine) as reader:
+        assert active_account(reader).name == "ada"
+    assert cache.stats.hits == 0
+
+
+def test_entries_expire(cache, engine, monkeypatch):
+    with Session(engine) as session:
+        active_account(session)
+
+    # Simulate a lost invalidation: the row changes without the cache noticing
+    with engine.begin() as connection:
+        connection.exec_driver_sql("UPDATE account SET name = 'lost' WHERE account_id = 1")
+
+    now = query_cache_module.time.monotonic()
+    monkeypatch.setattr(
+        query_cache_module.time, "monotonic",
+        lambda: now + query_cache_module.settings.QUERY_CACHE_TTL_SECONDS + 1
+    )
+    with Session(engine) as session:
+        assert active_account(session).name == "lost"
+
+
+def test_uninstall_removes_hooks_and_listener(engine):
+    query_cache = QueryCache(max_entries=100)
+    listeners = len(response_cache._listeners)
+    query_cache.install()
+    query_cache.uninstall()
+
+    assert len(response_cache._listeners) == listeners
+    with Session(engine) as session:
+        active_account(session)
+    assert query_cache.stats.misses == 0
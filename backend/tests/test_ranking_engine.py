@@ -0,0 +1,53 @@
+"""The vectorized ranking engine must match its plain Python reference."""
+import math
+import random
+
+import numpy as np
+import pytest
+
+from app.services.ranking_engine import NORMALIZATIONS, rank_submissions, rank_submissions_reference
+
+SUBMISSIONS = 60
+JUDGES = 12
+
+
+def synthetic(seed: int):
+    """Evaluations with the awkward cases mixed in: unscored and single-score
+    submissions, judges with one score, and many tied scores."""
+    rng = random.Random(seed)
+    submission_index, judge_index, scores = [], [], []
+    for submission in range(SUBMISSIONS):
+        for judge in rng.sample(range(JUDGES - 1), rng.choice((0, 1, 2, 3, 5, 8))):
+            submission_index.append(submission)
+            judge_index.append(judge)
+            scores.append(rng.choice((0, 50, 100)) if rng.random() < 0.2 else rng.randint(0, 100))
+    # The last judge scores exactly once
+    submission_index.append(SUBMISSIONS - 1)
+    judge_index.append(JUDGES - 1)
+    scores.append(rng.randint(0, 100))
+    return submission_index, judge_index, scores
+
+
+@pytest.mark.parametrize("normalization", NORMALIZATIONS)
+@pytest.mark.parametrize("seed", range(3))
+def test_matches_reference(normalization, seed):
+    submission_index, judge_index, scores = synthetic(seed)
+
+    result = rank_submissions(
+        submission_index, judge_index, scores, SUBMISSIONS, normalization=normalization
+    )
+    reference = rank_submissions_reference(
+        submission_index, judge_index, scores, SUBMISSIONS, normalization=normalization
+    )
+
+    assert result.n_evaluations.tolist() == reference.n_evaluations
+    for field in ("raw_mean", "score", "low", "high"):
+        expected = np.array([math.nan if value is None else value for value in getattr(reference, field)])
+        np.testing.assert_allclose(getattr(result, field), expected, rtol=0, atol=1e-9, err_msg=field)
+
+
+def test_order_breaks_score_ties_by_evaluation_count():
+    # Submission 1 has the same score as 0 from more evaluations; 2 is unscored
+    result = rank_submissions([0, 1, 1], [0, 0, 1], [70, 70, 70], 3, normalization="none")
+
+    assert result.order().tolist() == [1, 0, 2]
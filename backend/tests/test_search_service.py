@@ -0,0 +1,47 @@
+"""User input must never reach to_tsquery as tsquery syntax."""
+import re
+
+import pytest
+
+from app.services.search_service import SearchService
+
+# Only "word:*" terms joined by "&"; no operators, weights, quotes or "_"
+SAFE_TSQUERY = re.compile(r"[^\W_]+:\*( & [^\W_]+:\*)*")
+
+HOSTILE = [
+    "a & !b",
+    "x:*|y",
+    "(a | b) & !c",
+    "a <-> b",
+    "a:AB",
+    "'quoted' \"double\"",
+    "back\\slash",
+    "o'brien",
+    "__init__",
+    "Қазақ ракетасы",
+    "naïve café",
+    "café",
+    "１２３",
+    "🚀 launch",
+]
+
+
+@pytest.mark.parametrize("query", HOSTILE)
+def test_output_is_plain_prefix_terms(query):
+    assert SAFE_TSQUERY.fullmatch(SearchService.prefix_tsquery(query))
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("a & !b", "a:* & b:*"),
+    ("x:*|y", "x:* & y:*"),
+    ("__init__", "init:*"),
+    ("Қазақ Ракетасы", "қазақ:* & ракетасы:*"),
+    ("naïve café", "naïve:* & café:*"),
+])
+def test_words_are_kept(query, expected):
+    assert SearchService.prefix_tsquery(query) == expected
+
+
+@pytest.mark.parametrize("query", ["", "   ", "_", "___", "&|!", ":*", "🚀", "\\"])
+def test_no_words_gives_none(query):
+    assert SearchService.prefix_tsquery(query) is None
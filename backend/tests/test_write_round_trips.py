@@ -0,0 +1,75 @@
+"""Round trips per write endpoint, locking in the set-based team and user write paths."""
+from app.models import AppUser, UserRole
+from tests.postgres import add_team, add_user, auth, requires_postgres, run
+
+pytestmark = requires_postgres
+
+
+def test_create_team():
+    async def scenario(client, sessions, statements):
+        captain = await add_user(sessions, UserRole.PARTICIPANT)
+        statements.clear()
+
+        response = await client.post("/api/v1/teams/", json={"name": "Rocketeers"}, headers=auth(captain))
+
+        assert response.status_code == 201
+        assert response.json()["member_count"] == 1
+        # Auth lookup, INSERT team ... RETURNING, guarded UPDATE of the captain
+        assert len(statements) == 3, statements
+
+    run(scenario)
+
+
+def test_join_team():
+    async def scenario(client, sessions, statements):
+        captain = await add_user(sessions, UserRole.PARTICIPANT)
+        team = await add_team(sessions, captain)
+        user = await add_user(sessions, UserRole.PARTICIPANT)
+        statements.clear()
+
+        response = await client.post(
+            "/api/v1/teams/join", json={"team_id": str(team.team_id)}, headers=auth(user)
+        )
+
+        assert response.status_code == 200
+        assert response.json()["team_name"] == team.name
+        # Auth lookup, UPDATE app_users ... FROM teams RETURNING
+        assert len(statements) == 2, statements
+
+    run(scenario)
+
+
+def test_delete_team():
+    async def scenario(client, sessions, statements):
+        organizer = await add_user(sessions, UserRole.ORGANIZER)
+        captain = await add_user(sessions, UserRole.PARTICIPANT)
+        members = [await add_user(sessions, UserRole.PARTICIPANT) for _ in range(5)]
+        team = await add_team(sessions, captain, *members)
+        statements.clear()
+
+        response = await client.delete(f"/api/v1/teams/{team.team_id}", headers=auth(organizer))
+
+        assert response.status_code == 200
+        # Auth lookup, soft delete of the team, one UPDATE for all members
+        assert len(statements) == 3, statements
+
+        async with sessions() as session:
+            for member in (captain, *members):
+                assert (await session.get(AppUser, member.user_id)).team_id is None
+
+    run(scenario)
+
+
+def test_delete_user():
+    async def scenario(client, sessions, statements):
+        organizer = await add_user(sessions, UserRole.ORGANIZER)
+        user = await add_user(sessions, UserRole.PARTICIPANT)
+        statements.clear()
+
+        response = await client.delete(f"/api/v1/users/{user.user_id}", headers=auth(organizer))
+
+        assert response.status_code == 200
+        # Auth lookup, UPDATE ... RETURNING
+        assert len(statements) == 2, statements
+
+    run(scenario)